@@ -0,0 +1,178 @@
+import platform
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+from pydantic import BaseModel, Field
+from contacteval.game.engine import GameEngine
+from contacteval.game.models import GameConfig, GameResult
+from contacteval.players.synthetic import LatencyModel, SyntheticPlayer
+from contacteval.ranking.leaderboard import LeaderboardManager
+from contacteval.storage.factory import open_storage
+from contacteval.tournament.runner import TournamentRunner
+from contacteval.words.bank import Dictionary
+
+BENCH_TARGETS = ["engine", "runner"]
+
+class BenchScenario(BaseModel):
+    """
+    One synthetic workload: player behavior plus how many games to run.
+    """
+    name: str
+    latency: LatencyModel = LatencyModel()
+    invalid_rate: float = 0.0
+    contact_rate: float = 0.3
+    block_rate: float = 0.2
+    games: int = 200
+    players: int = 4
+    concurrency: int = 1   # Games in flight (runner target only)
+    seed: int = 0
+
+DEFAULT_SCENARIOS = [
+    # Pure engine overhead: instant answers, no invalid words
+    BenchScenario(name="instant"),
+    # The retry and random-fallback path on every other submission
+    BenchScenario(name="invalid-words", invalid_rate=0.5),
+    BenchScenario(
+        name="lognormal",
+        latency=LatencyModel(kind="lognormal", seconds=0.002, sigma=0.6),
+        games=50,
+        concurrency=16
+    ),
+    BenchScenario(
+        name="heavy-tail",
+        latency=LatencyModel(kind="heavy-tail", seconds=0.001, alpha=1.3, cap=0.5),
+        games=50,
+        concurrency=16
+    ),
+]
+
+class BenchResult(BaseModel):
+    scenario: str
+    target: str
+    games: int
+    rounds: int
+    wall_seconds: float
+    games_per_second: float
+    rounds_per_second: float
+    p50_game_seconds: float
+    p99_game_seconds: float
+    cpu_ms_per_game: float
+    python: str = Field(default_factory=platform.python_version)
+    timestamp: datetime = Field(default_factory=datetime.now)
+
+def _percentile(values: List[float], q: float) -> float:
+    if len(values) < 2:
+        return values[0] if values else 0.0
+    return statistics.quantiles(values, n=100, method="inclusive")[q - 1]
+
+def _summarize(scenario: BenchScenario, target: str, results: List[GameResult], wall: float, cpu: float) -> BenchResult:
+    durations = [r.duration_seconds for r in results]
+    rounds = sum(len(r.rounds) for r in results)
+    return BenchResult(
+        scenario=scenario.name,
+        target=target,
+        games=len(results),
+        rounds=rounds,
+        wall_seconds=wall,
+        games_per_second=len(results) / wall if wall else 0.0,
+        rounds_per_second=rounds / wall if wall else 0.0,
+        p50_game_seconds=_percentile(durations, 50),
+        p99_game_seconds=_percentile(durations, 99),
+        cpu_ms_per_game=1000 * cpu / len(results) if results else 0.0
+    )
+
+def _setup(scenario: BenchScenario, dictionary: Dictionary):
+    rng = random.Random(scenario.seed)
+    players = {
+        f"P{i}": SyntheticPlayer(
+            f"P{i}", dictionary,
+            latency=scenario.latency,
+            invalid_rate=scenario.invalid_rate,
+            contact_rate=scenario.contact_rate,
+            block_rate=scenario.block_rate,
+            seed=scenario.seed * 1000 + i
+        )
+        for i in range(scenario.players)
+    }
+    # Deterministic rotation: game i is held by player i mod N, the next three attack
+    ids = list(players)
+    configs = []
+    for i in range(scenario.games):
+        holder = i % len(ids)
+        configs.append(GameConfig(
+            word=dictionary.words[rng.randrange(len(dictionary.words))],
+            holder_id=ids[holder],
+            attacker_ids=[ids[(holder + k) % len(ids)] for k in range(1, 4)],
+            dictionary_id=dictionary.dictionary_id or "bench"
+        ))
+    return players, configs
+
+async def bench_engine(scenario: BenchScenario, dictionary: Dictionary) -> BenchResult:
+    """
+    Runs the scenario's games one after another straight through GameEngine.
+    """
+    players, configs = _setup(scenario, dictionary)
+    engine = GameEngine(dictionary)
+    results = []
+    wall, cpu = time.perf_counter(), time.process_time()
+    for config in configs:
+        results.append(await engine.run_game(
+            config, players[config.holder_id], [players[a] for a in config.attacker_ids]
+        ))
+    return _summarize(scenario, "engine", results, time.perf_counter() - wall, time.process_time() - cpu)
+
+async def bench_runner(scenario: BenchScenario, dictionary: Dictionary) -> BenchResult:
+    """
+    Runs the scenario through TournamentRunner (storage and rating updates included)
+    with a throwaway results directory.
+    """
+    players, configs = _setup(scenario, dictionary)
+    with tempfile.TemporaryDirectory() as tmp:
+        storage = open_storage("log", tmp)
+        runner = TournamentRunner(
+            players, dictionary, storage, LeaderboardManager(), concurrency=scenario.concurrency
+        )
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            results = await runner.run_tournament(configs)
+        finally:
+            storage.close()
+        wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+    return _summarize(scenario, "runner", results, wall, cpu)
+
+def append_results(path: str, results: List[BenchResult]):
+    """
+    Appends results to a JSONL file, so runs over time can be compared.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a") as f:
+        for result in results:
+            f.write(result.model_dump_json() + "\n")
+
+def load_previous(path: str) -> Dict[tuple, BenchResult]:
+    """
+    Returns the latest stored result per (scenario, target).
+    """
+    latest = {}
+    path = Path(path)
+    if not path.exists():
+        return latest
+    with open(path, "r") as f:
+        for line in f:
+            try:
+                result = BenchResult.model_validate_json(line)
+            except ValueError:
+                continue
+            latest[(result.scenario, result.target)] = result
+    return latest
+
+def select_scenarios(names: Optional[List[str]] = None, games: Optional[int] = None) -> List[BenchScenario]:
+    scenarios = [s for s in DEFAULT_SCENARIOS if not names or s.name in names]
+    if games is not None:
+        scenarios = [s.model_copy(update={"games": games}) for s in scenarios]
+    return scenarios
@@ -1,85 +1,785 @@
 import asyncio
 import json
 import logging
+import multiprocessing
+import os
+import time
+from datetime import datetime
 from typing import List, Optional
 import typer
+from pydantic import BaseModel
 from rich.console import Console
 from rich.table import Table
+from contacteval.bench.suite import (
+    BENCH_TARGETS,
+    DEFAULT_SCENARIOS,
+    append_results,
+    bench_engine,
+    bench_runner,
+    load_previous,
+    select_scenarios
+)
+from contacteval.game.engine import GameEngine
+from contacteval.game.models import TokenUsage
+from contacteval.players.cache import CACHE_MODES, ResponseCache
 from contacteval.players.factory import create_player
+from contacteval.players.ratelimit import RetryPolicy
+from contacteval.players.transport import SessionPool
 from contacteval.ranking.leaderboard import LeaderboardManager
-from contacteval.storage.json_store import JsonStorage
+from contacteval.ranking.replay import EncodedHistory, encode_games, rebuild_leaderboard
+from contacteval.storage.factory import STORAGE_BACKENDS, open_storage
+from contacteval.storage.filters import GameFilter
+from contacteval.telemetry.tracing import disable_tracing, enable_tracing
+from contacteval.telemetry.usage import PriceTable, merge_usage, usage_by_round_number
+from contacteval.tournament.replay import replay_games
+from contacteval.tournament.adaptive import AdaptiveScheduler
+from contacteval.tournament.checkpoint import ScheduleCheckpoint
 from contacteval.tournament.runner import TournamentRunner
-from contacteval.tournament.scheduler import TournamentScheduler
+from contacteval.tournament.scheduler import SCHEDULERS, TournamentScheduler
+from contacteval.tournament.stopping import ConvergenceMonitor, StoppingRule
+from contacteval.tournament.shard import ShardPlan, ShardQueue, default_worker_id, merge_results, run_worker
 from contacteval.words.bank import Dictionary
+from contacteval.words.compiled import compile_dictionary
+from contacteval.words.sampler import WORD_SAMPLERS, WordSampler
 
 app = typer.Typer(help="ContactEval: A multiplayer word game benchmark for LLMs.")
+dict_app = typer.Typer(help="Word dictionary tools.")
+app.add_typer(dict_app, name="dict")
+shard_app = typer.Typer(help="Run one tournament across many processes or hosts sharing a filesystem.")
+app.add_typer(shard_app, name="shard")
 console = Console()
 
+class RunSettings(BaseModel):
+    """
+    Options of the `run` command.
+    """
+    models_file: str
+    dictionary_file: str
+    dictionary_id: str = "en_v1"
+    num_games: int
+    results_dir: str
+    storage: str = "log"
+    concurrency: int = 1
+    per_model_concurrency: Optional[int] = None
+    max_connections: int = 100
+    max_connections_per_host: int = 0
+    keepalive: float = 30.0
+    max_retries: int = 5
+    cache_dir: str = ".cache/responses"
+    cache_mode: str = "off"
+    cache_max_mb: int = 512
+    call_timeout: Optional[float] = None
+    game_timeout: Optional[float] = None
+    hedge: bool = False
+    trace_file: Optional[str] = None
+    prices: Optional[str] = None
+    conversation: bool = False
+    resume: bool = False
+    schedule: str = "uniform"
+    batch_size: int = 20
+    word_sampling: str = "random"
+    stop_sigma: Optional[float] = None
+    stop_top_k: Optional[int] = None
+    stop_stable_batches: int = 3
+    stop_confidence: Optional[float] = None
+
 @app.command()
 def run(
     models_file: str = typer.Option("models.json", help="Path to models configuration"),
-    dictionary_file: str = typer.Option("data/words_en.json", help="Path to word dictionary"),
+    dictionary_file: str = typer.Option("data/words_en.json", help="Path to word dictionary (JSON list or compiled)"),
+    dictionary_id: str = typer.Option("en_v1", help="Word bank id for JSON word lists (compiled dictionaries carry their own)"),
     num_games: int = typer.Option(10, help="Number of games to run per model as attacker"),
-    results_dir: str = typer.Option("results", help="Directory for results")
+    results_dir: str = typer.Option("results", help="Directory for results"),
+    storage: str = typer.Option("log", help=f"Game storage backend ({', '.join(STORAGE_BACKENDS)})"),
+    concurrency: int = typer.Option(1, help="Maximum number of games running at once"),
+    per_model_concurrency: Optional[int] = typer.Option(None, help="Maximum concurrent games per model"),
+    max_connections: int = typer.Option(100, help="Maximum open HTTP connections per provider (0 = unlimited)"),
+    max_connections_per_host: int = typer.Option(0, help="Maximum open HTTP connections per host (0 = unlimited)"),
+    keepalive: float = typer.Option(30.0, help="Seconds to keep idle HTTP connections open"),
+    max_retries: int = typer.Option(5, help="Transport-level retries for throttled (429) or failed (5xx) API calls"),
+    cache_dir: str = typer.Option(".cache/responses", help="Directory of the API response cache"),
+    cache_mode: str = typer.Option(
+        "off",
+        help=f"Response cache mode ({', '.join(CACHE_MODES)}). read-write runs are unrated and "
+             "store their games under <results-dir>/cached"
+    ),
+    cache_max_mb: int = typer.Option(512, help="Size bound of the response cache in MB (least recently used evicted)"),
+    call_timeout: Optional[float] = typer.Option(None, help="Deadline in seconds per API request; late requests are retried"),
+    game_timeout: Optional[float] = typer.Option(None, help="Time budget in seconds per game; games over it are dropped"),
+    hedge: bool = typer.Option(False, help="Send a duplicate request when one outlives the model's p95 latency"),
+    trace_file: Optional[str] = typer.Option(
+        None, help="Write spans to this file: Chrome trace format for *.json, JSON lines otherwise"
+    ),
+    prices: Optional[str] = typer.Option(None, help="JSON price table (USD per million tokens) for cost reporting"),
+    conversation: bool = typer.Option(
+        False, help="Keep a per-game transcript per player and send only new rounds (enables prompt caching)"
+    ),
+    resume: bool = typer.Option(
+        False, help="Continue the interrupted run in --results-dir: play only the games of its schedule not yet stored"
+    ),
+    schedule: str = typer.Option(
+        "uniform",
+        help=f"Matchmaking ({', '.join(SCHEDULERS)}). adaptive plans each batch from the current "
+             "ratings, favouring games that cut uncertainty most"
+    ),
+    batch_size: int = typer.Option(20, help="Games per batch with --schedule adaptive or a stopping rule"),
+    word_sampling: str = typer.Option(
+        "random",
+        help=f"Secret word selection ({', '.join(WORD_SAMPLERS)}). stratified balances difficulty bands "
+             "and replays under-observed words until their difficulty is calibrated"
+    ),
+    stop_sigma: Optional[float] = typer.Option(None, help="Stop once every model's sigma is at or below this"),
+    stop_top_k: Optional[int] = typer.Option(None, help="Stop once the top k of both leaderboards stop changing"),
+    stop_stable_batches: int = typer.Option(3, help="Batches the top k must stay unchanged for --stop-top-k"),
+    stop_confidence: Optional[float] = typer.Option(
+        None, help="Stop once every pair of neighbouring models is ordered with at least this probability"
+    )
 ):
     """
     Runs a tournament among the specified models.
     """
-    asyncio.run(_async_run(models_file, dictionary_file, num_games, results_dir))
+    settings = RunSettings(
+        models_file=models_file,
+        dictionary_file=dictionary_file,
+        dictionary_id=dictionary_id,
+        num_games=num_games,
+        results_dir=results_dir,
+        storage=storage,
+        concurrency=concurrency,
+        per_model_concurrency=per_model_concurrency,
+        max_connections=max_connections,
+        max_connections_per_host=max_connections_per_host,
+        keepalive=keepalive,
+        max_retries=max_retries,
+        cache_dir=cache_dir,
+        cache_mode=cache_mode,
+        cache_max_mb=cache_max_mb,
+        call_timeout=call_timeout,
+        game_timeout=game_timeout,
+        hedge=hedge,
+        trace_file=trace_file,
+        prices=prices,
+        conversation=conversation,
+        resume=resume,
+        schedule=schedule,
+        batch_size=batch_size,
+        word_sampling=word_sampling,
+        stop_sigma=stop_sigma,
+        stop_top_k=stop_top_k,
+        stop_stable_batches=stop_stable_batches,
+        stop_confidence=stop_confidence
+    )
+    asyncio.run(_async_run(settings))
+
+async def _async_run(settings: RunSettings):
+    # The pooled HTTP sessions live for the whole tournament
+    session_pool = SessionPool(
+        limit=settings.max_connections,
+        limit_per_host=settings.max_connections_per_host,
+        keepalive_timeout=settings.keepalive
+    )
+    response_cache = ResponseCache(
+        settings.cache_dir, mode=settings.cache_mode, max_bytes=settings.cache_max_mb * 1024 * 1024
+    )
+    if settings.trace_file:
+        enable_tracing(settings.trace_file)
+    try:
+        async with session_pool:
+            await _run_tournament(settings, session_pool, response_cache)
+    finally:
+        response_cache.close()
+        disable_tracing()
 
-async def _async_run(models_file, dictionary_file, num_games, results_dir):
+async def _run_tournament(settings: RunSettings, session_pool: SessionPool, response_cache: ResponseCache):
     # 1. Load configuration
     try:
-        with open(models_file, "r") as f:
+        with open(settings.models_file, "r") as f:
             model_configs = json.load(f)
     except FileNotFoundError:
-        console.print(f"[red]Error: {models_file} not found. Create a models.json file.[/red]")
+        console.print(f"[red]Error: {settings.models_file} not found. Create a models.json file.[/red]")
         return
 
     # 2. Setup storage and leaderboard
-    storage = JsonStorage(results_dir)
+    # Cached answers must never feed live ratings: read-write runs are unrated and kept apart
+    rated = not response_cache.readable
+    results_dir = settings.results_dir if rated else os.path.join(settings.results_dir, "cached")
+    if not rated:
+        console.print(f"[yellow]Response cache is readable: games are unrated and stored in {results_dir}[/yellow]")
+    storage = open_storage(settings.storage, results_dir)
     leaderboard = LeaderboardManager()
     leaderboard.ratings = storage.load_ratings()  # Resume from previous if exists
+    leaderboard.calibrator = storage.load_calibration()
 
     # 3. Initialize players
-    players = {}
-    for m in model_configs:
-        try:
-            players[m["name"]] = create_player(m["name"], m["provider"], m["model_id"])
-        except Exception as e:
-            console.print(f"[yellow]Warning: Could not initialize player {m['name']}: {e}[/yellow]")
-
+    players = _create_players(
+        model_configs, session_pool,
+        response_cache=response_cache,
+        max_retries=settings.max_retries,
+        call_timeout=settings.call_timeout,
+        hedge=settings.hedge,
+        conversation=settings.conversation
+    )
     if len(players) < 4:
         console.print("[red]Error: Need at least 4 models to run a tournament.[/red]")
         return
 
-    # 4. Load Dictionary
-    dictionary = Dictionary.from_file(dictionary_file)
-    with open(dictionary_file, "r") as f:
-        all_words = json.load(f)
+    # 4. Load Dictionary (JSON word list or compiled artifact)
+    dictionary = Dictionary.load(settings.dictionary_file, settings.dictionary_id)
 
-    # 5. Schedule games
-    scheduler = TournamentScheduler(list(players.keys()), "en_v1")
-    # For a real tournament, avoid using the same words too often
-    configs = scheduler.generate_games(all_words, games_per_model_as_attacker=num_games)
+    # 5. Schedule games, or pick up the persisted schedule of an interrupted run
+    player_ids = list(players.keys())
+    word_sampler = WordSampler(dictionary, leaderboard.calibrator, strategy=settings.word_sampling)
+    checkpoint = ScheduleCheckpoint(results_dir)
+    adaptive = settings.schedule == "adaptive"
+    stopping = StoppingRule(
+        max_sigma=settings.stop_sigma,
+        top_k=settings.stop_top_k,
+        stable_batches=settings.stop_stable_batches,
+        rank_confidence=settings.stop_confidence
+    )
+    if stopping.enabled and not rated:
+        console.print("[red]Error: stopping rules read live ratings and need a rated run (no readable cache).[/red]")
+        return
+    monitor = ConvergenceMonitor(stopping, player_ids) if stopping.enabled else None
+    if adaptive:
+        # Batches depend on live ratings, so there is no schedule to persist up front
+        if settings.resume or not rated:
+            console.print("[red]Error: --schedule adaptive needs a fresh, rated run (no --resume or readable cache).[/red]")
+            return
+        total_games = TournamentScheduler(player_ids, dictionary.dictionary_id).total_games(settings.num_games)
+    elif settings.resume:
+        if not checkpoint.exists():
+            console.print(f"[red]Error: no schedule to resume in {results_dir}.[/red]")
+            return
+        configs = checkpoint.remaining(storage)
+        missing = {pid for c in configs for pid in [c.holder_id, *c.attacker_ids]} - players.keys()
+        if missing:
+            console.print(f"[red]Error: the schedule needs players that could not be initialized: {', '.join(sorted(missing))}[/red]")
+            return
+        console.print(f"Resuming: {len(configs)} of {len(checkpoint.load())} scheduled games left")
+        total_games = len(configs)
+    else:
+        configs = checkpoint.start(_schedule_games(player_ids, dictionary.dictionary_id, word_sampler, settings.num_games))
+        total_games = len(configs)
 
     # 6. Run tournament
-    runner = TournamentRunner(players, dictionary, storage, leaderboard)
-    await runner.run_tournament(configs)
+    runner = TournamentRunner(
+        players, dictionary, storage, leaderboard,
+        concurrency=settings.concurrency,
+        per_model_concurrency=settings.per_model_concurrency,
+        rated=rated,
+        game_timeout=settings.game_timeout
+    )
+    try:
+        if adaptive:
+            scheduler = AdaptiveScheduler(player_ids, dictionary.dictionary_id)
+            results = await runner.run_adaptive(
+                scheduler, word_sampler, total_games, batch_size=settings.batch_size, monitor=monitor
+            )
+        elif monitor:
+            results = await runner.run_batched(
+                configs, batch_size=settings.batch_size, monitor=monitor, on_record=checkpoint.mark_completed
+            )
+        else:
+            results = await runner.run_tournament(configs, on_record=checkpoint.mark_completed)
+    finally:
+        checkpoint.close()
+        storage.close()
 
     console.print("[green]Tournament completed![/green]")
-    _print_leaderboards(leaderboard)
+    unfinished = total_games - len(results)
+    if runner.stop_reason:
+        console.print(f"[green]Stopped early after {len(results)} of {total_games} games: {runner.stop_reason}.[/green]")
+    elif unfinished and not adaptive:
+        console.print(f"[yellow]{unfinished} games failed; run again with --resume to retry them.[/yellow]")
+    if response_cache.mode != "off":
+        stats = response_cache.stats()
+        console.print(
+            f"Response cache ({stats['mode']}): {stats['hits']} hits, {stats['misses']} misses "
+            f"({stats['hit_rate']:.0%}), {stats['writes']} writes, {stats['evictions']} evictions"
+        )
+    price_table = PriceTable.from_file(settings.prices) if settings.prices else PriceTable()
+    model_ids = {name: getattr(player, "model", None) for name, player in players.items()}
+    _print_usage(results, price_table, model_ids)
+    if rated:
+        _print_leaderboards(leaderboard)
 
 @app.command()
-def leaderboard(results_dir: str = typer.Option("results", help="Directory for results")):
+def leaderboard(
+    results_dir: str = typer.Option("results", help="Directory for results"),
+    storage: str = typer.Option("log", help=f"Storage backend ({', '.join(STORAGE_BACKENDS)})")
+):
     """
     Displays the current leaderboards.
     """
-    storage = JsonStorage(results_dir)
+    storage = open_storage(storage, results_dir)
     manager = LeaderboardManager()
     manager.ratings = storage.load_ratings()
     _print_leaderboards(manager)
 
+@app.command()
+def migrate(
+    results_dir: str = typer.Option("results", help="Directory for results"),
+    source: str = typer.Option("json", "--from", help=f"Backend to read games from ({', '.join(STORAGE_BACKENDS)})"),
+    target: str = typer.Option("log", "--to", help=f"Backend to copy games into ({', '.join(STORAGE_BACKENDS)})")
+):
+    """
+    Copies all stored games from one storage backend to another.
+    """
+    src = open_storage(source, results_dir)
+    dst = open_storage(target, results_dir)
+    games = sorted(src.load_all_games(), key=lambda g: g.timestamp)
+    try:
+        for game in games:
+            dst.save_game(game)
+    finally:
+        dst.close()
+    console.print(f"[green]Copied {len(games)} games from {source} to {target}.[/green]")
+
+@app.command()
+def rerate(
+    results_dir: str = typer.Option("results", help="Directory for results"),
+    storage: str = typer.Option("log", help=f"Storage backend ({', '.join(STORAGE_BACKENDS)})"),
+    noise_variance: List[float] = typer.Option([4.0], help="Observation noise; repeat to compare several values"),
+    save: bool = typer.Option(False, help="Overwrite stored ratings with the result (single noise value only)")
+):
+    """
+    Rebuilds the leaderboard from the full game history.
+    """
+    if save and len(noise_variance) > 1:
+        console.print("[red]Error: --save needs a single --noise-variance.[/red]")
+        raise typer.Exit(1)
+
+    store = open_storage(storage, results_dir)
+    start = time.perf_counter()
+    # Rating replay needs only configs and scores
+    history = encode_games(store.iter_games(include_rounds=False))
+    console.print(f"Loaded {len(history)} games in {time.perf_counter() - start:.2f}s")
+
+    for variance in noise_variance:
+        start = time.perf_counter()
+        manager = rebuild_leaderboard(history, noise_variance=variance)
+        console.print(f"[bold]noise_variance={variance}[/bold]: replayed in {time.perf_counter() - start:.3f}s")
+        _print_leaderboards(manager)
+
+    if save:
+        store.save_ratings(manager.ratings, manager.calibrator)
+        console.print("[green]Ratings saved.[/green]")
+    store.close()
+
+@app.command()
+def replay(
+    results_dir: str = typer.Option("results", help="Directory for results"),
+    storage: str = typer.Option("log", help=f"Storage backend ({', '.join(STORAGE_BACKENDS)})"),
+    dictionary_file: str = typer.Option("data/words_en.json", help="Path to word dictionary (JSON list or compiled)"),
+    dictionary_id: str = typer.Option("en_v1", help="Word bank id for JSON word lists"),
+    model: Optional[str] = typer.Option(None, help="Only games this model played"),
+    word: Optional[str] = typer.Option(None, help="Only games on this word"),
+    rerate: bool = typer.Option(False, help="Rebuild the leaderboard from the replayed games"),
+    noise_variance: float = typer.Option(4.0, help="Observation noise for --rerate")
+):
+    """
+    Re-runs stored games through the current engine and rules, without API calls.
+    Reports games whose outcome changed, and throughput.
+    """
+    store = open_storage(storage, results_dir)
+    dictionary = Dictionary.load(dictionary_file, dictionary_id)
+    game_filter = GameFilter(model_id=model, word=word)
+    history = EncodedHistory()
+
+    report = asyncio.run(replay_games(
+        GameEngine(dictionary),
+        store.iter_games(game_filter),
+        on_result=history.add if rerate else None
+    ))
+    store.close()
+
+    console.print(
+        f"Replayed {report.games} games ({report.rounds} rounds) in {report.seconds:.2f}s: "
+        f"{report.games_per_second:.0f} games/s, {report.rounds_per_second:.0f} rounds/s"
+    )
+    if report.failed:
+        console.print(f"[red]{len(report.failed)} games could not be replayed[/red]")
+    if report.diverged:
+        console.print(f"[yellow]{len(report.diverged)} games diverged from the stored outcome[/yellow]")
+    else:
+        console.print("[green]All replayed games match their stored outcome.[/green]")
+
+    if rerate:
+        _print_leaderboards(rebuild_leaderboard(history, noise_variance=noise_variance))
+
+@app.command()
+def games(
+    results_dir: str = typer.Option("results", help="Directory for results"),
+    storage: str = typer.Option("log", help=f"Storage backend ({', '.join(STORAGE_BACKENDS)})"),
+    model: Optional[str] = typer.Option(None, help="Only games this model played"),
+    role: Optional[str] = typer.Option(None, help="Role of --model (attacker or holder)"),
+    word: Optional[str] = typer.Option(None, help="Only games on this word"),
+    word_length: Optional[int] = typer.Option(None, help="Only words of this length"),
+    dictionary_id: Optional[str] = typer.Option(None, help="Only games using this word bank"),
+    since: Optional[datetime] = typer.Option(None, help="Only games played at or after this time"),
+    until: Optional[datetime] = typer.Option(None, help="Only games played before this time"),
+    limit: int = typer.Option(20, help="Maximum rows to display")
+):
+    """
+    Lists stored games matching the filters.
+    """
+    try:
+        game_filter = GameFilter(
+            model_id=model,
+            role=role,
+            word=word,
+            word_length=word_length,
+            dictionary_id=dictionary_id,
+            since=since,
+            until=until
+        )
+    except ValueError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+
+    store = open_storage(storage, results_dir)
+    matching = 0
+    rows = []
+    for result in store.iter_games(game_filter, include_rounds=False):
+        matching += 1
+        if len(rows) < limit:
+            rows.append(result)
+    store.close()
+
+    table = Table(title=f"{matching} matching games")
+    table.add_column("Word", style="cyan")
+    table.add_column("Holder")
+    table.add_column("Attackers")
+    table.add_column("Winner")
+    table.add_column("Holder Score", justify="right")
+    table.add_column("Timestamp")
+    for result in rows:
+        table.add_row(
+            result.config.word,
+            result.config.holder_id,
+            ", ".join(result.config.attacker_ids),
+            result.winner or "-",
+            f"{result.holder_score:.2f}",
+            result.timestamp.isoformat(timespec="seconds")
+        )
+    console.print(table)
+
+@app.command()
+def bench(
+    dictionary_file: str = typer.Option("data/words_en.json", help="Path to word dictionary (JSON list or compiled)"),
+    scenario: List[str] = typer.Option([], help=f"Scenario to run; repeatable (default: all of {', '.join(s.name for s in DEFAULT_SCENARIOS)})"),
+    target: List[str] = typer.Option(BENCH_TARGETS, help=f"What to measure; repeatable ({', '.join(BENCH_TARGETS)})"),
+    games: Optional[int] = typer.Option(None, help="Override the number of games per scenario"),
+    output: str = typer.Option("results/bench.jsonl", help="JSONL file results are appended to")
+):
+    """
+    Measures engine and runner throughput with synthetic, latency-simulating players.
+    """
+    dictionary = Dictionary.load(dictionary_file, "bench")
+    previous = load_previous(output)
+    runners = {"engine": bench_engine, "runner": bench_runner}
+
+    results = []
+    for s in select_scenarios(scenario, games):
+        for t in target:
+            results.append(asyncio.run(runners[t](s, dictionary)))
+
+    table = Table(title="Benchmark")
+    table.add_column("Scenario", style="cyan")
+    table.add_column("Target")
+    table.add_column("Games/s", justify="right")
+    table.add_column("Rounds/s", justify="right")
+    table.add_column("p50 game", justify="right")
+    table.add_column("p99 game", justify="right")
+    table.add_column("CPU/game", justify="right")
+    table.add_column("vs. last", justify="right")
+    for r in results:
+        last = previous.get((r.scenario, r.target))
+        change = f"{r.games_per_second / last.games_per_second - 1:+.0%}" if last and last.games_per_second else "-"
+        table.add_row(
+            r.scenario,
+            r.target,
+            f"{r.games_per_second:.1f}",
+            f"{r.rounds_per_second:.0f}",
+            f"{r.p50_game_seconds * 1000:.1f}ms",
+            f"{r.p99_game_seconds * 1000:.1f}ms",
+            f"{r.cpu_ms_per_game:.2f}ms",
+            change
+        )
+    console.print(table)
+    append_results(output, results)
+
+@app.command()
+def usage(
+    results_dir: str = typer.Option("results", help="Directory for results"),
+    storage: str = typer.Option("log", help=f"Storage backend ({', '.join(STORAGE_BACKENDS)})"),
+    prices: Optional[str] = typer.Option(None, help="JSON price table (USD per million tokens)"),
+    model: Optional[str] = typer.Option(None, help="Only games this model played"),
+    since: Optional[datetime] = typer.Option(None, help="Only games played at or after this time"),
+    until: Optional[datetime] = typer.Option(None, help="Only games played before this time")
+):
+    """
+    Reports API token usage and cost of stored games, per model and per round number.
+    """
+    store = open_storage(storage, results_dir)
+    games = store.iter_games(GameFilter(model_id=model, since=since, until=until))
+    price_table = PriceTable.from_file(prices) if prices else PriceTable()
+    _print_usage(games, price_table)
+    store.close()
+
+@dict_app.command("compile")
+def dict_compile(
+    source: str = typer.Argument(..., help="JSON word list"),
+    dictionary_id: str = typer.Option("en_v1", help="Word bank id stored in the artifact"),
+    output: Optional[str] = typer.Option(None, help="Output path (default: data/<dictionary_id>.ctdict)")
+):
+    """
+    Compiles a JSON word list into a memory-mappable dictionary for fast startup.
+    """
+    with open(source, "r") as f:
+        words = json.load(f)
+    path = compile_dictionary(words, dictionary_id, output or f"data/{dictionary_id}.ctdict")
+    console.print(f"[green]Compiled {len(words)} words into {path}[/green]")
+
+class ShardWorkSettings(BaseModel):
+    """
+    Options of the `shard work` command, passed to each worker process.
+    """
+    queue_dir: str
+    worker_id: str
+    concurrency: int = 1
+    per_model_concurrency: Optional[int] = None
+    max_connections: int = 100
+    max_retries: int = 5
+    call_timeout: Optional[float] = None
+    game_timeout: Optional[float] = None
+    requeue_after: Optional[float] = None
+
+@shard_app.command("plan")
+def shard_plan(
+    queue_dir: str = typer.Option("shards", help="Shared directory of the work queue"),
+    models_file: str = typer.Option("models.json", help="Path to models configuration"),
+    dictionary_file: str = typer.Option("data/words_en.json", help="Path to word dictionary (JSON list or compiled)"),
+    dictionary_id: str = typer.Option("en_v1", help="Word bank id for JSON word lists (compiled dictionaries carry their own)"),
+    num_games: int = typer.Option(10, help="Number of games to run per model as attacker"),
+    unit_size: int = typer.Option(20, help="Games per work unit"),
+    word_sampling: str = typer.Option("random", help=f"Secret word selection ({', '.join(WORD_SAMPLERS)})"),
+    results_dir: str = typer.Option("results", help="Results whose word calibration drives stratified sampling"),
+    storage: str = typer.Option("log", help=f"Storage backend of the results ({', '.join(STORAGE_BACKENDS)})")
+):
+    """
+    Schedules a tournament and splits it into work units for `shard work`.
+    """
+    try:
+        with open(models_file, "r") as f:
+            model_configs = json.load(f)
+    except FileNotFoundError:
+        console.print(f"[red]Error: {models_file} not found. Create a models.json file.[/red]")
+        raise typer.Exit(1)
+    # Only plan games for players that can be built here (e.g. their API key is set), as `run` does
+    player_ids = list(_create_players(model_configs, SessionPool()))
+    if len(player_ids) < 4:
+        console.print("[red]Error: Need at least 4 models to run a tournament.[/red]")
+        raise typer.Exit(1)
+
+    dictionary = Dictionary.load(dictionary_file, dictionary_id)
+    store = open_storage(storage, results_dir)
+    try:
+        calibrator = store.load_calibration()
+    finally:
+        store.close()
+    word_sampler = WordSampler(dictionary, calibrator, strategy=word_sampling)
+    configs = _schedule_games(player_ids, dictionary.dictionary_id, word_sampler, num_games)
+    plan = ShardPlan(
+        dictionary_file=os.path.abspath(dictionary_file),
+        dictionary_id=dictionary.dictionary_id,
+        models_file=os.path.abspath(models_file),
+        total_games=len(configs),
+        unit_size=max(1, unit_size)
+    )
+    try:
+        ShardQueue(queue_dir).create(configs, plan)
+    except FileExistsError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+    units = -(-len(configs) // plan.unit_size)
+    console.print(f"[green]Planned {len(configs)} games in {units} units under {queue_dir}.[/green]")
+
+@shard_app.command("work")
+def shard_work(
+    queue_dir: str = typer.Option("shards", help="Shared directory of the work queue"),
+    worker_id: Optional[str] = typer.Option(None, help="Worker name (default: host-pid)"),
+    processes: int = typer.Option(1, help="Worker processes to start on this host"),
+    concurrency: int = typer.Option(1, help="Maximum number of games running at once per process"),
+    per_model_concurrency: Optional[int] = typer.Option(None, help="Maximum concurrent games per model per process"),
+    max_connections: int = typer.Option(100, help="Maximum open HTTP connections per provider (0 = unlimited)"),
+    max_retries: int = typer.Option(5, help="Transport-level retries for throttled (429) or failed (5xx) API calls"),
+    call_timeout: Optional[float] = typer.Option(None, help="Deadline in seconds per API request; late requests are retried"),
+    game_timeout: Optional[float] = typer.Option(None, help="Time budget in seconds per game; games over it are dropped"),
+    requeue_after: Optional[float] = typer.Option(
+        None, help="Put back units whose worker has not reported for this many seconds (crashed workers)"
+    ),
+    retry_failed: bool = typer.Option(False, help="Play the missing games of failed units again")
+):
+    """
+    Claims and plays work units until the queue is empty.
+    """
+    queue = ShardQueue(queue_dir)
+    if not queue.plan_path.exists():
+        console.print(f"[red]Error: no plan in {queue_dir}. Run `shard plan` first.[/red]")
+        raise typer.Exit(1)
+    if retry_failed:
+        console.print(f"Retrying {queue.retry_failed()} failed units")
+    base_id = worker_id or default_worker_id()
+    workers = [
+        ShardWorkSettings(
+            queue_dir=queue_dir,
+            worker_id=base_id if processes <= 1 else f"{base_id}-{i}",
+            concurrency=concurrency,
+            per_model_concurrency=per_model_concurrency,
+            max_connections=max_connections,
+            max_retries=max_retries,
+            call_timeout=call_timeout,
+            game_timeout=game_timeout,
+            requeue_after=requeue_after
+        )
+        for i in range(max(1, processes))
+    ]
+    if len(workers) == 1:
+        _shard_work_process(workers[0])
+    else:
+        # One event loop per core: JSON parsing and validation no longer share a single CPU
+        procs = [multiprocessing.Process(target=_shard_work_process, args=(w,)) for w in workers]
+        for proc in procs:
+            proc.start()
+        for proc in procs:
+            proc.join()
+    status = queue.status()
+    console.print(
+        f"[green]Queue: {status['done']} units done, {status['claimed']} claimed, {status['pending']} pending.[/green]"
+    )
+    if status["failed"]:
+        console.print(
+            f"[yellow]{status['failed']} units have games that could not be played; "
+            "rerun with --retry-failed.[/yellow]"
+        )
+
+def _shard_work_process(settings: ShardWorkSettings):
+    played = asyncio.run(_async_shard_work(settings))
+    console.print(f"Worker {settings.worker_id} played {played} games")
+
+async def _async_shard_work(settings: ShardWorkSettings) -> int:
+    queue = ShardQueue(settings.queue_dir)
+    plan = queue.load_plan()
+    with open(plan.models_file, "r") as f:
+        model_configs = json.load(f)
+    dictionary = Dictionary.load(plan.dictionary_file, plan.dictionary_id)
+    session_pool = SessionPool(limit=settings.max_connections)
+    async with session_pool:
+        players = _create_players(
+            model_configs, session_pool,
+            max_retries=settings.max_retries,
+            call_timeout=settings.call_timeout
+        )
+        return await run_worker(
+            queue, settings.worker_id, players, dictionary,
+            concurrency=settings.concurrency,
+            per_model_concurrency=settings.per_model_concurrency,
+            game_timeout=settings.game_timeout,
+            requeue_after=settings.requeue_after
+        )
+
+@shard_app.command("status")
+def shard_status(
+    queue_dir: str = typer.Option("shards", help="Shared directory of the work queue")
+):
+    """
+    Shows how many work units are pending, claimed, done and failed.
+    """
+    queue = ShardQueue(queue_dir)
+    if not queue.plan_path.exists():
+        console.print(f"[red]Error: no plan in {queue_dir}.[/red]")
+        raise typer.Exit(1)
+    plan = queue.load_plan()
+    status = queue.status()
+    console.print(
+        f"{plan.total_games} games in units of {plan.unit_size}: "
+        f"{status['done']} done, {status['claimed']} claimed, {status['pending']} pending, "
+        f"{status['failed']} failed"
+    )
+
+@shard_app.command("merge")
+def shard_merge(
+    queue_dir: str = typer.Option("shards", help="Shared directory of the work queue"),
+    results_dir: str = typer.Option("results", help="Directory for results"),
+    storage: str = typer.Option("log", help=f"Game storage backend ({', '.join(STORAGE_BACKENDS)})"),
+    incomplete: bool = typer.Option(False, help="Merge even though some units have not finished (their games are lost)")
+):
+    """
+    Stores and rates all sharded games in schedule order.
+    """
+    queue = ShardQueue(queue_dir)
+    status = queue.status()
+    if status["pending"] or status["claimed"] or status["failed"]:
+        message = (
+            f"{status['pending']} pending, {status['claimed']} claimed and {status['failed']} failed "
+            "units have not finished"
+        )
+        if not incomplete:
+            console.print(f"[red]Error: {message}. Pass --incomplete to merge anyway.[/red]")
+            raise typer.Exit(1)
+        console.print(f"[yellow]Warning: {message}; their games are missing from the merge.[/yellow]")
+    store = open_storage(storage, results_dir)
+    manager = LeaderboardManager()
+    manager.ratings = store.load_ratings()
+    manager.calibrator = store.load_calibration()
+    try:
+        merged = merge_results(queue, store, manager)
+    except FileExistsError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+    finally:
+        store.close()
+    console.print(f"[green]Merged {len(merged)} games into {results_dir}.[/green]")
+    _print_leaderboards(manager)
+
+def _create_players(
+    model_configs: List[dict],
+    session_pool: SessionPool,
+    response_cache: Optional[ResponseCache] = None,
+    max_retries: int = 5,
+    call_timeout: Optional[float] = None,
+    hedge: bool = False,
+    conversation: bool = False
+) -> dict:
+    # Optional per-model "requests_per_minute" / "tokens_per_minute" limits are
+    # enforced per provider + API key
+    players = {}
+    retry_policy = RetryPolicy(max_retries=max_retries)
+    for m in model_configs:
+        try:
+            players[m["name"]] = create_player(
+                m["name"], m["provider"], m["model_id"],
+                session_pool=session_pool,
+                requests_per_minute=m.get("requests_per_minute"),
+                tokens_per_minute=m.get("tokens_per_minute"),
+                retry_policy=retry_policy,
+                response_cache=response_cache,
+                call_timeout=call_timeout,
+                hedge=hedge,
+                conversation=conversation
+            )
+        except Exception as e:
+            console.print(f"[yellow]Warning: Could not initialize player {m['name']}: {e}[/yellow]")
+    return players
+
+def _schedule_games(player_ids: List[str], dictionary_id: str, word_sampler: WordSampler, num_games: int):
+    scheduler = TournamentScheduler(player_ids, dictionary_id)
+    # The dictionary is alphabetical: never take words in file order, so consecutive games differ
+    words = word_sampler.sample(scheduler.total_games(num_games))
+    return scheduler.generate_games(words, games_per_model_as_attacker=num_games)
+
 def _print_leaderboards(manager):
     for role in ["attacker", "holder"]:
         players = manager.get_top_players(role)
@@ -105,5 +805,69 @@ def _print_leaderboards(manager):
             )
         console.print(table)
 
+def _print_usage(results, prices: PriceTable, model_ids: Optional[dict] = None):
+    """
+    Prints token usage and cost per model, then per round number (prompt growth).
+    """
+    model_ids = model_ids or {}
+    by_model: dict = {}
+    by_round: dict = {}
+    games = 0
+    for result in results:
+        games += 1
+        by_model = merge_usage([by_model, result.usage])
+        for number, u in usage_by_round_number([result]).items():
+            by_round[number] = by_round.get(number, TokenUsage()) + u
+    if not by_model:
+        return
+
+    table = Table(title=f"API Usage ({games} games)")
+    table.add_column("Model", style="cyan")
+    table.add_column("Calls", justify="right")
+    table.add_column("Input", justify="right")
+    table.add_column("Cached", justify="right")
+    table.add_column("Output", justify="right")
+    table.add_column("Avg latency", justify="right")
+    table.add_column("Cost (USD)", justify="right")
+    total = TokenUsage()
+    total_cost = 0.0
+    for name, u in sorted(by_model.items()):
+        total += u
+        price = prices.lookup(name, model_ids.get(name))
+        cost = PriceTable.cost(price, u) if price else None
+        total_cost += cost or 0.0
+        table.add_row(
+            name,
+            str(u.calls),
+            f"{u.input_tokens:,}",
+            f"{u.cached_input_tokens:,}",
+            f"{u.output_tokens:,}",
+            f"{u.seconds / u.calls:.2f}s" if u.calls else "-",
+            f"{cost:.4f}" if cost is not None else "-"
+        )
+    table.add_row(
+        "[bold]Total[/bold]", str(total.calls), f"{total.input_tokens:,}", f"{total.cached_input_tokens:,}",
+        f"{total.output_tokens:,}", f"{total.seconds / total.calls:.2f}s" if total.calls else "-", f"{total_cost:.4f}"
+    )
+    console.print(table)
+
+    table = Table(title="Usage by Round")
+    table.add_column("Round", justify="right")
+    table.add_column("Calls", justify="right")
+    table.add_column("Input/call", justify="right")
+    table.add_column("Output/call", justify="right")
+    table.add_column("Latency/call", justify="right")
+    for number, u in by_round.items():
+        if not u.calls:
+            continue
+        table.add_row(
+            str(number),
+            str(u.calls),
+            f"{u.input_tokens / u.calls:.0f}",
+            f"{u.output_tokens / u.calls:.0f}",
+            f"{u.seconds / u.calls:.2f}s"
+        )
+    console.print(table)
+
 if __name__ == "__main__":
     app()
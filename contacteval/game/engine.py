@@ -1,7 +1,7 @@
 import asyncio
 import random
 import time
-from typing import List
+from typing import List, Optional
 from contacteval.game.models import (
     AttackerSubmission, 
     Contact, 
@@ -9,18 +9,45 @@ from contacteval.game.models import (
     GameResult, 
     Round
 )
-from contacteval.game.rules import detect_contacts, resolve_round, calculate_scores
+from contacteval.game.rules import assign_holder_guesses, detect_contacts, resolve_round, calculate_scores
 from contacteval.players.base import Player
+from contacteval.telemetry.tracing import span
+from contacteval.telemetry.usage import merge_usage, start_round_usage
+
+class GameTimeoutError(Exception):
+    """
+    Raised when a game exceeds the engine's per-game time budget.
+    """
 
 class GameEngine:
     """
     Orchestrates a single game of ContactEval.
     """
     
-    def __init__(self, dictionary):
+    def __init__(self, dictionary, game_timeout: Optional[float] = None):
         self.dictionary = dictionary
+        # Wall-clock budget per game in seconds (None = unbounded)
+        self.game_timeout = game_timeout
 
     async def run_game(self, config: GameConfig, holder: Player, attackers: List[Player]) -> GameResult:
+        with span("game", word=config.word, word_length=len(config.word), holder=config.holder_id) as game_span:
+            if self.game_timeout is None:
+                result = await self._play(config, holder, attackers)
+            else:
+                try:
+                    result = await asyncio.wait_for(self._play(config, holder, attackers), self.game_timeout)
+                except asyncio.TimeoutError:
+                    raise GameTimeoutError(
+                        f"Game for word {config.word} exceeded its {self.game_timeout:.0f}s budget"
+                    ) from None
+            game_span.set(rounds=len(result.rounds), winner=result.winner)
+            return result
+
+    async def _play(self, config: GameConfig, holder: Player, attackers: List[Player]) -> GameResult:
+        # Per-game player instances, so concurrent games sharing a model don't interfere
+        holder = holder.for_game(config)
+        attackers = [a.for_game(config) for a in attackers]
+
         # Initialize holder with the secret word
         holder.secret_word = config.word
 
@@ -32,34 +59,36 @@ class GameEngine:
         while True:
             round_num = len(rounds) + 1
             
-            # 1. Attacker submissions (with retries)
-            submissions = await self._get_attacker_submissions(
-                attackers, current_prefix, rounds, used_words
-            )
+            with span("round", round=round_num, prefix_length=len(current_prefix)) as round_span:
+                round_usage = start_round_usage()
+                # 1. Attacker submissions (with retries)
+                submissions = await self._get_attacker_submissions(
+                    attackers, current_prefix, rounds, used_words
+                )
+            
+                # Update used words
+                for sub in submissions:
+                    if sub.prefix_word:
+                        used_words.add(sub.prefix_word.upper())
             
-            # Update used words
-            for sub in submissions:
-                if sub.prefix_word:
-                    used_words.add(sub.prefix_word.upper())
+                # 2. Detect contacts
+                contacts = detect_contacts(submissions, config.word)
             
-            # 2. Detect contacts
-            contacts = detect_contacts(submissions, config.word)
+                # 3. Holder defense: 1 guess per contact, all requested at once
+                if contacts:
+                    with span("holder_call", model=holder.name, contacts=len(contacts)):
+                        guesses = await holder.submit_holder_guesses(
+                            current_prefix, rounds, len(contacts)
+                        )
+                    assign_holder_guesses(contacts, guesses)
             
-            # 3. Holder defense (for each contact)
-            for contact in contacts:
-                # Holder gets 1 guess per contact
-                guess = await holder.submit_holder_guess(
-                    current_prefix, rounds, len(contacts)
+                # 4. Resolve round
+                current_round = resolve_round(
+                    round_num, current_prefix, config.word, submissions, contacts
                 )
-                contact.holder_guess = guess
-                if guess and guess.upper() == contact.word.upper():
-                    contact.blocked = True
-            
-            # 4. Resolve round
-            current_round = resolve_round(
-                round_num, current_prefix, config.word, submissions, contacts
-            )
-            rounds.append(current_round)
+                current_round.usage = round_usage
+                rounds.append(current_round)
+                round_span.set(contacts=len(contacts), letter_revealed=current_round.letter_revealed)
             
             # Check for game end
             if current_round.full_word_guessed_by:
@@ -89,7 +118,8 @@ class GameEngine:
             winner=rounds[-1].full_word_guessed_by,
             holder_score=holder_score,
             attacker_scores=attacker_scores,
-            duration_seconds=time.time() - start_time
+            duration_seconds=time.time() - start_time,
+            usage=merge_usage(r.usage for r in rounds)
         )
 
     async def _get_attacker_submissions(
@@ -116,7 +146,8 @@ class GameEngine:
         
         error_msg = None
         for attempt in range(3):
-            submission = await attacker.submit_attacker_guess(prefix, history, error_msg=error_msg)
+            with span("attacker_call", model=attacker.name, prefix_length=len(prefix), attempt=attempt):
+                submission = await attacker.submit_attacker_guess(prefix, history, error_msg=error_msg)
             
             # Validation
             word = submission.prefix_word
@@ -7,6 +7,7 @@ class GameConfig(BaseModel):
     attacker_ids: list[str]      # Models acting as Attackers
     max_holder_guesses: int = 1  # Holder gets exactly one guess per contact
     dictionary_id: str           # Which word bank version
+    game_id: str | None = None   # Position in a sharded schedule (orders the merge)
 
 class AttackerSubmission(BaseModel):
     player_id: str
@@ -20,6 +21,22 @@ class Contact(BaseModel):
     holder_guess: str | None = None     # Holder's single guess
     blocked: bool = False               # Did holder guess correctly?
 
+class TokenUsage(BaseModel):
+    calls: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cached_input_tokens: int = 0   # Part of input_tokens served from the provider's prompt cache
+    seconds: float = 0.0           # Time spent in API calls
+
+    def __add__(self, other: "TokenUsage") -> "TokenUsage":
+        return TokenUsage(
+            calls=self.calls + other.calls,
+            input_tokens=self.input_tokens + other.input_tokens,
+            output_tokens=self.output_tokens + other.output_tokens,
+            cached_input_tokens=self.cached_input_tokens + other.cached_input_tokens,
+            seconds=self.seconds + other.seconds
+        )
+
 class Round(BaseModel):
     round_number: int
     prefix: str                  # Prefix at start of round
@@ -27,6 +44,7 @@ class Round(BaseModel):
     contacts: list[Contact]
     letter_revealed: bool        # Did prefix grow this round?
     full_word_guessed_by: str | None = None  # Winner, if any
+    usage: dict[str, TokenUsage] = {}        # player_id -> API usage this round
 
 class GameResult(BaseModel):
     config: GameConfig
@@ -36,6 +54,7 @@ class GameResult(BaseModel):
     attacker_scores: dict[str, float]   # player_id -> total points
     duration_seconds: float
     timestamp: datetime = Field(default_factory=datetime.now)
+    usage: dict[str, TokenUsage] = {}   # player_id -> API usage over the game
 
 class PlayerRating(BaseModel):
     player_id: str
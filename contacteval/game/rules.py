@@ -24,6 +24,23 @@ def detect_contacts(submissions: list[AttackerSubmission], secret_word: str) ->
             ))
     return contacts
 
+def assign_holder_guesses(contacts: list[Contact], guesses: list[str]):
+    """
+    Gives each contact one of the holder's guesses (one guess per contact). The holder
+    does not know which contact is which, so a guess naming any contact's word blocks
+    it; the guesses that named none go to the remaining contacts in order.
+    """
+    unused = list(guesses)
+    for contact in contacts:
+        match = next((g for g in unused if g and g.upper() == contact.word.upper()), None)
+        if match is not None:
+            unused.remove(match)
+            contact.holder_guess = match
+            contact.blocked = True
+    for contact in contacts:
+        if not contact.blocked:
+            contact.holder_guess = unused.pop(0) if unused else ""
+
 def resolve_round(
     round_num: int,
     prefix: str,
@@ -1,18 +1,36 @@
+import asyncio
 import json
 import logging
 import os
 import re
+import time
 import aiohttp
 from typing import Optional
-from contacteval.game.models import AttackerSubmission, Round
+from contacteval.game.models import AttackerSubmission, GameConfig, Round, TokenUsage
 from contacteval.players.base import Player
+from contacteval.players.cache import ResponseCache
+from contacteval.players.latency import LatencyTracker
+from contacteval.players.ratelimit import (
+    RETRYABLE_STATUSES,
+    RateLimiter,
+    RetryPolicy,
+    estimate_tokens,
+    parse_retry_after
+)
+from contacteval.players.transport import SessionPool
 from contacteval.prompts.templates import (
     ATTACKER_SYSTEM_PROMPT,
+    ATTACKER_TURN_TEMPLATE,
     ATTACKER_USER_TEMPLATE,
+    HOLDER_GUESSES_INSTRUCTIONS,
     HOLDER_SYSTEM_PROMPT,
+    HOLDER_TURN_TEMPLATE,
     HOLDER_USER_TEMPLATE,
+    RETRY_TURN_TEMPLATE,
     format_history
 )
+from contacteval.telemetry.tracing import span, tracing_enabled
+from contacteval.telemetry.usage import record_usage
 
 logger = logging.getLogger(__name__)
 
@@ -44,13 +62,67 @@ def extract_json(text: str) -> dict:
             
     return {}
 
+def parse_guesses(data: dict, num_contacts: int) -> list[str]:
+    """
+    Reads up to `num_contacts` distinct guesses from a holder reply ("guesses", or a
+    single "guess"), padded with "" so there is one per contact.
+    """
+    guesses = data.get("guesses")
+    if not isinstance(guesses, list):
+        guesses = [data.get("guess")]
+    distinct = []
+    for guess in guesses:
+        if isinstance(guess, str) and guess.strip() and guess.upper() not in (g.upper() for g in distinct):
+            distinct.append(guess.strip())
+    distinct = distinct[:num_contacts]
+    return distinct + [""] * (num_contacts - len(distinct))
+
 class LLMPlayer(Player):
     """
     Base class for LLM players with shared logic.
     """
-    def __init__(self, name: str):
+    provider = "llm"         # SessionPool key
+    provider_label = "LLM"   # Used in log messages
+
+    def __init__(
+        self,
+        name: str,
+        session_pool: Optional[SessionPool] = None,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        response_cache: Optional[ResponseCache] = None,
+        call_timeout: Optional[float] = None,
+        hedge: bool = False,
+        conversation: bool = False
+    ):
         super().__init__(name)
         self.secret_word = None
+        self.model = None
+        self.api_key = None
+        self.session_pool = session_pool
+        # Rate limits apply per provider + API key (shared through the session pool)
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.retry_policy = retry_policy or RetryPolicy()
+        self._own_rate_limiter = RateLimiter(requests_per_minute, tokens_per_minute)
+        self.response_cache = response_cache
+        # Deadline per HTTP attempt; an attempt that misses it is retried like a 5xx
+        self.call_timeout = call_timeout
+        # Fire a duplicate request once an attempt outlives the model's p95 latency
+        self.hedge = hedge
+        self.latency = LatencyTracker()
+        # Keep a per-game transcript and send only each round's delta (see for_game)
+        self.conversation = conversation
+        self.transcript = []
+        self._rounds_seen = 0
+
+    def for_game(self, config: GameConfig) -> "LLMPlayer":
+        player = super().for_game(config)
+        # Conversation mode: this game's messages so far, and how many rounds they cover
+        player.transcript = []
+        player._rounds_seen = 0
+        return player
 
     async def submit_attacker_guess(
         self, 
@@ -58,19 +130,29 @@ class LLMPlayer(Player):
         history: list[Round], 
         error_msg: str | None = None
     ) -> AttackerSubmission:
-        history_str = format_history(history)
-        if error_msg:
-            history_str += f"\n\n🚨 IMPORTANT: {error_msg}"
-            
-        user_prompt = ATTACKER_USER_TEMPLATE.format(
-            prefix=prefix,
-            round_number=len(history) + 1,
-            history=history_str
-        )
-        
         try:
-            response_text = await self._call_api(ATTACKER_SYSTEM_PROMPT, user_prompt)
-            data = extract_json(response_text)
+            if self.conversation:
+                if error_msg and self._rounds_seen == len(history) and self.transcript:
+                    turn = RETRY_TURN_TEMPLATE.format(error_msg=error_msg)
+                else:
+                    turn = ATTACKER_TURN_TEMPLATE.format(
+                        prefix=prefix,
+                        round_number=len(history) + 1,
+                        history=format_history(history[self._rounds_seen:])
+                    )
+                response_text = await self._converse(ATTACKER_SYSTEM_PROMPT, turn, len(history))
+            else:
+                history_str = format_history(history)
+                if error_msg:
+                    history_str += f"\n\n🚨 IMPORTANT: {error_msg}"
+
+                user_prompt = ATTACKER_USER_TEMPLATE.format(
+                    prefix=prefix,
+                    round_number=len(history) + 1,
+                    history=history_str
+                )
+                response_text = await self._call_api(ATTACKER_SYSTEM_PROMPT, user_prompt)
+            data = self._extract(response_text)
             return AttackerSubmission(
                 player_id=self.name,
                 prefix_word=data.get("prefix_word"),
@@ -95,123 +177,387 @@ class LLMPlayer(Player):
         
         try:
             response_text = await self._call_api(system_prompt, user_prompt)
-            data = extract_json(response_text)
+            data = self._extract(response_text)
             return data.get("guess", "")
         except Exception as e:
             logger.error(f"Error in submit_holder_guess for {self.name}: {e}")
             return ""
 
+    async def submit_holder_guesses(self, prefix: str, history: list[Round], num_contacts: int) -> list[str]:
+        """
+        One call for all of the round's contacts, asking for `num_contacts` different guesses.
+        """
+        if num_contacts == 1 and not self.conversation:
+            return [await self.submit_holder_guess(prefix, history, num_contacts)]
+        if not self.secret_word:
+            logger.error(f"Holder {self.name} called without secret_word set")
+            return [""] * num_contacts
+
+        system_prompt = HOLDER_SYSTEM_PROMPT.format(secret_word=self.secret_word)
+        instructions = HOLDER_GUESSES_INSTRUCTIONS.format(num_contacts=num_contacts) if num_contacts > 1 else ""
+        try:
+            if self.conversation:
+                turn = HOLDER_TURN_TEMPLATE.format(
+                    prefix=prefix,
+                    round_number=len(history) + 1,
+                    num_contacts=num_contacts,
+                    history=format_history(history[self._rounds_seen:])
+                )
+                response_text = await self._converse(system_prompt, turn + instructions, len(history))
+            else:
+                user_prompt = HOLDER_USER_TEMPLATE.format(
+                    prefix=prefix,
+                    round_number=len(history) + 1,
+                    num_contacts=num_contacts,
+                    history=format_history(history)
+                )
+                response_text = await self._call_api(system_prompt, user_prompt + instructions)
+        except Exception as e:
+            logger.error(f"Error in submit_holder_guesses for {self.name}: {e}")
+            return [""] * num_contacts
+        return parse_guesses(self._extract(response_text), num_contacts)
+
+    async def _converse(self, system_prompt: str, turn: str, rounds_seen: int) -> str:
+        """
+        Sends the transcript plus a new user turn, and records the exchange.
+        """
+        messages = self.transcript + [{"role": "user", "content": turn}]
+        response_text = await self._call_chat(system_prompt, messages)
+        self._commit_turn(turn, response_text, rounds_seen)
+        return response_text
+
+    def _commit_turn(self, turn: str, response_text: str, rounds_seen: int):
+        if response_text == "{}":
+            return  # Failed call: the next turn re-sends these rounds
+        self.transcript.append({"role": "user", "content": turn})
+        self.transcript.append({"role": "assistant", "content": response_text})
+        self._rounds_seen = rounds_seen
+
     async def _call_api(self, system_prompt: str, user_prompt: str) -> str:
+        return await self._call_chat(system_prompt, [{"role": "user", "content": user_prompt}])
+
+    async def _call_chat(self, system_prompt: str, messages: list[dict]) -> str:
+        """
+        Sends a system prompt and alternating user/assistant messages
+        ({"role", "content"}), returning the reply text ("{}" on API errors).
+        """
         raise NotImplementedError()
 
+    def _parse_usage(self, data: dict) -> TokenUsage:
+        """
+        Reads the token counts from a successful response body.
+        """
+        return TokenUsage()
+
+    def _extract(self, response_text: str) -> dict:
+        with span("extract_json", model=self.model, bytes=len(response_text)) as extract_span:
+            data = extract_json(response_text)
+            extract_span.set(parsed=bool(data))
+        return data
+
+    async def _post(self, url: str, payload: dict, headers: dict | None = None) -> dict | None:
+        """
+        POSTs a JSON payload and returns the decoded response, or None on API errors.
+        Calls wait on the provider's rate limiter, and throttling (429), 5xx and connection
+        errors are retried here with jittered backoff honoring Retry-After, so they slow the
+        game down instead of using up the player's in-game attempts.
+        Successful responses go through the response cache, if one is set.
+        """
+        cache = self.response_cache
+        cache_key = None
+        if cache is not None and cache.mode != "off":
+            cache_key = cache.make_key(self.provider, self.model, payload)
+            cached = cache.get(cache_key)
+            if cached is not None:
+                with span("http_request", provider=self.provider, model=self.model, cache="hit"):
+                    return cached
+
+        limiter = self._get_rate_limiter()
+        estimated_tokens = estimate_tokens(json.dumps(payload)) if limiter else 0
+        policy = self.retry_policy
+
+        for attempt in range(policy.max_retries + 1):
+            if limiter:
+                await limiter.acquire(estimated_tokens)
+
+            retry_after = None
+            requests = 1
+            start = time.monotonic()
+            with span("http_request", provider=self.provider, model=self.model, attempt=attempt) as request_span:
+                try:
+                    (status, body, retry_after), requests = await self._send_hedged(
+                        url, payload, headers, limiter, estimated_tokens
+                    )
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    status, body = None, repr(e)
+                if tracing_enabled():
+                    request_span.set(
+                        status=status,
+                        request_bytes=len(json.dumps(payload)),
+                        response_bytes=len(json.dumps(body)) if status == 200 else len(body)
+                    )
+
+            if status == 200:
+                if cache_key is not None:
+                    cache.put(cache_key, self.provider, self.model, body)
+                usage = self._parse_usage(body)
+                # A hedge duplicate is billed for the same prompt; its reply is never read
+                usage.input_tokens *= requests
+                usage.calls = requests
+                usage.seconds = time.monotonic() - start
+                record_usage(self.name, usage)
+                return body
+            retryable = status is None or status in RETRYABLE_STATUSES
+            if not retryable or attempt == policy.max_retries:
+                logger.error(f"{self.provider_label} API error: {status} - {body}")
+                return None
+
+            delay = policy.delay(attempt, retry_after)
+            if status == 429 and limiter:
+                # Everyone sharing this key backs off, not just this call
+                limiter.pause(delay)
+            logger.warning(
+                f"{self.provider_label} API error: {status or 'connection failed'}, "
+                f"retrying in {delay:.1f}s ({attempt + 1}/{policy.max_retries})"
+            )
+            await asyncio.sleep(delay)
+
+    async def _send_hedged(
+        self,
+        url: str,
+        payload: dict,
+        headers: dict | None,
+        limiter: Optional[RateLimiter],
+        estimated_tokens: int
+    ) -> tuple[tuple[int, dict | str, float | None], int]:
+        """
+        One attempt, bounded by `call_timeout`. With hedging on, a duplicate request
+        is sent if the first is still pending after the model's p95 latency, and the
+        first successful answer wins; the other request is cancelled.
+        Returns the response and the number of requests sent.
+        """
+        hedge_after = self.latency.quantile(0.95) if self.hedge else None
+        primary = asyncio.ensure_future(self._timed_send(url, payload, headers))
+        if hedge_after is None:
+            return await primary, 1
+
+        # Also cancelled when the caller is (e.g. by the game timeout)
+        tasks = [primary]
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=hedge_after)
+            if done:
+                return primary.result(), 1
+
+            if limiter:
+                await limiter.acquire(estimated_tokens)
+            self.latency.hedges += 1
+            secondary = asyncio.ensure_future(self._timed_send(url, payload, headers))
+            tasks.append(secondary)
+            pending = set(tasks)
+            while True:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None and task.result()[0] == 200:
+                        if task is secondary:
+                            self.latency.hedge_wins += 1
+                        return task.result(), 2
+                if not pending:
+                    # Both failed: report the last one like an unhedged attempt
+                    return task.result(), 2
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    async def _timed_send(self, url: str, payload: dict, headers: dict | None) -> tuple[int, dict | str, float | None]:
+        start = time.monotonic()
+        if self.call_timeout is None:
+            response = await self._send(url, payload, headers)
+        else:
+            response = await asyncio.wait_for(self._send(url, payload, headers), self.call_timeout)
+        if response[0] == 200:
+            self.latency.record(time.monotonic() - start)
+        return response
+
+    async def _send(self, url: str, payload: dict, headers: dict | None) -> tuple[int, dict | str, float | None]:
+        """
+        Sends one request through the pooled session (or a one-off session without a pool).
+        Returns (status, decoded JSON or error text, Retry-After seconds).
+        """
+        if self.session_pool is None:
+            async with aiohttp.ClientSession() as session:
+                return await self._send_with(session, url, payload, headers)
+        return await self._send_with(self.session_pool.get(self.provider), url, payload, headers)
+
+    async def _send_with(self, session: aiohttp.ClientSession, url: str, payload: dict, headers: dict | None):
+        async with session.post(url, headers=headers, json=payload) as resp:
+            if resp.status != 200:
+                retry_after = parse_retry_after(resp.headers.get("Retry-After"))
+                return resp.status, await resp.text(), retry_after
+            return resp.status, await resp.json(), None
+
+    def _get_rate_limiter(self) -> Optional[RateLimiter]:
+        if not (self.requests_per_minute or self.tokens_per_minute):
+            return None
+        if self.session_pool is None:
+            return self._own_rate_limiter
+        return self.session_pool.limiter(
+            self.provider, self.api_key, self.requests_per_minute, self.tokens_per_minute
+        )
+
 class OpenAIPlayer(LLMPlayer):
-    def __init__(self, name: str, model: str = "gpt-4o", api_key: str = None):
-        super().__init__(name)
+    provider = "openai"
+    provider_label = "OpenAI"
+
+    def __init__(self, name: str, model: str = "gpt-4o", api_key: str = None, **kwargs):
+        super().__init__(name, **kwargs)
         self.model = model
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
+        if not self.api_key:
+            raise ValueError("No OpenAI API key: pass api_key or set OPENAI_API_KEY")
         self.url = "https://api.openai.com/v1/chat/completions"
 
-    async def _call_api(self, system_prompt: str, user_prompt: str) -> str:
+    async def _call_chat(self, system_prompt: str, messages: list[dict]) -> str:
         headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json"
         }
+        # The system prompt and earlier turns form a stable prefix for automatic prompt caching
         payload = {
             "model": self.model,
-            "messages": [
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
+            "messages": [{"role": "system", "content": system_prompt}, *messages],
             "response_format": {"type": "json_object"}
         }
         
-        async with aiohttp.ClientSession() as session:
-            async with session.post(self.url, headers=headers, json=payload) as resp:
-                if resp.status != 200:
-                    text = await resp.text()
-                    logger.error(f"OpenAI API error: {resp.status} - {text}")
-                    return "{}"
-                data = await resp.json()
-                return data["choices"][0]["message"]["content"]
+        data = await self._post(self.url, payload, headers)
+        if data is None:
+            return "{}"
+        return data["choices"][0]["message"]["content"]
+
+    def _parse_usage(self, data: dict) -> TokenUsage:
+        usage = data.get("usage") or {}
+        return TokenUsage(
+            input_tokens=usage.get("prompt_tokens", 0),
+            output_tokens=usage.get("completion_tokens", 0),
+            cached_input_tokens=(usage.get("prompt_tokens_details") or {}).get("cached_tokens", 0)
+        )
 
 class AnthropicPlayer(LLMPlayer):
-    def __init__(self, name: str, model: str = "claude-3-5-sonnet-20240620", api_key: str = None):
-        super().__init__(name)
+    provider = "anthropic"
+    provider_label = "Anthropic"
+
+    def __init__(self, name: str, model: str = "claude-3-5-sonnet-20240620", api_key: str = None, **kwargs):
+        super().__init__(name, **kwargs)
         self.model = model
         self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
+        if not self.api_key:
+            raise ValueError("No Anthropic API key: pass api_key or set ANTHROPIC_API_KEY")
         self.url = "https://api.anthropic.com/v1/messages"
 
-    async def _call_api(self, system_prompt: str, user_prompt: str) -> str:
+    async def _call_chat(self, system_prompt: str, messages: list[dict]) -> str:
         headers = {
             "x-api-key": self.api_key,
             "anthropic-version": "2023-06-01",
             "content-type": "application/json"
         }
+        system = system_prompt
+        if self.conversation:
+            # Cache breakpoints on the system prompt and on the last turn before the new
+            # one, so each call reads the whole earlier conversation from the prompt cache
+            system = [{"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}]
+            if len(messages) > 1:
+                messages = list(messages)
+                previous = messages[-2]
+                messages[-2] = {
+                    "role": previous["role"],
+                    "content": [{"type": "text", "text": previous["content"], "cache_control": {"type": "ephemeral"}}]
+                }
         payload = {
             "model": self.model,
-            "system": system_prompt,
-            "messages": [{"role": "user", "content": user_prompt}],
+            "system": system,
+            "messages": messages,
             "max_tokens": 1024
         }
         
-        async with aiohttp.ClientSession() as session:
-            async with session.post(self.url, headers=headers, json=payload) as resp:
-                if resp.status != 200:
-                    text = await resp.text()
-                    logger.error(f"Anthropic API error: {resp.status} - {text}")
-                    return "{}"
-                data = await resp.json()
-                return data["content"][0]["text"]
+        data = await self._post(self.url, payload, headers)
+        if data is None:
+            return "{}"
+        return data["content"][0]["text"]
+
+    def _parse_usage(self, data: dict) -> TokenUsage:
+        # input_tokens excludes prompt-cache reads and writes; count them as input too
+        usage = data.get("usage") or {}
+        cache_read = usage.get("cache_read_input_tokens") or 0
+        cache_write = usage.get("cache_creation_input_tokens") or 0
+        return TokenUsage(
+            input_tokens=usage.get("input_tokens", 0) + cache_read + cache_write,
+            output_tokens=usage.get("output_tokens", 0),
+            cached_input_tokens=cache_read
+        )
 
 class GeminiPlayer(LLMPlayer):
-    def __init__(self, name: str, model: str = "gemini-1.5-flash", api_key: str = None):
-        super().__init__(name)
+    provider = "google"
+    provider_label = "Google"
+
+    def __init__(self, name: str, model: str = "gemini-1.5-flash", api_key: str = None, **kwargs):
+        super().__init__(name, **kwargs)
         self.model = model
         self.api_key = api_key or os.getenv("GOOGLE_API_KEY")
+        if not self.api_key:
+            raise ValueError("No Google API key: pass api_key or set GOOGLE_API_KEY")
         self.url = f"https://generativelanguage.googleapis.com/v1beta/models/{self.model}:generateContent?key={self.api_key}"
 
-    async def _call_api(self, system_prompt: str, user_prompt: str) -> str:
+    async def _call_chat(self, system_prompt: str, messages: list[dict]) -> str:
         headers = {"Content-Type": "application/json"}
         payload = {
             "system_instruction": {"parts": [{"text": system_prompt}]},
-            "contents": [{"parts": [{"text": user_prompt}]}],
+            "contents": [
+                {"role": "model" if m["role"] == "assistant" else "user", "parts": [{"text": m["content"]}]}
+                for m in messages
+            ],
             "generationConfig": {"response_mime_type": "application/json"}
         }
         
-        async with aiohttp.ClientSession() as session:
-            async with session.post(self.url, headers=headers, json=payload) as resp:
-                if resp.status != 200:
-                    text = await resp.text()
-                    logger.error(f"Google API error: {resp.status} - {text}")
-                    return "{}"
-                data = await resp.json()
-                return data["candidates"][0]["content"]["parts"][0]["text"]
+        data = await self._post(self.url, payload, headers)
+        if data is None:
+            return "{}"
+        return data["candidates"][0]["content"]["parts"][0]["text"]
+
+    def _parse_usage(self, data: dict) -> TokenUsage:
+        usage = data.get("usageMetadata") or {}
+        return TokenUsage(
+            input_tokens=usage.get("promptTokenCount", 0),
+            output_tokens=usage.get("candidatesTokenCount", 0),
+            cached_input_tokens=usage.get("cachedContentTokenCount", 0)
+        )
 
 class OllamaPlayer(LLMPlayer):
-    def __init__(self, name: str, model: str = "llama3", base_url: str = "http://localhost:11434"):
-        super().__init__(name)
+    provider = "ollama"
+    provider_label = "Ollama"
+
+    def __init__(self, name: str, model: str = "llama3", base_url: str = "http://localhost:11434", **kwargs):
+        super().__init__(name, **kwargs)
         self.model = model
         self.base_url = f"{base_url}/api/chat"
 
-    async def _call_api(self, system_prompt: str, user_prompt: str) -> str:
+    async def _call_chat(self, system_prompt: str, messages: list[dict]) -> str:
         payload = {
             "model": self.model,
-            "messages": [
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
+            "messages": [{"role": "system", "content": system_prompt}, *messages],
             "stream": False,
             "format": "json"
         }
         
-        async with aiohttp.ClientSession() as session:
-            async with session.post(self.base_url, json=payload) as resp:
-                if resp.status != 200:
-                    text = await resp.text()
-                    logger.error(f"Ollama API error: {resp.status} - {text}")
-                    return "{}"
-                data = await resp.json()
-                return data["message"]["content"]
+        data = await self._post(self.base_url, payload)
+        if data is None:
+            return "{}"
+        return data["message"]["content"]
+
+    def _parse_usage(self, data: dict) -> TokenUsage:
+        return TokenUsage(
+            input_tokens=data.get("prompt_eval_count", 0),
+            output_tokens=data.get("eval_count", 0)
+        )
 
 class MockPlayer(Player):
     """
@@ -1,5 +1,7 @@
+import asyncio
+import copy
 from abc import ABC, abstractmethod
-from contacteval.game.models import AttackerSubmission, Round
+from contacteval.game.models import AttackerSubmission, GameConfig, Round
 
 class Player(ABC):
     """
@@ -10,6 +12,14 @@ class Player(ABC):
     def __init__(self, name: str):
         self.name = name
 
+    def for_game(self, config: GameConfig) -> "Player":
+        """
+        Returns the instance that plays a single game.
+        The default shallow copy keeps per-game state (e.g. the holder's secret word)
+        isolated when the same model plays several games concurrently.
+        """
+        return copy.copy(self)
+
     @abstractmethod
     async def submit_attacker_guess(
         self,
@@ -33,3 +43,19 @@ class Player(ABC):
         Holder role: guess the contact word.
         """
         pass
+
+    async def submit_holder_guesses(
+        self,
+        prefix: str,
+        history: list[Round],
+        num_contacts: int,
+    ) -> list[str]:
+        """
+        Holder role: one guess per contact of the round, in contact order.
+        The default issues the `submit_holder_guess` calls concurrently, so a round
+        costs one holder round trip however many contacts it has. Players that can
+        answer for every contact in a single call (LLM players) override this.
+        """
+        return list(await asyncio.gather(*(
+            self.submit_holder_guess(prefix, history, num_contacts) for _ in range(num_contacts)
+        )))
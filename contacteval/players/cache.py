@@ -0,0 +1,125 @@
+import hashlib
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Optional
+
+# off: never used; write: record responses but always call the API;
+# read-write: also answer repeated requests from the cache (not for rated games)
+CACHE_MODES = ["off", "write", "read-write"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    provider TEXT NOT NULL,
+    model TEXT NOT NULL,
+    response TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_responses_last_used ON responses(last_used);
+"""
+
+class ResponseCache:
+    """
+    Bounded on-disk cache of raw API responses, keyed by provider, model and the
+    full request payload (system prompt, user prompt and sampling parameters).
+    When the stored responses exceed `max_bytes`, the least recently used ones
+    are evicted. One cache is shared by every player of a tournament.
+    """
+
+    def __init__(self, cache_dir: str = ".cache", mode: str = "write", max_bytes: int = 512 * 1024 * 1024):
+        if mode not in CACHE_MODES:
+            raise ValueError(f"Unknown cache mode: {mode}")
+        self.mode = mode
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+
+        self.conn = None
+        self._total_bytes = 0
+        if mode != "off":
+            path = Path(cache_dir)
+            path.mkdir(parents=True, exist_ok=True)
+            self.conn = sqlite3.connect(path / "responses.db")
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.executescript(SCHEMA)
+            self._total_bytes = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    @property
+    def readable(self) -> bool:
+        return self.mode == "read-write"
+
+    @property
+    def writable(self) -> bool:
+        return self.mode in ("write", "read-write")
+
+    @staticmethod
+    def make_key(provider: str, model: str, payload: dict) -> str:
+        blob = json.dumps([provider, model, payload], sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[dict]:
+        """
+        Returns the cached response (refreshing its recency) or None.
+        Always a miss unless the mode is read-write.
+        """
+        if not self.readable:
+            return None
+        row = self.conn.execute("SELECT response FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        with self.conn:
+            self.conn.execute("UPDATE responses SET last_used = ? WHERE key = ?", (time.time(), key))
+        return json.loads(row[0])
+
+    def put(self, key: str, provider: str, model: str, response: dict):
+        if not self.writable:
+            return
+        text = json.dumps(response)
+        size = len(text.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        with self.conn:
+            old = self.conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (key, provider, model, text, size, time.time())
+            )
+            self._total_bytes += size - (old[0] if old else 0)
+            self.writes += 1
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self):
+        # Oldest first until back under the bound
+        for key, size in self.conn.execute(
+            "SELECT key, size FROM responses ORDER BY last_used"
+        ).fetchall():
+            if self._total_bytes <= self.max_bytes:
+                break
+            self.conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._total_bytes -= size
+            self.evictions += 1
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "mode": self.mode,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "bytes": self._total_bytes
+        }
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
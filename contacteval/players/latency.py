@@ -0,0 +1,26 @@
+from collections import deque
+from typing import Optional
+
+class LatencyTracker:
+    """
+    Rolling window of a model's successful response times, used to decide when
+    to hedge a slow request. Shared by every per-game copy of a player.
+    """
+
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        self.samples = deque(maxlen=window)
+        self.min_samples = min_samples
+        self.hedges = 0       # Duplicate requests fired
+        self.hedge_wins = 0   # ... that answered first
+
+    def record(self, seconds: float):
+        self.samples.append(seconds)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Returns the q-quantile of the window, or None until there are enough samples.
+        """
+        if len(self.samples) < self.min_samples:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
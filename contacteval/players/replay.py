@@ -0,0 +1,72 @@
+from contacteval.game.models import AttackerSubmission, GameConfig, GameResult, Round
+from contacteval.players.base import Player
+
+class ReplayExhausted(Exception):
+    """
+    Raised when a replayed game asks for a move the stored game never made
+    (e.g. it lasts longer after a rules change).
+    """
+
+class ReplayPlayer(Player):
+    """
+    Plays back one model's moves from a stored game, with no network calls.
+    Moves are looked up by round (the length of the history the engine passes in),
+    so engine retries within a round get the same stored answer. Auto-assigned
+    submissions are returned as stored, flag included.
+    """
+
+    def __init__(self, name: str, result: GameResult):
+        super().__init__(name)
+        self.secret_word = None
+        self.rounds = result.rounds
+        self._guess_round = -1
+        self._guess_index = 0
+
+    def for_game(self, config: GameConfig) -> "ReplayPlayer":
+        player = super().for_game(config)
+        player._guess_round = -1
+        player._guess_index = 0
+        return player
+
+    def _stored_round(self, history: list[Round]) -> Round:
+        index = len(history)
+        if index >= len(self.rounds):
+            raise ReplayExhausted(f"{self.name}: no stored round {index + 1}")
+        return self.rounds[index]
+
+    async def submit_attacker_guess(
+        self,
+        prefix: str,
+        history: list[Round],
+        error_msg: str | None = None
+    ) -> AttackerSubmission:
+        stored = self._stored_round(history)
+        for submission in stored.submissions:
+            if submission.player_id == self.name:
+                return submission.model_copy()
+        raise ReplayExhausted(f"{self.name}: no stored submission in round {stored.round_number}")
+
+    async def submit_holder_guess(self, prefix: str, history: list[Round], num_contacts: int) -> str:
+        stored = self._stored_round(history)
+        # One call per contact, in contact order
+        if self._guess_round != len(history):
+            self._guess_round, self._guess_index = len(history), 0
+        if self._guess_index >= len(stored.contacts):
+            raise ReplayExhausted(f"{self.name}: no stored holder guess {self._guess_index + 1} in round {stored.round_number}")
+        guess = stored.contacts[self._guess_index].holder_guess
+        self._guess_index += 1
+        return guess or ""
+
+    async def submit_holder_guesses(self, prefix: str, history: list[Round], num_contacts: int) -> list[str]:
+        stored = self._stored_round(history)
+        if num_contacts > len(stored.contacts):
+            raise ReplayExhausted(f"{self.name}: round {stored.round_number} had {len(stored.contacts)} stored contacts, not {num_contacts}")
+        return [c.holder_guess or "" for c in stored.contacts[:num_contacts]]
+
+def replay_players(result: GameResult) -> tuple[ReplayPlayer, list[ReplayPlayer]]:
+    """
+    Returns the (holder, attackers) that replay a stored game.
+    """
+    holder = ReplayPlayer(result.config.holder_id, result)
+    attackers = [ReplayPlayer(aid, result) for aid in result.config.attacker_ids]
+    return holder, attackers
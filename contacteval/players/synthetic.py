@@ -0,0 +1,99 @@
+import asyncio
+import math
+import random
+from typing import Optional
+from pydantic import BaseModel
+from contacteval.game.models import AttackerSubmission, Round
+from contacteval.players.base import Player
+from contacteval.words.bank import Dictionary
+
+LATENCY_KINDS = ["fixed", "lognormal", "heavy-tail"]
+
+class LatencyModel(BaseModel):
+    """
+    Distribution of simulated API response times, in seconds.
+    """
+    kind: str = "fixed"
+    seconds: float = 0.0   # fixed: the delay; lognormal: the median; heavy-tail: the minimum
+    sigma: float = 0.5     # lognormal spread (of the log)
+    alpha: float = 1.5     # heavy-tail (Pareto) index: lower means a heavier tail
+    cap: float = 30.0      # Upper bound on any single delay
+
+    def sample(self, rng: random.Random) -> float:
+        if self.kind == "fixed":
+            delay = self.seconds
+        elif self.kind == "lognormal":
+            delay = self.seconds * math.exp(rng.gauss(0.0, self.sigma))
+        elif self.kind == "heavy-tail":
+            delay = self.seconds * rng.paretovariate(self.alpha)
+        else:
+            raise ValueError(f"Unknown latency kind: {self.kind}")
+        return min(delay, self.cap)
+
+class SyntheticPlayer(Player):
+    """
+    Dictionary-driven player with simulated latency, for benchmarking the engine.
+
+    Attackers submit an invalid word with probability `invalid_rate`, the shared
+    "consensus" word for the prefix (first unused match, which every synthetic
+    attacker agrees on) with probability `contact_rate`, and a random match
+    otherwise. Holders block a contact by naming the consensus word with
+    probability `block_rate`. Games always end: once the prefix is the whole
+    secret word, the consensus word is the secret itself.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        dictionary: Dictionary,
+        latency: Optional[LatencyModel] = None,
+        invalid_rate: float = 0.0,
+        contact_rate: float = 0.3,
+        block_rate: float = 0.2,
+        seed: Optional[int] = None
+    ):
+        super().__init__(name)
+        self.secret_word = None
+        self.dictionary = dictionary
+        self.latency = latency or LatencyModel()
+        self.invalid_rate = invalid_rate
+        self.contact_rate = contact_rate
+        self.block_rate = block_rate
+        self.rng = random.Random(seed)
+
+    async def _wait(self):
+        delay = self.latency.sample(self.rng)
+        await asyncio.sleep(delay)
+
+    def _consensus_word(self, prefix: str, used: set[str]) -> Optional[str]:
+        start, end = self.dictionary.prefix_range(prefix)
+        for i in range(start, end):
+            word = self.dictionary.words[i]
+            if word not in used:
+                return word
+        return None
+
+    async def submit_attacker_guess(
+        self,
+        prefix: str,
+        history: list[Round],
+        error_msg: str | None = None
+    ) -> AttackerSubmission:
+        await self._wait()
+        roll = self.rng.random()
+        if roll < self.invalid_rate:
+            return AttackerSubmission(player_id=self.name, prefix_word=f"{prefix}#")
+
+        used = {s.prefix_word.upper() for r in history for s in r.submissions if s.prefix_word}
+        if roll < self.invalid_rate + self.contact_rate:
+            word = self._consensus_word(prefix, used)
+        else:
+            word = self.dictionary.get_random_word(prefix, exclude=used)
+        return AttackerSubmission(player_id=self.name, prefix_word=word)
+
+    async def submit_holder_guess(self, prefix: str, history: list[Round], num_contacts: int) -> str:
+        await self._wait()
+        used = {s.prefix_word.upper() for r in history for s in r.submissions if s.prefix_word}
+        if self.rng.random() < self.block_rate:
+            return self._consensus_word(prefix, used) or ""
+        return self.dictionary.get_random_word(prefix, exclude=used) or ""
@@ -0,0 +1,70 @@
+import hashlib
+from typing import Dict, Optional, Tuple
+import aiohttp
+from contacteval.players.ratelimit import RateLimiter
+
+class SessionPool:
+    """
+    Owns one long-lived, pooled aiohttp session per provider.
+    Reusing sessions keeps connections alive between calls, so only the first request
+    to a provider pays for the TCP+TLS handshake. Close it when the tournament ends.
+    """
+
+    def __init__(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        keepalive_timeout: float = 30.0
+    ):
+        # limit / limit_per_host: max open connections (0 = unlimited)
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self._sessions: Dict[str, aiohttp.ClientSession] = {}
+        # (provider, api key fingerprint) -> limiter shared by every model using that key
+        self._limiters: Dict[Tuple[str, str], RateLimiter] = {}
+
+    def get(self, provider: str) -> aiohttp.ClientSession:
+        """
+        Returns the session for a provider, creating it on first use.
+        Must be called from inside the running event loop.
+        """
+        session = self._sessions.get(provider)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout
+            )
+            session = aiohttp.ClientSession(connector=connector)
+            self._sessions[provider] = session
+        return session
+
+    def limiter(
+        self,
+        provider: str,
+        api_key: Optional[str],
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None
+    ) -> RateLimiter:
+        """
+        Returns the rate limiter for a provider + API key.
+        The first caller's limits win; later models on the same key share them.
+        """
+        fingerprint = hashlib.sha256((api_key or "").encode()).hexdigest()[:16]
+        key = (provider, fingerprint)
+        if key not in self._limiters:
+            self._limiters[key] = RateLimiter(requests_per_minute, tokens_per_minute)
+        return self._limiters[key]
+
+    async def close(self):
+        for session in self._sessions.values():
+            if not session.closed:
+                await session.close()
+        self._sessions.clear()
+
+    async def __aenter__(self) -> "SessionPool":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
@@ -46,9 +46,9 @@ RULES:
 - Attackers can also guess the full secret word to win instantly.
 
 Respond in JSON:
-{
+{{
   "guess": "your single word guess to block the contact"
-}
+}}
 """
 
 HOLDER_USER_TEMPLATE = """
@@ -63,6 +63,48 @@ PREVIOUS ROUNDS:
 What is the word the Attackers converged on?
 """
 
+# Appended to the holder's prompt when a round has several contacts: one call answers for all
+HOLDER_GUESSES_INSTRUCTIONS = """
+There are {num_contacts} Contacts this round, each on a different word.
+Give {num_contacts} different guesses, one per Contact.
+
+Respond in JSON:
+{{
+  "guesses": ["your first guess", "your second guess"]
+}}
+"""
+
+# Conversation mode: each call appends only what happened since the player's last turn
+
+ATTACKER_TURN_TEMPLATE = """
+NEW ROUNDS:
+{history}
+
+GAME STATE:
+Prefix: "{prefix}"
+Round: {round_number}
+
+Respond with your choice for this round.
+"""
+
+HOLDER_TURN_TEMPLATE = """
+NEW ROUNDS:
+{history}
+
+GAME STATE:
+Prefix: "{prefix}"
+Round: {round_number}
+Number of Contacts to block: {num_contacts}
+
+What is the word the Attackers converged on?
+"""
+
+RETRY_TURN_TEMPLATE = """
+🚨 IMPORTANT: {error_msg}
+
+Respond with your choice for this round.
+"""
+
 def format_history(rounds):
     if not rounds:
         return "No previous rounds."
@@ -13,9 +13,10 @@ class LeaderboardManager:
         # player_id -> role -> PlayerRating
         self.ratings = {}
 
-    def process_game(self, result: GameResult):
+    def process_game(self, result: GameResult) -> List[PlayerRating]:
         """
         Processes a single game result and updates ratings.
+        Returns the updated ratings (holder first), e.g. for journaling.
         """
         word_id = result.config.word.upper()
         
@@ -27,6 +28,7 @@ class LeaderboardManager:
         old_h_mu = h_rating.mu
         new_h_rating = self.system.update_rating(h_rating, result.holder_score, h_diff)
         self.ratings[holder_id]["holder"] = new_h_rating
+        updated = [new_h_rating]
         
         # Log residual for calibration
         self.calibrator.add_observation(word_id, "holder", result.holder_score - old_h_mu)
@@ -39,10 +41,13 @@ class LeaderboardManager:
             old_a_mu = a_rating.mu
             new_a_rating = self.system.update_rating(a_rating, score, a_diff)
             self.ratings[attacker_id]["attacker"] = new_a_rating
+            updated.append(new_a_rating)
             
             # Log residual for calibration
             self.calibrator.add_observation(word_id, "attacker", score - old_a_mu)
 
+        return updated
+
     def _get_rating(self, player_id: str, role: str) -> PlayerRating:
         if player_id not in self.ratings:
             self.ratings[player_id] = {}
@@ -0,0 +1,163 @@
+import math
+from array import array
+from typing import Dict, Iterable, List, Tuple
+from contacteval.game.models import GameResult, PlayerRating
+from contacteval.ranking.leaderboard import LeaderboardManager
+from contacteval.ranking.system import (
+    MIN_DIFFICULTY_OBSERVATIONS,
+    MIN_OFFICIAL_GAMES,
+    BayesianRatingSystem,
+    DifficultyCalibrator
+)
+
+class EncodedHistory:
+    """
+    Game history reduced to flat arrays: player and word indexes plus scores.
+    Attackers of game g are entries attacker_start[g]:attacker_start[g + 1].
+    """
+
+    def __init__(self):
+        self.players: List[str] = []
+        self.words: List[str] = []
+        self.holder = array("i")
+        self.holder_score = array("d")
+        self.word = array("i")
+        self.attacker_start = array("i", [0])
+        self.attacker = array("i")
+        self.attacker_score = array("d")
+        self._player_index: Dict[str, int] = {}
+        self._word_index: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.holder)
+
+    def add(self, result: GameResult):
+        self.holder.append(self._index(self._player_index, self.players, result.config.holder_id))
+        self.holder_score.append(result.holder_score)
+        self.word.append(self._index(self._word_index, self.words, result.config.word.upper()))
+        # Same order as LeaderboardManager.process_game, which matters for calibration
+        for attacker_id, score in result.attacker_scores.items():
+            self.attacker.append(self._index(self._player_index, self.players, attacker_id))
+            self.attacker_score.append(score)
+        self.attacker_start.append(len(self.attacker))
+
+    @staticmethod
+    def _index(index: Dict[str, int], names: List[str], name: str) -> int:
+        i = index.get(name)
+        if i is None:
+            i = index[name] = len(names)
+            names.append(name)
+        return i
+
+def encode_games(games: Iterable[GameResult]) -> EncodedHistory:
+    history = EncodedHistory()
+    for result in games:
+        history.add(result)
+    return history
+
+def replay_history(
+    history: EncodedHistory,
+    noise_variance: float = 4.0
+) -> Tuple[Dict[str, Dict[str, PlayerRating]], DifficultyCalibrator]:
+    """
+    Rebuilds ratings and word calibration from scratch over an encoded history.
+
+    Produces exactly the same ratings as feeding the games one by one to
+    LeaderboardManager.process_game, without allocating rating objects per game.
+    Every player starts from the same prior, so the Kalman gain and sigma after n
+    games depend only on n: they are computed once per n with the same float
+    operations as BayesianRatingSystem.update_rating. What remains per update is a
+    few array reads and writes.
+    """
+    prior = PlayerRating(player_id="", role="")
+    min_observations = MIN_DIFFICULTY_OBSERVATIONS
+    n_players = len(history.players)
+    n_words = len(history.words)
+
+    # Gain and sigma tables indexed by games played
+    max_games = 0
+    for role_players in (history.holder, history.attacker):
+        counts = [0] * n_players
+        for p in role_players:
+            counts[p] += 1
+        max_games = max(max_games, max(counts, default=0))
+
+    gains = []
+    sigmas = [prior.sigma]
+    sigma = prior.sigma
+    for _ in range(max_games):
+        sigma_sq = sigma ** 2
+        kalman_gain = sigma_sq / (sigma_sq + noise_variance)
+        sigma = math.sqrt(sigma_sq * (1 - kalman_gain))
+        gains.append(kalman_gain)
+        sigmas.append(sigma)
+
+    # Per-role state: player mu / games, word residual total / count
+    h_mu = [prior.mu] * n_players
+    h_games = [0] * n_players
+    a_mu = [prior.mu] * n_players
+    a_games = [0] * n_players
+    h_total = [0.0] * n_words
+    h_count = [0] * n_words
+    a_total = [0.0] * n_words
+    a_count = [0] * n_words
+
+    holder, holder_score, word = history.holder, history.holder_score, history.word
+    start, attacker, attacker_score = history.attacker_start, history.attacker, history.attacker_score
+
+    for g in range(len(holder)):
+        w = word[g]
+
+        p = holder[g]
+        mu = h_mu[p]
+        n = h_games[p]
+        score = holder_score[g]
+        c = h_count[w]
+        difficulty = h_total[w] / c if c >= min_observations else 0.0
+        h_mu[p] = mu + gains[n] * (score - (mu + difficulty))
+        h_games[p] = n + 1
+        h_total[w] += score - mu
+        h_count[w] = c + 1
+
+        for j in range(start[g], start[g + 1]):
+            p = attacker[j]
+            mu = a_mu[p]
+            n = a_games[p]
+            score = attacker_score[j]
+            c = a_count[w]
+            difficulty = a_total[w] / c if c >= min_observations else 0.0
+            a_mu[p] = mu + gains[n] * (score - (mu + difficulty))
+            a_games[p] = n + 1
+            a_total[w] += score - mu
+            a_count[w] = c + 1
+
+    ratings: Dict[str, Dict[str, PlayerRating]] = {}
+    for role, mus, games in (("holder", h_mu, h_games), ("attacker", a_mu, a_games)):
+        for p, player_id in enumerate(history.players):
+            n = games[p]
+            if n == 0:
+                continue
+            ratings.setdefault(player_id, {})[role] = PlayerRating(
+                player_id=player_id,
+                role=role,
+                mu=mus[p],
+                sigma=sigmas[n],
+                games_played=n,
+                is_provisional=n < MIN_OFFICIAL_GAMES
+            )
+
+    calibrator = DifficultyCalibrator.from_dict({
+        "words": history.words,
+        "holder": {"total": h_total, "count": h_count},
+        "attacker": {"total": a_total, "count": a_count}
+    })
+    return ratings, calibrator
+
+def rebuild_leaderboard(history: EncodedHistory, noise_variance: float = 4.0) -> LeaderboardManager:
+    """
+    Returns a LeaderboardManager in the state incremental processing of the history would leave it.
+    """
+    manager = LeaderboardManager()
+    manager.system = BayesianRatingSystem(noise_variance=noise_variance)
+    manager.ratings, manager.calibrator = replay_history(history, noise_variance)
+    return manager
@@ -1,7 +1,14 @@
 import math
+from array import array
 from typing import Dict, List, Tuple
 from contacteval.game.models import PlayerRating
 
+MIN_OFFICIAL_GAMES = 30           # Games before a rating stops being provisional
+MIN_DIFFICULTY_OBSERVATIONS = 10  # Observations before a word's difficulty is used
+
+def normal_cdf(x: float) -> float:
+    return 0.5 * (1 + math.erf(x / math.sqrt(2)))
+
 class BayesianRatingSystem:
     """
     Implements a score-based Bayesian rating system (conjugate Gaussian update).
@@ -42,7 +49,7 @@ class BayesianRatingSystem:
         
         # 4. Increment games and check provisional status
         new_games_played = rating.games_played + 1
-        is_provisional = new_games_played < 30
+        is_provisional = new_games_played < MIN_OFFICIAL_GAMES
         
         return PlayerRating(
             player_id=rating.player_id,
@@ -56,19 +63,43 @@ class BayesianRatingSystem:
 class DifficultyCalibrator:
     """
     Calibrates word difficulty parameters empirically.
+
+    State is array-backed: each word gets an index, and per role the residual
+    sums and observation counts live in flat arrays at that index. Snapshots are
+    those arrays as they are, so restoring is O(words).
     """
+    roles = ("holder", "attacker")
+
     def __init__(self):
-        # word_id -> (role -> total_residual, count)
-        self.stats = {}
+        self.words: List[str] = []
+        self._index: Dict[str, int] = {}
+        self.totals = {role: array("d") for role in self.roles}
+        self.counts = {role: array("q") for role in self.roles}
+        self.version = 0  # Bumped on every update, so derived views know when to recompute
+
+    def _word_index(self, word_id: str) -> int:
+        i = self._index.get(word_id)
+        if i is None:
+            i = len(self.words)
+            self._index[word_id] = i
+            self.words.append(word_id)
+            for role in self.roles:
+                self.totals[role].append(0.0)
+                self.counts[role].append(0)
+        return i
 
     def add_observation(self, word_id: str, role: str, residual: float):
-        if word_id not in self.stats:
-            self.stats[word_id] = {}
-        if role not in self.stats[word_id]:
-            self.stats[word_id][role] = {"total": 0.0, "count": 0}
-        
-        self.stats[word_id][role]["total"] += residual
-        self.stats[word_id][role]["count"] += 1
+        i = self._word_index(word_id)
+        self.totals[role][i] += residual
+        self.counts[role][i] += 1
+        self.version += 1
+
+    def get_count(self, word_id: str, role: str) -> int:
+        """
+        Observations of this word in this role so far.
+        """
+        i = self._index.get(word_id)
+        return 0 if i is None else self.counts[role][i]
 
     def get_difficulty(self, word_id: str, role: str) -> float:
         """
@@ -76,7 +107,51 @@ class DifficultyCalibrator:
         d = average residual observed on this word so far for this role.
         Only returns if sufficient data exists (e.g., 10+ games).
         """
-        word_stats = self.stats.get(word_id, {}).get(role)
-        if word_stats and word_stats["count"] >= 10:
-            return word_stats["total"] / word_stats["count"]
+        i = self._index.get(word_id)
+        if i is not None and self.counts[role][i] >= MIN_DIFFICULTY_OBSERVATIONS:
+            return self.totals[role][i] / self.counts[role][i]
         return 0.0
+
+    @property
+    def stats(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """
+        Nested view {word_id: {role: {"total", "count"}}} of the observed word/role pairs.
+        """
+        view = {}
+        for i, word_id in enumerate(self.words):
+            for role in self.roles:
+                if self.counts[role][i]:
+                    view.setdefault(word_id, {})[role] = {"total": self.totals[role][i], "count": self.counts[role][i]}
+        return view
+
+    def word_state(self, word_id: str) -> dict:
+        """
+        Absolute state of one word, e.g. for journaling after a game on it.
+        """
+        i = self._word_index(word_id)
+        return {
+            "word": word_id,
+            **{role: [self.totals[role][i], self.counts[role][i]] for role in self.roles}
+        }
+
+    def apply_word_state(self, state: dict):
+        i = self._word_index(state["word"])
+        for role in self.roles:
+            self.totals[role][i], self.counts[role][i] = state[role]
+        self.version += 1
+
+    def to_dict(self) -> dict:
+        return {
+            "words": self.words,
+            **{role: {"total": list(self.totals[role]), "count": list(self.counts[role])} for role in self.roles}
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "DifficultyCalibrator":
+        calibrator = cls()
+        calibrator.words = list(data["words"])
+        calibrator._index = {word_id: i for i, word_id in enumerate(calibrator.words)}
+        for role in cls.roles:
+            calibrator.totals[role] = array("d", data[role]["total"])
+            calibrator.counts[role] = array("q", data[role]["count"])
+        return calibrator
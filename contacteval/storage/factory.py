@@ -0,0 +1,16 @@
+from contacteval.storage.game_log import GameLogStorage
+from contacteval.storage.json_store import JsonStorage
+from contacteval.storage.sqlite_store import SqliteStorage
+
+STORAGE_BACKENDS = ["log", "json", "sqlite"]
+
+def open_storage(backend: str, base_path: str) -> JsonStorage | SqliteStorage:
+    backend = backend.lower()
+    if backend == "log":
+        return GameLogStorage(base_path)
+    elif backend == "json":
+        return JsonStorage(base_path)
+    elif backend == "sqlite":
+        return SqliteStorage(base_path)
+    else:
+        raise ValueError(f"Unknown storage backend: {backend}")
@@ -0,0 +1,64 @@
+from datetime import datetime
+from pydantic import BaseModel, model_validator
+from contacteval.game.models import GameResult
+
+class GameFilter(BaseModel):
+    """
+    Predicates for selecting stored games; unset fields match everything.
+    Backends push these down to file names, indexes or SQL where they can and
+    check the rest on the loaded game.
+    """
+    model_id: str | None = None
+    role: str | None = None          # Role of model_id: "attacker" or "holder"
+    word: str | None = None
+    word_length: int | None = None
+    dictionary_id: str | None = None
+    since: datetime | None = None    # Inclusive
+    until: datetime | None = None    # Exclusive
+
+    @model_validator(mode="after")
+    def _check_role(self):
+        if self.role is not None and self.model_id is None:
+            raise ValueError("Filtering by role requires a model_id")
+        if self.role not in (None, "attacker", "holder"):
+            raise ValueError(f"Unknown role: {self.role}")
+        return self
+
+    def matches_summary(
+        self,
+        word: str,
+        holder_id: str,
+        attacker_ids: list[str],
+        dictionary_id: str,
+        timestamp: datetime | None
+    ) -> bool:
+        """
+        Checks the predicates against a game's summary fields (as kept in indexes).
+        """
+        if self.word is not None and word.upper() != self.word.upper():
+            return False
+        if self.word_length is not None and len(word) != self.word_length:
+            return False
+        if self.dictionary_id is not None and dictionary_id != self.dictionary_id:
+            return False
+        if self.model_id is not None:
+            is_holder = holder_id == self.model_id
+            is_attacker = self.model_id in attacker_ids
+            if self.role == "holder" and not is_holder:
+                return False
+            if self.role == "attacker" and not is_attacker:
+                return False
+            if not (is_holder or is_attacker):
+                return False
+        if timestamp is not None:
+            if self.since is not None and timestamp < self.since:
+                return False
+            if self.until is not None and timestamp >= self.until:
+                return False
+        return True
+
+    def matches(self, result: GameResult) -> bool:
+        config = result.config
+        return self.matches_summary(
+            config.word, config.holder_id, config.attacker_ids, config.dictionary_id, result.timestamp
+        )
@@ -0,0 +1,203 @@
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+from contacteval.game.models import GameResult
+from contacteval.storage.filters import GameFilter
+from contacteval.storage.json_store import JsonStorage
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SEGMENT_BYTES = 32 * 1024 * 1024
+
+class GameLogStorage(JsonStorage):
+    """
+    Stores games in an append-only log of JSONL segments instead of one file per game.
+
+    Layout under `<base_path>/game_log/`:
+      segment_000001.jsonl        one compact GameResult per line
+      segment_000001.index.jsonl  offset, length and summary fields of each game,
+                                  written when the segment is sealed (rotated)
+
+    Saving a game is a single append to the active segment. Loading the full
+    history is a sequential scan of the segments. The log has a single writer:
+    run separate processes against separate base paths. Ratings are stored as
+    in JsonStorage.
+    """
+    games_dirname = "game_log"
+
+    def __init__(self, base_path: str = "results", max_segment_bytes: int = DEFAULT_SEGMENT_BYTES):
+        super().__init__(base_path)
+        self.max_segment_bytes = max_segment_bytes
+        self._active = None          # Append handle of the unsealed segment
+        self._active_id = None
+        self._active_index = []      # Index entries of the unsealed segment
+
+    # --- Writing ---
+
+    def save_game(self, result: GameResult):
+        if self._active is None:
+            self._open_active()
+
+        line = result.model_dump_json().encode("utf-8") + b"\n"
+        offset = self._active.tell()
+        if offset and offset + len(line) > self.max_segment_bytes:
+            self._seal()
+            self._open_active()
+            offset = 0
+
+        self._active.write(line)
+        self._active.flush()
+        self._active_index.append(_index_entry(result.config, result.timestamp.isoformat(), offset, len(line)))
+
+    def close(self):
+        """
+        Closes the active segment. It stays unsealed and is appended to on the next run.
+        """
+        if self._active is not None:
+            self._active.close()
+            self._active = None
+            self._active_id = None
+            self._active_index = []
+
+    def _open_active(self):
+        ids = self.segment_ids()
+        if ids and not self._index_path(ids[-1]).exists():
+            # Resume the unsealed segment, dropping a torn last line from a crash
+            seg_id = ids[-1]
+            self._active_index = self._scan_segment(seg_id, repair=True)
+        else:
+            seg_id = ids[-1] + 1 if ids else 1
+            self._active_index = []
+        self._active_id = seg_id
+        self._active = open(self._segment_path(seg_id), "ab")
+        self._active.seek(0, os.SEEK_END)
+
+    def _seal(self):
+        index_path = self._index_path(self._active_id)
+        tmp_path = index_path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            for entry in self._active_index:
+                f.write(json.dumps(entry) + "\n")
+        os.replace(tmp_path, index_path)
+        self.close()
+
+    # --- Reading ---
+
+    def segment_ids(self) -> List[int]:
+        ids = []
+        for path in self.games_path.glob("segment_*.jsonl"):
+            stem = path.name[len("segment_"):-len(".jsonl")]
+            if stem.isdigit():
+                ids.append(int(stem))
+        return sorted(ids)
+
+    def iter_games(self, game_filter: Optional[GameFilter] = None, include_rounds: bool = True) -> Iterator[GameResult]:
+        """
+        Streams stored games in write order, one segment at a time.
+        With a filter, the segment indexes are checked first and only matching
+        records are read. Without `include_rounds`, `rounds` is left empty.
+        """
+        if game_filter is not None:
+            yield from self._iter_filtered(game_filter, include_rounds)
+            return
+
+        for seg_id in self.segment_ids():
+            with open(self._segment_path(seg_id), "rb") as f:
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break  # Torn write at the tail
+                    yield _parse_game(line, include_rounds)
+
+    def _iter_filtered(self, game_filter: GameFilter, include_rounds: bool) -> Iterator[GameResult]:
+        handle, handle_seg = None, None
+        try:
+            for seg_id, entry in self.iter_index():
+                timestamp = datetime.fromisoformat(entry["timestamp"]) if entry.get("timestamp") else None
+                if not game_filter.matches_summary(
+                    entry["word"], entry["holder_id"], entry["attacker_ids"], entry["dictionary_id"], timestamp
+                ):
+                    continue
+                if handle_seg != seg_id:
+                    if handle is not None:
+                        handle.close()
+                    handle, handle_seg = open(self._segment_path(seg_id), "rb"), seg_id
+                handle.seek(entry["offset"])
+                yield _parse_game(handle.read(entry["length"]), include_rounds)
+        finally:
+            if handle is not None:
+                handle.close()
+
+    def load_all_games(self) -> List[GameResult]:
+        return list(self.iter_games())
+
+    def iter_index(self) -> Iterator[Tuple[int, dict]]:
+        """
+        Yields (segment_id, entry) for every stored game without parsing the games.
+        """
+        for seg_id in self.segment_ids():
+            if seg_id == self._active_id:
+                entries = list(self._active_index)
+            elif self._index_path(seg_id).exists():
+                with open(self._index_path(seg_id), "r") as f:
+                    entries = [json.loads(line) for line in f]
+            else:
+                entries = self._scan_segment(seg_id)
+            for entry in entries:
+                yield seg_id, entry
+
+    def read_game(self, segment_id: int, offset: int, length: int) -> GameResult:
+        with open(self._segment_path(segment_id), "rb") as f:
+            f.seek(offset)
+            return _parse_game(f.read(length), include_rounds=True)
+
+    def _scan_segment(self, seg_id: int, repair: bool = False) -> List[dict]:
+        """
+        Rebuilds the index of an unsealed segment. With `repair`, a torn last line is truncated.
+        """
+        path = self._segment_path(seg_id)
+        offset = 0
+        entries = []
+        with open(path, "rb") as f:
+            for line in f:
+                try:
+                    if not line.endswith(b"\n"):
+                        raise ValueError("incomplete line")
+                    data = json.loads(line)
+                except ValueError:
+                    if repair:
+                        logger.warning(f"Truncating torn record at {path}:{offset}")
+                        f.close()
+                        os.truncate(path, offset)
+                    break
+                entries.append(_index_entry(data["config"], data.get("timestamp"), offset, len(line)))
+                offset += len(line)
+        return entries
+
+    def _segment_path(self, seg_id: int) -> Path:
+        return self.games_path / f"segment_{seg_id:06d}.jsonl"
+
+    def _index_path(self, seg_id: int) -> Path:
+        return self.games_path / f"segment_{seg_id:06d}.index.jsonl"
+
+def _parse_game(line: bytes, include_rounds: bool) -> GameResult:
+    if include_rounds:
+        return GameResult.model_validate_json(line)
+    data = json.loads(line)
+    data["rounds"] = []
+    return GameResult.model_validate(data)
+
+def _index_entry(config, timestamp: Optional[str], offset: int, length: int) -> dict:
+    if not isinstance(config, dict):
+        config = config.model_dump()
+    return {
+        "offset": offset,
+        "length": length,
+        "timestamp": timestamp,
+        "word": config["word"],
+        "holder_id": config["holder_id"],
+        "attacker_ids": config["attacker_ids"],
+        "dictionary_id": config["dictionary_id"],
+    }
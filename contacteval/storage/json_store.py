@@ -1,56 +1,190 @@
 import json
 import os
+import re
+import uuid
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 from contacteval.game.models import GameResult, PlayerRating
+from contacteval.ranking.system import DifficultyCalibrator
+from contacteval.storage.filters import GameFilter
+
+# game_<date>_<time>[_<microseconds>]_<WORD>[_<suffix>].json (older files lack the optional parts)
+_FILENAME = re.compile(r"^game_(\d{8}_\d{6})(?:_(\d{6}))?_(.+?)(?:_[0-9a-f]{8})?\.json$")
 
 class JsonStorage:
     """
     Handles persistence of game results and player ratings to JSON files.
     """
-    
+    games_dirname = "games"
+
     def __init__(self, base_path: str = "results"):
         self.base_path = Path(base_path)
-        self.games_path = self.base_path / "games"
+        self.games_path = self.base_path / self.games_dirname
         self.ratings_path = self.base_path / "ratings.json"
+        self.journal_path = self.base_path / "ratings.journal.jsonl"
+        self.calibration_path = self.base_path / "calibration.json"
+        self._journal_checked = False
         
         # Ensure directories exist
         self.games_path.mkdir(parents=True, exist_ok=True)
 
     def save_game(self, result: GameResult):
-        filename = f"game_{result.timestamp.strftime('%Y%m%d_%H%M%S')}_{result.config.word}.json"
+        # Random suffix: concurrent games on the same word can finish within the clock's resolution
+        stamp = result.timestamp.strftime('%Y%m%d_%H%M%S_%f')
+        filename = f"game_{stamp}_{result.config.word}_{uuid.uuid4().hex[:8]}.json"
         file_path = self.games_path / filename
         with open(file_path, 'w') as f:
             f.write(result.model_dump_json(indent=2))
 
+    def close(self):
+        """
+        Releases open file handles. Each game is written to its own file, so there are none.
+        """
+        pass
+
+    def flush(self):
+        """
+        Writes buffered games. Games are written as they are saved, so there are none.
+        """
+        pass
+
     def load_all_games(self) -> List[GameResult]:
-        games = []
-        for file in self.games_path.glob("*.json"):
+        return list(self.iter_games())
+
+    def iter_games(self, game_filter: Optional[GameFilter] = None, include_rounds: bool = True) -> Iterator[GameResult]:
+        """
+        Streams stored games in chronological order. Word and date filters are checked
+        against the file name first, so non-matching files are never opened. Without
+        `include_rounds`, rounds are dropped before validation (`rounds` is empty).
+        """
+        # File names start with the timestamp, so this is chronological order
+        for file in sorted(self.games_path.glob("*.json")):
+            if game_filter is not None and not _filename_may_match(file.name, game_filter):
+                continue
             with open(file, 'r') as f:
                 data = json.load(f)
-                games.append(GameResult.model_validate(data))
-        return games
+            if not include_rounds:
+                data["rounds"] = []
+            result = GameResult.model_validate(data)
+            if game_filter is None or game_filter.matches(result):
+                yield result
 
-    def save_ratings(self, ratings: Dict[str, Dict[str, PlayerRating]]):
+    def save_ratings(
+        self,
+        ratings: Dict[str, Dict[str, PlayerRating]],
+        calibrator: Optional[DifficultyCalibrator] = None
+    ):
         """
-        Saves the nested ratings dict {player_id: {role: PlayerRating}}.
+        Saves the nested ratings dict {player_id: {role: PlayerRating}} as a snapshot,
+        and the word difficulty calibration next to it (its arrays as they are).
+        Each snapshot is written to a temp file and renamed over the old one, so a crash
+        never leaves a half-written file; the journal they supersede is then cleared.
         """
         # Convert to serializable format
         serializable = {}
         for pid, roles in ratings.items():
             serializable[pid] = {role: r.model_dump() for role, r in roles.items()}
-            
-        with open(self.ratings_path, 'w') as f:
-            json.dump(serializable, f, indent=2)
+
+        if calibrator is None and any("calibration" in entry for entry in self._read_journal()):
+            # Keep journaled calibration updates the caller did not pass in
+            calibrator = self.load_calibration()
+
+        _write_json_atomic(self.ratings_path, serializable, indent=2)
+        if calibrator is not None:
+            _write_json_atomic(self.calibration_path, calibrator.to_dict())
+
+        # Journal entries hold absolute state, so a crash before this truncate is harmless
+        open(self.journal_path, 'w').close()
+
+    def record_rating_updates(self, updates: List[PlayerRating], calibration: Optional[dict] = None):
+        """
+        Appends one game's updated ratings, and the game's word calibration state
+        (`DifficultyCalibrator.word_state`), to the journal: O(1) per game.
+        load_ratings() and load_calibration() replay the journal on top of the last snapshots.
+        """
+        entry = {"ratings": [r.model_dump() for r in updates]}
+        if calibration is not None:
+            entry["calibration"] = calibration
+        with open(self.journal_path, 'ab+') as f:
+            if not self._journal_checked:
+                # Terminate a torn entry from a crash so it doesn't swallow this one
+                self._journal_checked = True
+                if f.tell() > 0:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b"\n":
+                        f.write(b"\n")
+            f.write(json.dumps(entry).encode("utf-8") + b"\n")
+
+    def load_calibration(self) -> DifficultyCalibrator:
+        """
+        Restores the calibration snapshot in O(words), then replays the journal tail.
+        """
+        if self.calibration_path.exists():
+            with open(self.calibration_path, 'r') as f:
+                calibrator = DifficultyCalibrator.from_dict(json.load(f))
+        else:
+            calibrator = DifficultyCalibrator()
+        for entry in self._read_journal():
+            if "calibration" in entry:
+                calibrator.apply_word_state(entry["calibration"])
+        return calibrator
 
     def load_ratings(self) -> Dict[str, Dict[str, PlayerRating]]:
-        if not self.ratings_path.exists():
-            return {}
-            
-        with open(self.ratings_path, 'r') as f:
-            data = json.load(f)
-            
         deserialized = {}
-        for pid, roles in data.items():
-            deserialized[pid] = {role: PlayerRating.model_validate(r) for role, r in roles.items()}
+        if self.ratings_path.exists():
+            with open(self.ratings_path, 'r') as f:
+                data = json.load(f)
+            for pid, roles in data.items():
+                deserialized[pid] = {role: PlayerRating.model_validate(r) for role, r in roles.items()}
+
+        for entry in self._read_journal():
+            for r in entry.get("ratings", []):
+                rating = PlayerRating.model_validate(r)
+                deserialized.setdefault(rating.player_id, {})[rating.role] = rating
         return deserialized
+
+    def _read_journal(self) -> List[dict]:
+        if not self.journal_path.exists():
+            return []
+        entries = []
+        with open(self.journal_path, 'r') as f:
+            for line in f:
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue  # Torn entry from a crash
+        return entries
+
+def _write_json_atomic(path: Path, data, indent: Optional[int] = None):
+    tmp_path = path.with_suffix(".json.tmp")
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f, indent=indent)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+def _filename_may_match(name: str, game_filter: GameFilter) -> bool:
+    """
+    Cheap pre-check on the word and timestamp encoded in a game file's name.
+    Only rejects files that certainly don't match.
+    """
+    match = _FILENAME.match(name)
+    if not match:
+        return True
+    stamp, micros, word = match.groups()
+    if game_filter.word is not None and word.upper() != game_filter.word.upper():
+        return False
+    if game_filter.word_length is not None and len(word) != game_filter.word_length:
+        return False
+
+    timestamp = datetime.strptime(stamp, "%Y%m%d_%H%M%S")
+    # Second resolution in older names: the game may be up to a second later
+    resolution = timedelta(microseconds=1) if micros else timedelta(seconds=1)
+    if micros:
+        timestamp += timedelta(microseconds=int(micros))
+    if game_filter.until is not None and timestamp >= game_filter.until:
+        return False
+    if game_filter.since is not None and timestamp + resolution <= game_filter.since:
+        return False
+    return True
@@ -0,0 +1,450 @@
+import json
+import sqlite3
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+from contacteval.game.models import (
+    AttackerSubmission,
+    Contact,
+    GameConfig,
+    GameResult,
+    PlayerRating,
+    Round,
+    TokenUsage
+)
+from contacteval.ranking.system import DifficultyCalibrator
+from contacteval.storage.filters import GameFilter
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    word TEXT NOT NULL,
+    word_length INTEGER NOT NULL,
+    holder_id TEXT NOT NULL,
+    dictionary_id TEXT NOT NULL,
+    max_holder_guesses INTEGER NOT NULL,
+    winner TEXT,
+    holder_score REAL NOT NULL,
+    duration_seconds REAL NOT NULL,
+    timestamp TEXT NOT NULL,
+    game_id TEXT
+);
+CREATE TABLE IF NOT EXISTS game_players (
+    game_id INTEGER NOT NULL REFERENCES games(id),
+    player_id TEXT NOT NULL,
+    role TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    score REAL NOT NULL,
+    PRIMARY KEY (game_id, role, position)
+);
+CREATE TABLE IF NOT EXISTS rounds (
+    game_id INTEGER NOT NULL REFERENCES games(id),
+    round_number INTEGER NOT NULL,
+    prefix TEXT NOT NULL,
+    letter_revealed INTEGER NOT NULL,
+    full_word_guessed_by TEXT,
+    PRIMARY KEY (game_id, round_number)
+);
+CREATE TABLE IF NOT EXISTS submissions (
+    game_id INTEGER NOT NULL REFERENCES games(id),
+    round_number INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    player_id TEXT NOT NULL,
+    prefix_word TEXT,
+    full_word_guess TEXT,
+    auto_assigned INTEGER NOT NULL,
+    PRIMARY KEY (game_id, round_number, position)
+);
+CREATE TABLE IF NOT EXISTS contacts (
+    game_id INTEGER NOT NULL REFERENCES games(id),
+    round_number INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    word TEXT NOT NULL,
+    attacker_ids TEXT NOT NULL,
+    holder_guess TEXT,
+    blocked INTEGER NOT NULL,
+    PRIMARY KEY (game_id, round_number, position)
+);
+CREATE TABLE IF NOT EXISTS usage (
+    game_id INTEGER NOT NULL REFERENCES games(id),
+    round_number INTEGER NOT NULL,   -- 0 for the whole game
+    player_id TEXT NOT NULL,
+    calls INTEGER NOT NULL,
+    input_tokens INTEGER NOT NULL,
+    output_tokens INTEGER NOT NULL,
+    cached_input_tokens INTEGER NOT NULL,
+    seconds REAL NOT NULL,
+    PRIMARY KEY (game_id, round_number, player_id)
+);
+CREATE TABLE IF NOT EXISTS ratings (
+    player_id TEXT NOT NULL,
+    role TEXT NOT NULL,
+    mu REAL NOT NULL,
+    sigma REAL NOT NULL,
+    games_played INTEGER NOT NULL,
+    is_provisional INTEGER NOT NULL,
+    PRIMARY KEY (player_id, role)
+);
+CREATE TABLE IF NOT EXISTS calibration (
+    word TEXT PRIMARY KEY,
+    holder_total REAL NOT NULL,
+    holder_count INTEGER NOT NULL,
+    attacker_total REAL NOT NULL,
+    attacker_count INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_games_word ON games(word COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS idx_games_word_length ON games(word_length);
+CREATE INDEX IF NOT EXISTS idx_games_dictionary ON games(dictionary_id);
+CREATE INDEX IF NOT EXISTS idx_games_timestamp ON games(timestamp);
+CREATE INDEX IF NOT EXISTS idx_game_players_model ON game_players(player_id, role);
+CREATE INDEX IF NOT EXISTS idx_submissions_player ON submissions(player_id);
+"""
+
+class SqliteStorage:
+    """
+    Stores games, rounds, submissions, contacts and ratings in normalized SQLite tables,
+    indexed by model, role, word, dictionary and timestamp.
+
+    Games are buffered and written in one transaction per batch (or after
+    `max_delay` seconds), so several tournaments can share the database in WAL
+    mode without each game waiting on its own fsync. Call `flush()` or `close()`
+    to write the pending batch.
+    """
+
+    # Games rebuilt per query when streaming
+    LOAD_CHUNK = 500
+
+    def __init__(self, base_path: str = "results", batch_size: int = 50, max_delay: float = 2.0):
+        self.base_path = Path(base_path)
+        self.base_path.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.base_path / "contacteval.db"
+        self.batch_size = batch_size
+        self.max_delay = max_delay
+        self._pending: List[GameResult] = []
+        self._pending_ratings: List[PlayerRating] = []
+        self._pending_calibration: List[dict] = []
+        self._last_flush = time.monotonic()
+
+        self.conn = sqlite3.connect(self.db_path, timeout=30.0)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self._migrate()
+
+    def _migrate(self):
+        # Databases created before games carried a schedule id
+        columns = {row["name"] for row in self.conn.execute("PRAGMA table_info(games)")}
+        if "game_id" not in columns:
+            with self.conn:
+                self.conn.execute("ALTER TABLE games ADD COLUMN game_id TEXT")
+
+    # --- Games ---
+
+    def save_game(self, result: GameResult):
+        self._pending.append(result)
+        if len(self._pending) >= self.batch_size or time.monotonic() - self._last_flush >= self.max_delay:
+            self.flush()
+
+    def flush(self):
+        """
+        Writes all buffered games and rating updates in a single transaction.
+        """
+        if self._pending or self._pending_ratings or self._pending_calibration:
+            with self.conn:
+                for result in self._pending:
+                    self._insert_game(result)
+                self._upsert_ratings(self._pending_ratings)
+                self._upsert_calibration(self._pending_calibration)
+            self._pending = []
+            self._pending_ratings = []
+            self._pending_calibration = []
+        self._last_flush = time.monotonic()
+
+    def close(self):
+        self.flush()
+        self.conn.close()
+
+    def _insert_game(self, result: GameResult):
+        config = result.config
+        cur = self.conn.execute(
+            "INSERT INTO games (word, word_length, holder_id, dictionary_id, max_holder_guesses, "
+            "winner, holder_score, duration_seconds, timestamp, game_id) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                config.word, len(config.word), config.holder_id, config.dictionary_id,
+                config.max_holder_guesses, result.winner, result.holder_score,
+                result.duration_seconds, result.timestamp.isoformat(), config.game_id
+            )
+        )
+        game_id = cur.lastrowid
+
+        players = [(game_id, config.holder_id, "holder", 0, result.holder_score)]
+        for i, aid in enumerate(config.attacker_ids):
+            players.append((game_id, aid, "attacker", i, result.attacker_scores.get(aid, 0.0)))
+        self.conn.executemany("INSERT INTO game_players VALUES (?, ?, ?, ?, ?)", players)
+
+        self.conn.executemany(
+            "INSERT INTO rounds VALUES (?, ?, ?, ?, ?)",
+            [
+                (game_id, rd.round_number, rd.prefix, int(rd.letter_revealed), rd.full_word_guessed_by)
+                for rd in result.rounds
+            ]
+        )
+        self.conn.executemany(
+            "INSERT INTO submissions VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                (game_id, rd.round_number, i, s.player_id, s.prefix_word, s.full_word_guess, int(s.auto_assigned))
+                for rd in result.rounds for i, s in enumerate(rd.submissions)
+            ]
+        )
+        self.conn.executemany(
+            "INSERT INTO contacts VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                (game_id, rd.round_number, i, c.word, json.dumps(c.attacker_ids), c.holder_guess, int(c.blocked))
+                for rd in result.rounds for i, c in enumerate(rd.contacts)
+            ]
+        )
+        usage = [(0, pid, u) for pid, u in result.usage.items()]
+        usage += [(rd.round_number, pid, u) for rd in result.rounds for pid, u in rd.usage.items()]
+        self.conn.executemany(
+            "INSERT INTO usage VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (game_id, rn, pid, u.calls, u.input_tokens, u.output_tokens, u.cached_input_tokens, u.seconds)
+                for rn, pid, u in usage
+            ]
+        )
+
+    def find_games(
+        self,
+        model_id: Optional[str] = None,
+        role: Optional[str] = None,
+        word: Optional[str] = None,
+        word_length: Optional[int] = None,
+        dictionary_id: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None
+    ) -> List[dict]:
+        """
+        Returns game summaries matching every given filter, straight from the indexes.
+        With `model_id`, each row also carries that model's role and score.
+        e.g. find_games(model_id="gpt-4o", role="holder", word_length=7)
+        """
+        self.flush()
+        game_filter = GameFilter(
+            model_id=model_id,
+            role=role,
+            word=word,
+            word_length=word_length,
+            dictionary_id=dictionary_id,
+            since=since,
+            until=until
+        )
+        columns = "g.id, g.word, g.holder_id, g.dictionary_id, g.winner, g.holder_score, g.timestamp"
+        if model_id is not None:
+            columns += ", p.role, p.score"
+        joins, where, params = _filter_sql(game_filter)
+        sql = f"SELECT {columns} FROM games g{joins}{where} ORDER BY g.id"
+        return [dict(row) for row in self.conn.execute(sql, params)]
+
+    def iter_games(self, game_filter: Optional[GameFilter] = None, include_rounds: bool = True) -> Iterator[GameResult]:
+        """
+        Streams the games matching the filter in insertion order, rebuilding
+        `LOAD_CHUNK` games per query. Without `include_rounds`, no round,
+        submission or contact rows are read.
+        """
+        self.flush()
+        joins, where, params = _filter_sql(game_filter or GameFilter())
+        ids = [row[0] for row in self.conn.execute(f"SELECT g.id FROM games g{joins}{where} ORDER BY g.id", params)]
+        for i in range(0, len(ids), self.LOAD_CHUNK):
+            chunk = ids[i:i + self.LOAD_CHUNK]
+            placeholders = ", ".join("?" * len(chunk))
+            yield from self._load_games(f"WHERE id IN ({placeholders})", tuple(chunk), include_rounds)
+
+    def load_game(self, game_id: int) -> GameResult:
+        self.flush()
+        games = self._load_games("WHERE id = ?", (game_id,))
+        if not games:
+            raise KeyError(f"No game with id {game_id}")
+        return games[0]
+
+    def load_all_games(self) -> List[GameResult]:
+        return list(self.iter_games())
+
+    def _load_games(self, where: str, params: tuple, include_rounds: bool = True) -> List[GameResult]:
+        game_rows = self.conn.execute(f"SELECT * FROM games {where} ORDER BY id", params).fetchall()
+        if not game_rows:
+            return []
+        # Child rows of the selected games, grouped by game id
+        scope = f"WHERE game_id IN (SELECT id FROM games {where})"
+
+        players: Dict[int, List[sqlite3.Row]] = {}
+        for row in self.conn.execute(f"SELECT * FROM game_players {scope} ORDER BY game_id, role, position", params):
+            players.setdefault(row["game_id"], []).append(row)
+        # (game_id, round_number) -> {player_id: usage}; round 0 is the game total
+        usage: Dict[tuple, Dict[str, TokenUsage]] = {}
+        usage_scope = scope if include_rounds else scope + " AND round_number = 0"
+        for row in self.conn.execute(f"SELECT * FROM usage {usage_scope} ORDER BY game_id, round_number, player_id", params):
+            usage.setdefault((row["game_id"], row["round_number"]), {})[row["player_id"]] = TokenUsage(
+                calls=row["calls"],
+                input_tokens=row["input_tokens"],
+                output_tokens=row["output_tokens"],
+                cached_input_tokens=row["cached_input_tokens"],
+                seconds=row["seconds"]
+            )
+        rounds: Dict[int, List[Round]] = {}
+        if not include_rounds:
+            return self._build_results(game_rows, players, rounds, usage)
+
+        submissions: Dict[tuple, List[AttackerSubmission]] = {}
+        for row in self.conn.execute(f"SELECT * FROM submissions {scope} ORDER BY game_id, round_number, position", params):
+            submissions.setdefault((row["game_id"], row["round_number"]), []).append(AttackerSubmission(
+                player_id=row["player_id"],
+                prefix_word=row["prefix_word"],
+                full_word_guess=row["full_word_guess"],
+                auto_assigned=bool(row["auto_assigned"])
+            ))
+        contacts: Dict[tuple, List[Contact]] = {}
+        for row in self.conn.execute(f"SELECT * FROM contacts {scope} ORDER BY game_id, round_number, position", params):
+            contacts.setdefault((row["game_id"], row["round_number"]), []).append(Contact(
+                word=row["word"],
+                attacker_ids=json.loads(row["attacker_ids"]),
+                holder_guess=row["holder_guess"],
+                blocked=bool(row["blocked"])
+            ))
+        for row in self.conn.execute(f"SELECT * FROM rounds {scope} ORDER BY game_id, round_number", params):
+            key = (row["game_id"], row["round_number"])
+            rounds.setdefault(row["game_id"], []).append(Round(
+                round_number=row["round_number"],
+                prefix=row["prefix"],
+                submissions=submissions.get(key, []),
+                contacts=contacts.get(key, []),
+                letter_revealed=bool(row["letter_revealed"]),
+                full_word_guessed_by=row["full_word_guessed_by"],
+                usage=usage.get(key, {})
+            ))
+        return self._build_results(game_rows, players, rounds, usage)
+
+    @staticmethod
+    def _build_results(
+        game_rows: List[sqlite3.Row],
+        players: Dict[int, List[sqlite3.Row]],
+        rounds: Dict[int, List[Round]],
+        usage: Dict[tuple, Dict[str, TokenUsage]]
+    ) -> List[GameResult]:
+        results = []
+        for row in game_rows:
+            game_id = row["id"]
+            attackers = [p for p in players.get(game_id, []) if p["role"] == "attacker"]
+            results.append(GameResult(
+                config=GameConfig(
+                    word=row["word"],
+                    holder_id=row["holder_id"],
+                    attacker_ids=[p["player_id"] for p in attackers],
+                    max_holder_guesses=row["max_holder_guesses"],
+                    dictionary_id=row["dictionary_id"],
+                    game_id=row["game_id"]
+                ),
+                rounds=rounds.get(game_id, []),
+                winner=row["winner"],
+                holder_score=row["holder_score"],
+                attacker_scores={p["player_id"]: p["score"] for p in attackers},
+                duration_seconds=row["duration_seconds"],
+                timestamp=datetime.fromisoformat(row["timestamp"]),
+                usage=usage.get((game_id, 0), {})
+            ))
+        return results
+
+    # --- Ratings ---
+
+    def save_ratings(
+        self,
+        ratings: Dict[str, Dict[str, PlayerRating]],
+        calibrator: Optional[DifficultyCalibrator] = None
+    ):
+        """
+        Saves the nested ratings dict {player_id: {role: PlayerRating}} and, if
+        given, the word difficulty calibration, in one transaction.
+        """
+        self.flush()
+        with self.conn:
+            self._upsert_ratings([r for roles in ratings.values() for r in roles.values()])
+            if calibrator is not None:
+                self._upsert_calibration(calibrator.word_state(w) for w in calibrator.words)
+
+    def record_rating_updates(self, updates: List[PlayerRating], calibration: Optional[dict] = None):
+        """
+        Queues one game's updated ratings and word calibration state
+        (`DifficultyCalibrator.word_state`); they commit in the same transaction as the game.
+        """
+        self._pending_ratings.extend(updates)
+        if calibration is not None:
+            self._pending_calibration.append(calibration)
+
+    def _upsert_calibration(self, states: Iterable[dict]):
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO calibration VALUES (?, ?, ?, ?, ?)",
+            [(s["word"], *s["holder"], *s["attacker"]) for s in states]
+        )
+
+    def load_calibration(self) -> DifficultyCalibrator:
+        self.flush()
+        data = {"words": [], "holder": {"total": [], "count": []}, "attacker": {"total": [], "count": []}}
+        for row in self.conn.execute("SELECT * FROM calibration"):
+            data["words"].append(row["word"])
+            for role in DifficultyCalibrator.roles:
+                data[role]["total"].append(row[f"{role}_total"])
+                data[role]["count"].append(row[f"{role}_count"])
+        return DifficultyCalibrator.from_dict(data)
+
+    def _upsert_ratings(self, ratings: List[PlayerRating]):
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO ratings VALUES (?, ?, ?, ?, ?, ?)",
+            [(r.player_id, r.role, r.mu, r.sigma, r.games_played, int(r.is_provisional)) for r in ratings]
+        )
+
+    def load_ratings(self) -> Dict[str, Dict[str, PlayerRating]]:
+        self.flush()
+        deserialized = {}
+        for row in self.conn.execute("SELECT * FROM ratings"):
+            deserialized.setdefault(row["player_id"], {})[row["role"]] = PlayerRating(
+                player_id=row["player_id"],
+                role=row["role"],
+                mu=row["mu"],
+                sigma=row["sigma"],
+                games_played=row["games_played"],
+                is_provisional=bool(row["is_provisional"])
+            )
+        return deserialized
+
+def _filter_sql(game_filter: GameFilter) -> tuple:
+    """
+    Translates a GameFilter into (joins, where clause, params) over `games g`.
+    """
+    joins = ""
+    clauses = []
+    params = []
+    if game_filter.model_id is not None:
+        joins = " JOIN game_players p ON p.game_id = g.id"
+        clauses.append("p.player_id = ?")
+        params.append(game_filter.model_id)
+        if game_filter.role is not None:
+            clauses.append("p.role = ?")
+            params.append(game_filter.role)
+    if game_filter.word is not None:
+        clauses.append("g.word = ? COLLATE NOCASE")
+        params.append(game_filter.word)
+    if game_filter.word_length is not None:
+        clauses.append("g.word_length = ?")
+        params.append(game_filter.word_length)
+    if game_filter.dictionary_id is not None:
+        clauses.append("g.dictionary_id = ?")
+        params.append(game_filter.dictionary_id)
+    if game_filter.since is not None:
+        clauses.append("g.timestamp >= ?")
+        params.append(game_filter.since.isoformat())
+    if game_filter.until is not None:
+        clauses.append("g.timestamp < ?")
+        params.append(game_filter.until.isoformat())
+    where = " WHERE " + " AND ".join(clauses) if clauses else ""
+    return joins, where, params
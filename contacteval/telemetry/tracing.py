@@ -0,0 +1,145 @@
+import itertools
+import json
+import os
+import time
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Optional
+
+class Span:
+    """
+    One timed operation. Attributes can be added until the span ends.
+    """
+    __slots__ = ("name", "span_id", "parent_id", "track", "start_ns", "attributes", "_token")
+
+    def __init__(self, name: str, span_id: int, parent: Optional["Span"], attributes: dict):
+        self.name = name
+        self.span_id = span_id
+        self.parent_id = parent.span_id if parent else None
+        # Spans directly under the root start a new track (a row in the trace viewer)
+        if parent is None or parent.parent_id is None:
+            self.track = span_id
+        else:
+            self.track = parent.track
+        self.start_ns = time.perf_counter_ns()
+        self.attributes = attributes
+        self._token = None
+
+    def set(self, **attributes):
+        self.attributes.update(attributes)
+
+    def __enter__(self) -> "Span":
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end_ns = time.perf_counter_ns()
+        _current_span.reset(self._token)
+        if exc_type is not None:
+            self.attributes["error"] = exc_type.__name__
+        tracer = _tracer
+        if tracer is not None:
+            tracer.emit(self, end_ns)
+        return False
+
+class _NoopSpan:
+    """
+    Returned by `span()` while tracing is off: entering and setting attributes do nothing.
+    """
+    __slots__ = ()
+
+    def set(self, **attributes):
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+_NOOP = _NoopSpan()
+_current_span: ContextVar[Optional[Span]] = ContextVar("contacteval_span", default=None)
+_tracer: Optional["Tracer"] = None
+
+class Tracer:
+    """
+    Streams finished spans to a file as they end.
+
+    `*.json` files use the Chrome trace event format (open in chrome://tracing or
+    Perfetto); each game gets its own row. Any other name gets one JSON object per
+    span per line.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.chrome = self.path.suffix == ".json"
+        self._file = open(self.path, "w")
+        self._ids = itertools.count(1)
+        self._pid = os.getpid()
+        self._first = True
+        if self.chrome:
+            self._file.write("[\n")
+
+    def start(self, name: str, attributes: dict) -> Span:
+        return Span(name, next(self._ids), _current_span.get(), attributes)
+
+    def emit(self, span: Span, end_ns: int):
+        if self.chrome:
+            event = {
+                "name": span.name,
+                "ph": "X",
+                "ts": span.start_ns / 1000,
+                "dur": (end_ns - span.start_ns) / 1000,
+                "pid": self._pid,
+                "tid": span.track,
+                "args": span.attributes
+            }
+            self._file.write(("" if self._first else ",\n") + json.dumps(event, default=str))
+            self._first = False
+        else:
+            self._file.write(json.dumps({
+                "name": span.name,
+                "span_id": span.span_id,
+                "parent_id": span.parent_id,
+                "start_ns": span.start_ns,
+                "duration_ns": end_ns - span.start_ns,
+                "attributes": span.attributes
+            }, default=str) + "\n")
+
+    def close(self):
+        if self._file.closed:
+            return
+        if self.chrome:
+            self._file.write("\n]\n")
+        self._file.close()
+
+def span(name: str, **attributes):
+    """
+    Context manager timing a block as a child of the current span:
+
+        with span("round", prefix_length=2) as s:
+            ...
+            s.set(contacts=1)
+
+    A shared no-op object while tracing is disabled.
+    """
+    tracer = _tracer
+    if tracer is None:
+        return _NOOP
+    return tracer.start(name, attributes)
+
+def tracing_enabled() -> bool:
+    return _tracer is not None
+
+def enable_tracing(path: str) -> Tracer:
+    global _tracer
+    disable_tracing()
+    _tracer = Tracer(path)
+    return _tracer
+
+def disable_tracing():
+    global _tracer
+    if _tracer is not None:
+        _tracer.close()
+        _tracer = None
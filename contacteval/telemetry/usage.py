@@ -0,0 +1,87 @@
+import json
+from contextvars import ContextVar
+from typing import Dict, Iterable, Optional
+from pydantic import BaseModel
+from contacteval.game.models import GameResult, TokenUsage
+
+# player_id -> usage, for the round being played in the current task
+_round_usage: ContextVar[Optional[Dict[str, TokenUsage]]] = ContextVar("contacteval_round_usage", default=None)
+
+def start_round_usage() -> Dict[str, TokenUsage]:
+    """
+    Starts collecting API usage for a round in the current task. Tasks spawned
+    from it (e.g. concurrent attacker calls) record into the same dict.
+    """
+    usage: Dict[str, TokenUsage] = {}
+    _round_usage.set(usage)
+    return usage
+
+def record_usage(player_id: str, usage: TokenUsage):
+    """
+    Adds one API call's usage to the current round, if one is being collected.
+    """
+    collected = _round_usage.get()
+    if collected is not None:
+        collected[player_id] = collected.get(player_id, TokenUsage()) + usage
+
+def merge_usage(usages: Iterable[Dict[str, TokenUsage]]) -> Dict[str, TokenUsage]:
+    total: Dict[str, TokenUsage] = {}
+    for usage in usages:
+        for player_id, u in usage.items():
+            total[player_id] = total.get(player_id, TokenUsage()) + u
+    return total
+
+def usage_by_model(results: Iterable[GameResult]) -> Dict[str, TokenUsage]:
+    return merge_usage(r.usage for r in results)
+
+def usage_by_round_number(results: Iterable[GameResult]) -> Dict[int, TokenUsage]:
+    """
+    Usage summed over all players per round number, showing how prompts grow
+    with the history as games get longer.
+    """
+    totals: Dict[int, TokenUsage] = {}
+    for result in results:
+        for rd in result.rounds:
+            for u in rd.usage.values():
+                totals[rd.round_number] = totals.get(rd.round_number, TokenUsage()) + u
+    return dict(sorted(totals.items()))
+
+class ModelPrice(BaseModel):
+    """
+    USD per million tokens.
+    """
+    input: float = 0.0
+    output: float = 0.0
+    cached_input: Optional[float] = None   # Defaults to the input price
+
+class PriceTable:
+    """
+    Prices per model, loaded from JSON:
+    {"gpt-4o": {"input": 2.5, "output": 10.0, "cached_input": 1.25}, ...}
+    Keys are matched against the model name from models.json, then the provider model id.
+    """
+
+    def __init__(self, prices: Optional[Dict[str, ModelPrice]] = None):
+        self.prices = prices or {}
+
+    @classmethod
+    def from_file(cls, path: str) -> "PriceTable":
+        with open(path, "r") as f:
+            data = json.load(f)
+        return cls({model: ModelPrice.model_validate(price) for model, price in data.items()})
+
+    def lookup(self, *keys: Optional[str]) -> Optional[ModelPrice]:
+        for key in keys:
+            if key is not None and key in self.prices:
+                return self.prices[key]
+        return None
+
+    @staticmethod
+    def cost(price: ModelPrice, usage: TokenUsage) -> float:
+        cached_price = price.input if price.cached_input is None else price.cached_input
+        uncached = usage.input_tokens - usage.cached_input_tokens
+        return (
+            uncached * price.input
+            + usage.cached_input_tokens * cached_price
+            + usage.output_tokens * price.output
+        ) / 1_000_000
@@ -0,0 +1,122 @@
+import math
+import random
+from typing import Dict, List, Optional
+from contacteval.game.models import GameConfig, PlayerRating
+from contacteval.ranking.system import DifficultyCalibrator, normal_cdf
+
+ROLES = ["holder", "attacker"]
+DEFAULT_SIGMA = PlayerRating.model_fields["sigma"].default
+
+class AdaptiveScheduler:
+    """
+    Picks each batch of games from the current ratings, favouring the players
+    whose next game is expected to teach us the most:
+
+      gain(p)      = sigma^4 / (sigma^2 + v)    variance removed by one more observation
+      ambiguity(p) = 2 * max over rank neighbours q of P(p and q are in the wrong order)
+      value(p)     = gain(p) * (1 + ambiguity(p))
+
+    A game is worth the values of its holder and three attackers. Within a batch,
+    every planned game shrinks its players' sigma as the update would, so the
+    batch spreads over players instead of repeating the single best lineup.
+
+    The word is picked after the lineup, among `word_candidates` per game: the
+    one whose calibrated holder difficulty puts the holder's expected block rate
+    (mu + d) closest to 0.5, where the outcome is least predictable.
+    """
+
+    def __init__(
+        self,
+        model_ids: List[str],
+        dictionary_id: str,
+        noise_variance: float = 4.0,
+        word_candidates: int = 3,
+        seed: Optional[int] = None
+    ):
+        if len(model_ids) < 4:
+            raise ValueError("Need at least 4 models for a standard 3 v 1 game.")
+        self.model_ids = model_ids
+        self.dictionary_id = dictionary_id
+        self.noise_variance = noise_variance
+        self.word_candidates = word_candidates
+        self.rng = random.Random(seed)
+
+    def next_batch(
+        self,
+        ratings: Dict[str, Dict[str, PlayerRating]],
+        words: List[str],
+        batch_size: int,
+        calibrator: Optional[DifficultyCalibrator] = None
+    ) -> List[GameConfig]:
+        """
+        Plans up to `batch_size` games, each on a different word of `words`.
+        Without a calibrator, or between equally good words, `words` is used in order.
+        """
+        # role -> player -> (mu, variance), planned games already applied to the variance
+        state = {
+            role: {m: self._belief(ratings, m, role) for m in self.model_ids}
+            for role in ROLES
+        }
+        candidates = list(words)
+        configs = []
+        for _ in range(min(batch_size, len(candidates))):
+            values = {role: self._values(state[role]) for role in ROLES}
+            # Random order first so equal values don't always pick the same models
+            order = self.rng.sample(self.model_ids, len(self.model_ids))
+
+            holder = max(order, key=lambda m: values["holder"][m])
+            attackers = sorted(
+                (m for m in order if m != holder),
+                key=lambda m: values["attacker"][m],
+                reverse=True
+            )[:3]
+
+            word = self._pick_word(candidates, state["holder"][holder][0], calibrator)
+            candidates.remove(word)
+
+            self._observe(state["holder"], holder)
+            for m in attackers:
+                self._observe(state["attacker"], m)
+            configs.append(GameConfig(
+                word=word,
+                holder_id=holder,
+                attacker_ids=attackers,
+                dictionary_id=self.dictionary_id
+            ))
+        return configs
+
+    def _pick_word(self, words: List[str], holder_mu: float, calibrator: Optional[DifficultyCalibrator]) -> str:
+        if calibrator is None:
+            return words[0]
+
+        def spread(word: str) -> float:
+            rate = min(max(holder_mu + calibrator.get_difficulty(word.upper(), "holder"), 0.0), 1.0)
+            return rate * (1 - rate)
+        # max keeps the first of equal words, so uncalibrated ones stay in sampler order
+        return max(words, key=spread)
+
+    def _belief(self, ratings, player_id: str, role: str):
+        rating = ratings.get(player_id, {}).get(role)
+        if rating is None:
+            return (0.0, DEFAULT_SIGMA ** 2)
+        return (rating.mu, rating.sigma ** 2)
+
+    def _observe(self, beliefs, player_id: str):
+        mu, var = beliefs[player_id]
+        beliefs[player_id] = (mu, var * self.noise_variance / (var + self.noise_variance))
+
+    def _values(self, beliefs) -> Dict[str, float]:
+        # Ambiguity only needs neighbours in mu order: farther players are ranked more surely
+        ranked = sorted(beliefs, key=lambda m: beliefs[m][0])
+        ambiguity = {m: 0.0 for m in ranked}
+        for a, b in zip(ranked, ranked[1:]):
+            (mu_a, var_a), (mu_b, var_b) = beliefs[a], beliefs[b]
+            p_swap = normal_cdf(-abs(mu_b - mu_a) / math.sqrt(var_a + var_b))
+            ambiguity[a] = max(ambiguity[a], p_swap)
+            ambiguity[b] = max(ambiguity[b], p_swap)
+
+        values = {}
+        for m, (_, var) in beliefs.items():
+            gain = var * var / (var + self.noise_variance)
+            values[m] = gain * (1 + 2 * ambiguity[m])  # P(swap) <= 0.5
+        return values
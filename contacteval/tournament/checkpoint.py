@@ -0,0 +1,99 @@
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional, Set
+from contacteval.game.models import GameConfig, GameResult
+from contacteval.storage.json_store import JsonStorage
+from contacteval.tournament.scheduler import assign_game_ids
+
+class ScheduleCheckpoint:
+    """
+    A tournament schedule persisted next to its results, so an interrupted run
+    can be resumed:
+
+      schedule.jsonl    one GameConfig per line, in schedule order, with its game_id
+      completed.txt     ids of the games stored so far, appended as each is recorded
+
+    Games that failed or timed out get no marker and are played again on resume.
+    A game stored just before a crash, without its marker, is found in the
+    storage instead, so resuming never plays (and rates) it twice.
+    """
+
+    def __init__(self, results_dir: str):
+        self.results_dir = Path(results_dir)
+        self.schedule_path = self.results_dir / "schedule.jsonl"
+        self.completed_path = self.results_dir / "completed.txt"
+        self._completed_file = None
+
+    def exists(self) -> bool:
+        return self.schedule_path.exists()
+
+    def start(self, configs: List[GameConfig]) -> List[GameConfig]:
+        """
+        Persists a new schedule, replacing any previous one, and returns its configs with ids.
+        """
+        configs = assign_game_ids(configs)
+        self.results_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.schedule_path.with_suffix(".jsonl.tmp")
+        with open(tmp_path, "w") as f:
+            for config in configs:
+                f.write(config.model_dump_json() + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        # Clear old markers first: they name games of the previous schedule
+        self.completed_path.unlink(missing_ok=True)
+        os.replace(tmp_path, self.schedule_path)
+        return configs
+
+    def load(self) -> List[GameConfig]:
+        with open(self.schedule_path, "r") as f:
+            return [GameConfig.model_validate_json(line) for line in f if line.strip()]
+
+    def completed_ids(self) -> Set[str]:
+        if not self.completed_path.exists():
+            return set()
+        with open(self.completed_path, "r") as f:
+            lines = f.read().split("\n")
+        # The last element is "" or a line torn by a crash mid-write
+        return set(lines[:-1])
+
+    def remaining(self, storage: Optional[JsonStorage] = None) -> List[GameConfig]:
+        """
+        Scheduled games without a completion marker, in schedule order. With `storage`,
+        games it already holds from this schedule are left out too.
+        """
+        done = self.completed_ids()
+        configs = [c for c in self.load() if c.game_id not in done]
+        if storage is not None and configs:
+            stored = self.stored_ids(storage, configs)
+            configs = [c for c in configs if c.game_id not in stored]
+        return configs
+
+    def stored_ids(self, storage: JsonStorage, configs: List[GameConfig]) -> Set[str]:
+        """
+        Ids of the given scheduled games that `storage` already holds.
+        """
+        # Ids restart with every schedule: only games played since this one started count
+        started = datetime.fromtimestamp(self.schedule_path.stat().st_mtime)
+        by_id = {c.game_id: c for c in configs}
+        stored = set()
+        for game in storage.iter_games(include_rounds=False):
+            config = by_id.get(game.config.game_id)
+            if config is not None and game.config == config and game.timestamp >= started:
+                stored.add(config.game_id)
+        return stored
+
+    def mark_completed(self, result: GameResult):
+        if result.config.game_id is None:
+            return
+        if self._completed_file is None:
+            self._completed_file = open(self.completed_path, "a")
+        self._completed_file.write(result.config.game_id + "\n")
+        self._completed_file.flush()
+        os.fsync(self._completed_file.fileno())
+
+    def close(self):
+        if self._completed_file is not None:
+            self._completed_file.close()
+            self._completed_file = None
@@ -0,0 +1,71 @@
+import logging
+import time
+from typing import Callable, Iterable, List, Optional
+from pydantic import BaseModel
+from contacteval.game.engine import GameEngine
+from contacteval.game.models import GameResult
+from contacteval.players.replay import replay_players
+
+logger = logging.getLogger(__name__)
+
+class ReplayReport(BaseModel):
+    """
+    Outcome of re-running stored games through the engine.
+    """
+    games: int = 0
+    rounds: int = 0
+    diverged: List[int] = []     # Positions of games whose rounds or scores changed
+    failed: List[int] = []       # Positions of games that could not be replayed
+    seconds: float = 0.0
+
+    @property
+    def games_per_second(self) -> float:
+        return self.games / self.seconds if self.seconds else 0.0
+
+    @property
+    def rounds_per_second(self) -> float:
+        return self.rounds / self.seconds if self.seconds else 0.0
+
+def same_outcome(stored: GameResult, replayed: GameResult) -> bool:
+    """
+    True if the replay produced the stored rounds, winner and scores. API usage
+    is not part of the outcome: replayed moves cost nothing.
+    """
+    return (
+        _moves(replayed) == _moves(stored)
+        and replayed.winner == stored.winner
+        and replayed.holder_score == stored.holder_score
+        and replayed.attacker_scores == stored.attacker_scores
+    )
+
+def _moves(result: GameResult) -> List[dict]:
+    return [r.model_dump(exclude={"usage"}) for r in result.rounds]
+
+async def replay_games(
+    engine: GameEngine,
+    games: Iterable[GameResult],
+    on_result: Optional[Callable[[GameResult], None]] = None
+) -> ReplayReport:
+    """
+    Re-runs each stored game with ReplayPlayers and compares it to the original.
+    Replayed results (which follow the current rules) are passed to `on_result`,
+    e.g. to re-score the history.
+    """
+    report = ReplayReport()
+    start = time.perf_counter()
+    for position, stored in enumerate(games):
+        holder, attackers = replay_players(stored)
+        try:
+            replayed = await engine.run_game(stored.config, holder, attackers)
+        except Exception as e:
+            logger.warning(f"Could not replay game {position} (word {stored.config.word}): {e}")
+            report.failed.append(position)
+            continue
+        report.games += 1
+        report.rounds += len(replayed.rounds)
+        if not same_outcome(stored, replayed):
+            report.diverged.append(position)
+        if on_result is not None:
+            on_result(replayed)
+    report.seconds = time.perf_counter() - start
+    return report
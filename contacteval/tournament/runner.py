@@ -1,13 +1,18 @@
 import asyncio
 import logging
-from typing import Dict, List
+from contextlib import AsyncExitStack
+from typing import Callable, Dict, List, Optional
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
-from contacteval.game.engine import GameEngine
+from contacteval.game.engine import GameEngine, GameTimeoutError
 from contacteval.game.models import GameConfig, GameResult
 from contacteval.players.base import Player
 from contacteval.ranking.leaderboard import LeaderboardManager
 from contacteval.storage.json_store import JsonStorage
+from contacteval.telemetry.tracing import span
+from contacteval.tournament.adaptive import AdaptiveScheduler
+from contacteval.tournament.stopping import ConvergenceMonitor
 from contacteval.words.bank import Dictionary
+from contacteval.words.sampler import WordSampler
 
 logger = logging.getLogger(__name__)
 
@@ -15,27 +20,59 @@ class TournamentRunner:
     """
     Executes a series of games and updates the leaderboard.
     """
-    
+
     def __init__(
-        self, 
-        players: Dict[str, Player], 
-        dictionary: Dictionary, 
+        self,
+        players: Dict[str, Player],
+        dictionary: Dictionary,
         storage: JsonStorage,
-        leaderboard: LeaderboardManager
+        leaderboard: LeaderboardManager,
+        concurrency: int = 1,
+        per_model_concurrency: Optional[int] = None,
+        snapshot_every: int = 100,
+        rated: bool = True,
+        game_timeout: Optional[float] = None
     ):
         self.players = players
         self.dictionary = dictionary
         self.storage = storage
         self.leaderboard = leaderboard
-        self.engine = GameEngine(dictionary)
+        self.engine = GameEngine(dictionary, game_timeout=game_timeout)
+        # Max games in flight overall, and per model (None = only the global limit)
+        self.concurrency = max(1, concurrency)
+        self.per_model_concurrency = per_model_concurrency
+        # Games between full ratings snapshots; each game in between is journaled
+        self.snapshot_every = snapshot_every
+        # Unrated runs (e.g. answered from the response cache) store games but leave ratings alone
+        self.rated = rated
+        # Why the last batched run ended early (None: it played its whole budget)
+        self.stop_reason: Optional[str] = None
 
-    async def run_tournament(self, configs: List[GameConfig]):
+    async def run_tournament(
+        self,
+        configs: List[GameConfig],
+        on_record: Optional[Callable[[GameResult], None]] = None
+    ):
         """
-        Runs multiple games concurrently (with rate limiting if needed).
-        For now, let's run them sequentially or in small batches to avoid API limits.
+        Runs the games concurrently, bounded by the global and per-model limits.
+        Games may finish in any order, but results are stored and rated in schedule
+        order, so the leaderboard matches a sequential run over the same results.
+        `on_record` is called after each game is stored and rated, once the storage
+        has flushed it.
         """
         results = []
-        
+        global_slots = asyncio.Semaphore(self.concurrency)
+        model_slots = {}
+        if self.per_model_concurrency:
+            model_slots = {
+                pid: asyncio.Semaphore(self.per_model_concurrency) for pid in self.players
+            }
+
+        # Finished games waiting for all earlier games: index -> result (None if failed)
+        finished: Dict[int, Optional[GameResult]] = {}
+        next_to_apply = 0
+        in_flight = 0
+
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -43,27 +80,160 @@ class TournamentRunner:
             TaskProgressColumn(),
         ) as progress:
             task = progress.add_task("[cyan]Running games...", total=len(configs))
-            
-            for config in configs:
-                progress.update(task, description=f"[cyan]Game: {config.word}")
-                
+
+            def describe(config: GameConfig):
+                if self.concurrency == 1:
+                    progress.update(task, description=f"[cyan]Game: {config.word}")
+                else:
+                    progress.update(task, description=f"[cyan]Games in flight: {in_flight}")
+
+            def apply_ready():
+                nonlocal next_to_apply
+                recorded = []
+                while next_to_apply in finished:
+                    result = finished.pop(next_to_apply)
+                    next_to_apply += 1
+                    if result is None:
+                        continue
+                    try:
+                        with span("record", word=result.config.word, rated=self.rated):
+                            self._record(result, results)
+                        recorded.append(result)
+                    except Exception as e:
+                        logger.error(f"Failed to record game for word {result.config.word}: {e}")
+                if not (on_record and recorded):
+                    return
+                # Buffering backends must hold the games before anyone is told they are stored
+                try:
+                    self.storage.flush()
+                except Exception as e:
+                    logger.error(f"Failed to flush {len(recorded)} recorded games: {e}")
+                    return
+                for result in recorded:
+                    on_record(result)
+
+            async def play(index: int, config: GameConfig):
+                nonlocal in_flight
+                result = None
                 try:
                     holder = self.players[config.holder_id]
                     attackers = [self.players[aid] for aid in config.attacker_ids]
-                    
-                    result = await self.engine.run_game(config, holder, attackers)
-                    
-                    # Store result
-                    self.storage.save_game(result)
-                    
-                    # Update leaderboard
-                    self.leaderboard.process_game(result)
-                    self.storage.save_ratings(self.leaderboard.ratings)
-                    
-                    results.append(result)
+
+                    async with AsyncExitStack() as stack:
+                        # Acquire model slots in a fixed order so games can't deadlock
+                        with span("wait_for_slots", word=config.word):
+                            for pid in sorted({config.holder_id, *config.attacker_ids}):
+                                if pid in model_slots:
+                                    await stack.enter_async_context(model_slots[pid])
+                            await stack.enter_async_context(global_slots)
+
+                        in_flight += 1
+                        describe(config)
+                        try:
+                            result = await self.engine.run_game(config, holder, attackers)
+                        finally:
+                            in_flight -= 1
+                except GameTimeoutError as e:
+                    logger.warning(str(e))
                 except Exception as e:
                     logger.error(f"Failed to run game for word {config.word}: {e}")
-                
+
+                finished[index] = result
+                apply_ready()
+                describe(config)
                 progress.advance(task)
-                
+
+            with span("tournament", games=len(configs), concurrency=self.concurrency):
+                await asyncio.gather(*(play(i, config) for i, config in enumerate(configs)))
+
+        if self.rated:
+            self.storage.save_ratings(self.leaderboard.ratings, self.leaderboard.calibrator)
         return results
+
+    async def run_batched(
+        self,
+        configs: List[GameConfig],
+        batch_size: int = 20,
+        monitor: Optional[ConvergenceMonitor] = None,
+        on_record: Optional[Callable[[GameResult], None]] = None
+    ) -> List[GameResult]:
+        """
+        Plays a fixed schedule in batches, stopping early once `monitor` reports
+        convergence. The reason is left in `stop_reason`.
+        """
+        batches = (configs[i:i + batch_size] for i in range(0, len(configs), batch_size))
+        return await self._run_batches(
+            lambda size: next(batches, []), len(configs), batch_size, monitor, on_record
+        )
+
+    async def run_adaptive(
+        self,
+        scheduler: AdaptiveScheduler,
+        word_sampler: WordSampler,
+        total_games: int,
+        batch_size: int = 20,
+        monitor: Optional[ConvergenceMonitor] = None,
+        on_record: Optional[Callable[[GameResult], None]] = None
+    ) -> List[GameResult]:
+        """
+        Plays up to `total_games` games in batches, each planned by `scheduler` from
+        the ratings after the previous batch. Secret words are drawn per batch, so a
+        stratified sampler sees the difficulty calibration so far, and the
+        scheduler chooses each game's word among several drawn candidates.
+        """
+        return await self._run_batches(
+            lambda size: scheduler.next_batch(
+                self.leaderboard.ratings,
+                word_sampler.sample(size * scheduler.word_candidates),
+                size,
+                self.leaderboard.calibrator
+            ),
+            total_games, batch_size, monitor, on_record
+        )
+
+    async def _run_batches(
+        self,
+        next_batch: Callable[[int], List[GameConfig]],
+        total_games: int,
+        batch_size: int,
+        monitor: Optional[ConvergenceMonitor],
+        on_record: Optional[Callable[[GameResult], None]]
+    ) -> List[GameResult]:
+        if not self.rated:
+            raise ValueError("Batched runs read the ratings between batches and need a rated run")
+        self.stop_reason = None
+        results = []
+        played = 0
+        batch_number = 0
+        while played < total_games:
+            configs = next_batch(min(batch_size, total_games - played))
+            if not configs:
+                break
+            with span("batch", number=batch_number, games=len(configs)) as batch_span:
+                results.extend(await self.run_tournament(configs, on_record=on_record))
+                played += len(configs)
+                batch_number += 1
+                reason = monitor.check(self.leaderboard.ratings) if monitor else None
+                batch_span.set(stop_reason=reason)
+            if reason:
+                self.stop_reason = reason
+                logger.info(f"Stopping after {played} of {total_games} games: {reason}")
+                break
+        return results
+
+    def _record(self, result: GameResult, results: List[GameResult]):
+        """
+        Stores a finished game and, in rated runs, applies its rating updates.
+        """
+        self.storage.save_game(result)
+        results.append(result)
+        if not self.rated:
+            return
+
+        # Update leaderboard
+        updates = self.leaderboard.process_game(result)
+        self.storage.record_rating_updates(
+            updates, self.leaderboard.calibrator.word_state(result.config.word.upper())
+        )
+        if len(results) % self.snapshot_every == 0:
+            self.storage.save_ratings(self.leaderboard.ratings, self.leaderboard.calibrator)
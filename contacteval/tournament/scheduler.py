@@ -1,45 +1,86 @@
-import itertools
 import random
-from typing import List, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 from contacteval.game.models import GameConfig
 
+SCHEDULERS = ["uniform", "adaptive"]
+
 class TournamentScheduler:
     """
     Generates game configurations for a tournament with role rotation.
     """
     
-    def __init__(self, model_ids: List[str], dictionary_id: str):
+    def __init__(self, model_ids: List[str], dictionary_id: str, seed: Optional[int] = None):
         self.model_ids = model_ids
         self.dictionary_id = dictionary_id
+        self.rng = random.Random(seed)
+
+    def total_games(self, games_per_model_as_attacker: int) -> int:
+        # Total attacker slots needed = N_models * games_per_model_as_attacker
+        # Games needed = total_slots / 3
+        return (len(self.model_ids) * games_per_model_as_attacker) // 3
 
     def generate_games(self, words: List[str], games_per_model_as_attacker: int = 30) -> List[GameConfig]:
         """
         Creates a list of GameConfigs such that each model plays the Attacker role 
         approximately the requested number of times, rotating through all models.
         """
+        return list(self.iter_games(words, games_per_model_as_attacker))
+
+    def iter_games(self, words: List[str], games_per_model_as_attacker: int = 30) -> Iterator[GameConfig]:
+        """
+        Builds matchups one game at a time, greedily balancing:
+          1. holder and attacker counts (every model within one game of the others per role)
+          2. how often two models have shared a game, so pairings spread evenly
+
+        Time is O(games x models) and memory O(models + games); no permutations
+        of the model list are materialized.
+        """
         if len(self.model_ids) < 4:
             raise ValueError("Need at least 4 models for a standard 3 v 1 game.")
 
-        configs = []
-        # Total attacker slots needed = N_models * games_per_model_as_attacker
-        # Games needed = total_slots / 3
-        total_games = (len(self.model_ids) * games_per_model_as_attacker) // 3
-        
-        # Round-robin combinations
-        # We pick 1 holder and 3 attackers from N models
-        combinations = list(itertools.permutations(self.model_ids, 4))
-        random.shuffle(combinations)
-        
-        # Cycle through words and combinations
-        for i in range(total_games):
-            word = words[i % len(words)]
-            combo = combinations[i % len(combinations)]
-            
-            configs.append(GameConfig(
-                word=word,
-                holder_id=combo[0],
-                attacker_ids=list(combo[1:]),
+        holder_counts = {m: 0 for m in self.model_ids}
+        attacker_counts = {m: 0 for m in self.model_ids}
+        # Unordered pair -> games played together; only pairs that have met are stored
+        together: Dict[Tuple[str, str], int] = {}
+
+        def pair(a: str, b: str) -> Tuple[str, str]:
+            return (a, b) if a < b else (b, a)
+
+        for i in range(self.total_games(games_per_model_as_attacker)):
+            # A fresh random order breaks ties differently every game
+            order = self.rng.sample(self.model_ids, len(self.model_ids))
+            holder = min(order, key=lambda m: holder_counts[m])
+
+            lineup = [holder]
+            for _ in range(3):
+                attacker = min(
+                    (m for m in order if m not in lineup),
+                    key=lambda m: (
+                        attacker_counts[m],
+                        sum(together.get(pair(m, other), 0) for other in lineup)
+                    )
+                )
+                lineup.append(attacker)
+
+            holder_counts[holder] += 1
+            for m in lineup[1:]:
+                attacker_counts[m] += 1
+            for a in range(4):
+                for b in range(a + 1, 4):
+                    key = pair(lineup[a], lineup[b])
+                    together[key] = together.get(key, 0) + 1
+
+            yield GameConfig(
+                word=words[i % len(words)],
+                holder_id=holder,
+                attacker_ids=lineup[1:],
                 dictionary_id=self.dictionary_id
-            ))
-            
-        return configs
+            )
+
+def assign_game_ids(configs: List[GameConfig]) -> List[GameConfig]:
+    """
+    Copies of the configs with their schedule position as `game_id`, zero-padded
+    so that ids sort in schedule order.
+    """
+    width = len(str(max(len(configs) - 1, 0)))
+    return [c.model_copy(update={"game_id": f"{i:0{width}d}"}) for i, c in enumerate(configs)]
@@ -0,0 +1,301 @@
+import asyncio
+import json
+import logging
+import os
+import socket
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+from pydantic import BaseModel
+from contacteval.game.models import GameConfig, GameResult
+from contacteval.players.base import Player
+from contacteval.ranking.leaderboard import LeaderboardManager
+from contacteval.storage.game_log import GameLogStorage
+from contacteval.storage.json_store import JsonStorage
+from contacteval.tournament.runner import TournamentRunner
+from contacteval.tournament.scheduler import assign_game_ids
+from contacteval.words.bank import Dictionary
+
+logger = logging.getLogger(__name__)
+
+class ShardPlan(BaseModel):
+    """
+    Tournament-wide settings every worker needs, stored as plan.json in the queue.
+    """
+    dictionary_file: str
+    dictionary_id: str
+    models_file: str
+    total_games: int
+    unit_size: int
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+class ShardQueue:
+    """
+    File-based work queue for running one tournament on many processes or hosts
+    sharing a filesystem:
+
+      plan.json                     shared settings
+      pending/unit_000001.json      unclaimed work units (a slice of the schedule)
+      claimed/unit_000001.json.W    claimed by worker W
+      done/unit_000001.json.W       completed by worker W
+      failed/unit_000001.json.W     games of the unit that worker W could not play
+      results/W/                    games played by worker W (append-only game log)
+
+    Claims are atomic renames, so exactly one worker wins each unit. Games carry
+    their schedule position as `game_id`, so the merge can apply them in schedule
+    order regardless of which worker played them, or when. A unit with games
+    that errored or timed out goes to failed/ with just those games, until
+    `retry_failed` puts it back in the queue.
+    """
+
+    def __init__(self, root: str):
+        self.root = Path(root)
+        self.pending = self.root / "pending"
+        self.claimed = self.root / "claimed"
+        self.done = self.root / "done"
+        self.failed = self.root / "failed"
+        self.results = self.root / "results"
+
+    @property
+    def plan_path(self) -> Path:
+        return self.root / "plan.json"
+
+    def create(self, configs: List[GameConfig], plan: ShardPlan):
+        """
+        Splits the schedule into units of `plan.unit_size` games.
+        """
+        if self.plan_path.exists():
+            raise FileExistsError(f"{self.root} already holds a plan")
+        for directory in (self.pending, self.claimed, self.done, self.failed, self.results):
+            directory.mkdir(parents=True, exist_ok=True)
+
+        configs = assign_game_ids(configs)
+        for unit_start in range(0, len(configs), plan.unit_size):
+            unit = [c.model_dump() for c in configs[unit_start:unit_start + plan.unit_size]]
+            path = self.pending / f"unit_{unit_start // plan.unit_size:06d}.json"
+            _write_atomic(path, json.dumps(unit))
+        # Written last: workers only start once every unit exists
+        _write_atomic(self.plan_path, plan.model_dump_json())
+
+    def load_plan(self) -> ShardPlan:
+        with open(self.plan_path, "r") as f:
+            return ShardPlan.model_validate_json(f.read())
+
+    def claim(self, worker_id: str) -> Optional[Tuple[str, List[GameConfig]]]:
+        """
+        Claims the next pending unit; returns (unit name, configs) or None when none are left.
+        """
+        for path in sorted(self.pending.glob("unit_*.json")):
+            target = self.claimed / f"{path.name}.{worker_id}"
+            try:
+                os.rename(path, target)
+            except FileNotFoundError:
+                continue  # Another worker got it first
+            # Renames keep the mtime of when the unit was planned; stale checks need the claim time
+            os.utime(target)
+            with open(target, "r") as f:
+                return path.name, [GameConfig.model_validate(c) for c in json.load(f)]
+        return None
+
+    def heartbeat(self, unit: str, worker_id: str):
+        """
+        Marks a claimed unit as still being worked on.
+        """
+        try:
+            os.utime(self.claimed / f"{unit}.{worker_id}")
+        except FileNotFoundError:
+            pass
+
+    def complete(self, unit: str, worker_id: str) -> bool:
+        """
+        Moves a claimed unit to done. False if it was requeued in the meantime;
+        its games are kept and deduplicated on merge.
+        """
+        try:
+            os.rename(self.claimed / f"{unit}.{worker_id}", self.done / f"{unit}.{worker_id}")
+        except FileNotFoundError:
+            return False
+        return True
+
+    def fail(self, unit: str, worker_id: str, configs: List[GameConfig]) -> bool:
+        """
+        Moves a claimed unit to failed, keeping only the games in `configs` (the
+        ones not played). False if it was requeued in the meantime.
+        """
+        target = self.failed / f"{unit}.{worker_id}"
+        try:
+            os.rename(self.claimed / f"{unit}.{worker_id}", target)
+        except FileNotFoundError:
+            return False
+        # The temporary file stays outside the unit directories, where it could be claimed
+        _write_atomic(target, json.dumps([c.model_dump() for c in configs]), self.root / f"{unit}.{worker_id}.tmp")
+        return True
+
+    def retry_failed(self) -> int:
+        """
+        Puts failed units back in the queue, to play their missing games again.
+        """
+        retried = 0
+        for path in self.failed.glob("unit_*.json.*"):
+            unit = path.name.split(".json.")[0] + ".json"
+            try:
+                os.rename(path, self.pending / unit)
+            except FileNotFoundError:
+                continue
+            retried += 1
+        return retried
+
+    def unfinished_game_ids(self) -> List[str]:
+        """
+        Ids of the games in pending, claimed or failed units, in schedule order.
+        """
+        game_ids = []
+        for directory in (self.pending, self.claimed, self.failed):
+            for path in directory.glob("unit_*"):
+                try:
+                    with open(path, "r") as f:
+                        game_ids.extend(c["game_id"] for c in json.load(f))
+                except FileNotFoundError:
+                    continue  # Moved by a worker while we looked
+        return sorted(set(game_ids))
+
+    def requeue_stale(self, max_age: float) -> int:
+        """
+        Puts back units claimed more than `max_age` seconds ago (e.g. by a crashed worker).
+        """
+        requeued = 0
+        now = time.time()
+        for path in self.claimed.glob("unit_*.json.*"):
+            try:
+                if now - path.stat().st_mtime < max_age:
+                    continue
+                unit = path.name.split(".json.")[0] + ".json"
+                os.rename(path, self.pending / unit)
+                requeued += 1
+            except FileNotFoundError:
+                continue
+        return requeued
+
+    def status(self) -> Dict[str, int]:
+        return {
+            "pending": sum(1 for _ in self.pending.glob("unit_*.json")),
+            "claimed": sum(1 for _ in self.claimed.glob("unit_*")),
+            "done": sum(1 for _ in self.done.glob("unit_*")),
+            "failed": sum(1 for _ in self.failed.glob("unit_*"))
+        }
+
+    def worker_storage(self, worker_id: str) -> GameLogStorage:
+        return GameLogStorage(str(self.results / worker_id))
+
+    def iter_results(self) -> Iterator[GameResult]:
+        """
+        Streams every game any worker has stored.
+        """
+        if not self.results.exists():
+            return
+        for worker_dir in sorted(p for p in self.results.iterdir() if p.is_dir()):
+            yield from GameLogStorage(str(worker_dir)).iter_games()
+
+async def run_worker(
+    queue: ShardQueue,
+    worker_id: str,
+    players: Dict[str, Player],
+    dictionary: Dictionary,
+    concurrency: int = 1,
+    per_model_concurrency: Optional[int] = None,
+    game_timeout: Optional[float] = None,
+    requeue_after: Optional[float] = None,
+    heartbeat_every: float = 30.0
+) -> int:
+    """
+    Claims and plays units until the queue is empty; returns the number of games played.
+    Games are stored unrated in the worker's own log; `merge_results` rates them.
+    Units with games that could not be played are moved to failed, not done.
+    """
+    storage = queue.worker_storage(worker_id)
+    played = 0
+    try:
+        while True:
+            if requeue_after:
+                requeued = queue.requeue_stale(requeue_after)
+                if requeued:
+                    logger.warning(f"Requeued {requeued} stale units")
+            claimed = queue.claim(worker_id)
+            if claimed is None:
+                break
+            unit, configs = claimed
+            runner = TournamentRunner(
+                players, dictionary, storage, LeaderboardManager(),
+                concurrency=concurrency,
+                per_model_concurrency=per_model_concurrency,
+                rated=False,
+                game_timeout=game_timeout
+            )
+            beat = asyncio.create_task(_heartbeat(queue, unit, worker_id, heartbeat_every))
+            try:
+                results = await runner.run_tournament(configs)
+            finally:
+                beat.cancel()
+            played_ids = {r.config.game_id for r in results}
+            unplayed = [c for c in configs if c.game_id not in played_ids]
+            if unplayed:
+                logger.warning(f"{len(unplayed)} of {len(configs)} games in {unit} could not be played")
+                finished = queue.fail(unit, worker_id, unplayed)
+            else:
+                finished = queue.complete(unit, worker_id)
+            if not finished:
+                logger.warning(f"{unit} was requeued while {worker_id} played it")
+            played += len(results)
+    finally:
+        storage.close()
+    return played
+
+async def _heartbeat(queue: ShardQueue, unit: str, worker_id: str, interval: float):
+    while True:
+        await asyncio.sleep(interval)
+        queue.heartbeat(unit, worker_id)
+
+def merge_results(
+    queue: ShardQueue,
+    storage: JsonStorage,
+    leaderboard: LeaderboardManager,
+    snapshot_every: int = 100
+) -> List[GameResult]:
+    """
+    Stores and rates every sharded game in schedule order. A game played twice
+    (its unit was requeued after a worker stalled) counts once. Games of units
+    that never finished are listed as missing in the merge marker.
+    """
+    marker = queue.root / "merged"
+    if marker.exists():
+        raise FileExistsError(f"{queue.root} has already been merged")
+
+    by_id: Dict[str, GameResult] = {}
+    for result in queue.iter_results():
+        game_id = result.config.game_id
+        if game_id is not None and game_id not in by_id:
+            by_id[game_id] = result
+
+    merged = [by_id[game_id] for game_id in sorted(by_id)]
+    missing = [game_id for game_id in queue.unfinished_game_ids() if game_id not in by_id]
+    if missing:
+        logger.warning(f"Merging without {len(missing)} unplayed games: {', '.join(missing)}")
+    for i, result in enumerate(merged, 1):
+        storage.save_game(result)
+        updates = leaderboard.process_game(result)
+        storage.record_rating_updates(updates, leaderboard.calibrator.word_state(result.config.word.upper()))
+        if i % snapshot_every == 0:
+            storage.save_ratings(leaderboard.ratings, leaderboard.calibrator)
+    storage.save_ratings(leaderboard.ratings, leaderboard.calibrator)
+    _write_atomic(marker, json.dumps({"games": len(merged), "missing": missing}))
+    return merged
+
+def _write_atomic(path: Path, text: str, tmp_path: Optional[Path] = None):
+    tmp_path = tmp_path or path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, "w") as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
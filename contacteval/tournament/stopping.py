@@ -0,0 +1,74 @@
+import math
+from typing import Dict, List, Optional, Tuple
+from pydantic import BaseModel
+from contacteval.game.models import PlayerRating
+from contacteval.ranking.system import normal_cdf
+
+ROLES = ["attacker", "holder"]
+DEFAULT_SIGMA = PlayerRating.model_fields["sigma"].default
+
+class StoppingRule(BaseModel):
+    """
+    Convergence criteria checked between batches; the tournament stops at the
+    first one met. Unset criteria are ignored.
+    """
+    max_sigma: Optional[float] = None        # Every model's sigma, in both roles, at or below this
+    top_k: Optional[int] = None              # The top k of both leaderboards ...
+    stable_batches: int = 3                  # ... unchanged for this many batches in a row
+    rank_confidence: Optional[float] = None  # P(correct order) of every pair of rank neighbours
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_sigma is not None or self.top_k is not None or self.rank_confidence is not None
+
+class ConvergenceMonitor:
+    """
+    Evaluates a StoppingRule after each batch. Models without a rating yet count
+    as unconverged (default sigma, tied at mu 0).
+    """
+
+    def __init__(self, rule: StoppingRule, model_ids: List[str]):
+        self.rule = rule
+        self.model_ids = model_ids
+        self._top_history: List[Tuple[Tuple[str, ...], ...]] = []
+
+    def check(self, ratings: Dict[str, Dict[str, PlayerRating]]) -> Optional[str]:
+        """
+        Returns why the tournament should stop, or None to keep going.
+        """
+        by_role = {role: [self._rating(ratings, m, role) for m in self.model_ids] for role in ROLES}
+        rule = self.rule
+
+        if rule.max_sigma is not None:
+            worst = max(r.sigma for role in ROLES for r in by_role[role])
+            if worst <= rule.max_sigma:
+                return f"every sigma is at or below {rule.max_sigma} (max {worst:.2f})"
+
+        if rule.top_k is not None:
+            top = tuple(
+                tuple(r.player_id for r in sorted(by_role[role], key=lambda r: r.display_rating, reverse=True)[:rule.top_k])
+                for role in ROLES
+            )
+            self._top_history.append(top)
+            recent = self._top_history[-(rule.stable_batches + 1):]
+            if len(recent) == rule.stable_batches + 1 and all(t == top for t in recent):
+                return f"top {rule.top_k} unchanged for {rule.stable_batches} batches"
+
+        if rule.rank_confidence is not None:
+            weakest = min(self._pair_confidence(by_role[role]) for role in ROLES)
+            if weakest >= rule.rank_confidence:
+                return f"every neighbouring pair is ordered with confidence >= {rule.rank_confidence} (min {weakest:.3f})"
+
+        return None
+
+    def _rating(self, ratings, player_id: str, role: str) -> PlayerRating:
+        rating = ratings.get(player_id, {}).get(role)
+        return rating or PlayerRating(player_id=player_id, role=role, sigma=DEFAULT_SIGMA)
+
+    def _pair_confidence(self, role_ratings: List[PlayerRating]) -> float:
+        ranked = sorted(role_ratings, key=lambda r: r.mu)
+        confidence = 1.0
+        for a, b in zip(ranked, ranked[1:]):
+            spread = math.sqrt(a.sigma ** 2 + b.sigma ** 2)
+            confidence = min(confidence, normal_cdf((b.mu - a.mu) / spread))
+        return confidence
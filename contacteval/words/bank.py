@@ -1,41 +1,89 @@
 import json
 import random
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
 from typing import Set
+from contacteval.words.compiled import MappedWords, is_compiled
+
+# Sorts after any character that can follow a prefix
+_MAX_CHAR = chr(0x10FFFF)
 
 class Dictionary:
     """
     Manages the word bank and provides validation/random selection.
     """
-    
-    def __init__(self, words: list[str]):
-        # Store as uppercase for consistent comparison
-        self.all_words = {w.upper() for w in words}
-        # Pre-index by prefix for efficiency (optional, but good for large lists)
-        self._prefix_index = {}
-        for w in self.all_words:
-            for i in range(1, len(w) + 1):
-                prefix = w[:i]
-                if prefix not in self._prefix_index:
-                    self._prefix_index[prefix] = []
-                self._prefix_index[prefix].append(w)
+
+    def __init__(self, words: list[str] | Sequence, dictionary_id: str | None = None, presorted: bool = False):
+        # Store as uppercase for consistent comparison. Sorted, so the words sharing
+        # any prefix form one contiguous range found by bisection
+        self.words = words if presorted else sorted({w.upper() for w in words})
+        self.dictionary_id = dictionary_id
 
     @classmethod
-    def from_file(cls, filepath: str):
+    def from_file(cls, filepath: str, dictionary_id: str | None = None):
         with open(filepath, 'r') as f:
             words = json.load(f)
-        return cls(words)
+        return cls(words, dictionary_id)
+
+    @classmethod
+    def open_compiled(cls, filepath: str):
+        """
+        Opens a dictionary compiled with `contacteval dict compile` via mmap: no parsing or sorting.
+        """
+        words = MappedWords(filepath)
+        return cls(words, words.dictionary_id, presorted=True)
+
+    @classmethod
+    def load(cls, filepath: str, dictionary_id: str | None = None):
+        """
+        Opens either a compiled dictionary (which carries its own id) or a JSON word list.
+        """
+        if is_compiled(filepath):
+            return cls.open_compiled(filepath)
+        return cls.from_file(filepath, dictionary_id)
+
+    def _bounds(self, prefix: str) -> tuple[int, int]:
+        if prefix and isinstance(self.words, MappedWords):
+            return self.words.first_char_range(prefix)
+        return 0, len(self.words)
 
     def is_valid(self, word: str) -> bool:
-        return word.upper() in self.all_words
+        word = word.upper()
+        lo, hi = self._bounds(word)
+        i = bisect_left(self.words, word, lo, hi)
+        return i < hi and self.words[i] == word
+
+    def prefix_range(self, prefix: str) -> tuple[int, int]:
+        """
+        Returns the [start, end) positions in `words` of the words starting with prefix.
+        """
+        prefix = prefix.upper()
+        lo, hi = self._bounds(prefix)
+        return bisect_left(self.words, prefix, lo, hi), bisect_right(self.words, prefix + _MAX_CHAR, lo, hi)
+
+    def count_matches(self, prefix: str) -> int:
+        start, end = self.prefix_range(prefix)
+        return end - start
 
     def get_matches(self, prefix: str, exclude: Set[str] = None) -> list[str]:
         exclude = exclude or set()
-        prefix = prefix.upper()
-        matches = self._prefix_index.get(prefix, [])
-        return [m for m in matches if m not in exclude]
+        start, end = self.prefix_range(prefix)
+        return [m for m in self.words[start:end] if m not in exclude]
 
     def get_random_word(self, prefix: str, exclude: Set[str] = None) -> str | None:
-        matches = self.get_matches(prefix, exclude)
+        exclude = exclude or set()
+        start, end = self.prefix_range(prefix)
+        if start == end:
+            return None
+
+        # Rejection sampling stays uniform over the allowed words and, while few
+        # of them are excluded, never builds the match list
+        for _ in range(8):
+            word = self.words[random.randrange(start, end)]
+            if word not in exclude:
+                return word
+
+        matches = [m for m in self.words[start:end] if m not in exclude]
         if not matches:
             return None
         return random.choice(matches)
@@ -0,0 +1,126 @@
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Iterable
+
+MAGIC = b"CEDICT\x00\x00"
+FORMAT_VERSION = 1
+
+# magic, format version, word count, dictionary_id length, first-character table length
+_HEADER = struct.Struct("<8sIIII")
+_FIRST_CHAR = struct.Struct("<III")  # codepoint, start, end
+
+def compile_dictionary(words: Iterable[str], dictionary_id: str, path: str) -> Path:
+    """
+    Writes a word list as a compiled dictionary artifact:
+
+      header | dictionary_id | first-character ranges | word offsets | word blob
+
+    Words are de-duplicated, uppercased and sorted, so prefix lookups are bisections
+    over the offsets. The first-character table narrows every lookup to one letter's
+    range before bisecting. All integers are little-endian u32.
+    """
+    sorted_words = sorted({w.upper() for w in words})
+    encoded = [w.encode("utf-8") for w in sorted_words]
+
+    offsets = array("I", [0])
+    for word in encoded:
+        offsets.append(offsets[-1] + len(word))
+
+    first_chars = []
+    for i, word in enumerate(sorted_words):
+        cp = ord(word[0]) if word else 0
+        if first_chars and first_chars[-1][0] == cp:
+            first_chars[-1][2] = i + 1
+        else:
+            first_chars.append([cp, i, i + 1])
+
+    id_bytes = dictionary_id.encode("utf-8")
+    id_bytes += b"\x00" * (-len(id_bytes) % 4)  # Keep the u32 sections aligned
+
+    if sys.byteorder != "little":
+        offsets.byteswap()
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, len(sorted_words), len(dictionary_id.encode("utf-8")), len(first_chars)))
+        f.write(id_bytes)
+        for entry in first_chars:
+            f.write(_FIRST_CHAR.pack(*entry))
+        f.write(offsets.tobytes())
+        for word in encoded:
+            f.write(word)
+    os.replace(tmp_path, path)
+    return path
+
+def is_compiled(path: str) -> bool:
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+class MappedWords(Sequence):
+    """
+    Read-only sorted word sequence backed by a memory-mapped compiled dictionary.
+    Pages are shared between every process that opens the same file.
+    """
+
+    def __init__(self, path: str):
+        self._file = open(path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, count, id_len, n_first = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a compiled dictionary")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"{path} has format version {version}, expected {FORMAT_VERSION}")
+
+        pos = _HEADER.size
+        self.dictionary_id = self._mm[pos:pos + id_len].decode("utf-8")
+        pos += id_len + (-id_len % 4)
+
+        self._first_chars = {}
+        for _ in range(n_first):
+            cp, start, end = _FIRST_CHAR.unpack_from(self._mm, pos)
+            self._first_chars[cp] = (start, end)
+            pos += _FIRST_CHAR.size
+
+        offsets_size = (count + 1) * 4
+        if sys.byteorder == "little":
+            self._offsets = memoryview(self._mm)[pos:pos + offsets_size].cast("I")
+        else:
+            self._offsets = array("I", self._mm[pos:pos + offsets_size])
+            self._offsets.byteswap()
+        self._blob_start = pos + offsets_size
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self._count))]
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError(i)
+        base = self._blob_start
+        return self._mm[base + self._offsets[i]:base + self._offsets[i + 1]].decode("utf-8")
+
+    def first_char_range(self, prefix: str) -> tuple[int, int]:
+        """
+        Returns the [start, end) range of words sharing the prefix's first character.
+        """
+        if not prefix:
+            return 0, self._count
+        return self._first_chars.get(ord(prefix[0]), (0, 0))
+
+    def close(self):
+        if isinstance(self._offsets, memoryview):
+            self._offsets.release()
+        self._mm.close()
+        self._file.close()
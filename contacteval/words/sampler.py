@@ -0,0 +1,150 @@
+import math
+import random
+from typing import Dict, List, Optional
+from pydantic import BaseModel
+from contacteval.ranking.system import MIN_DIFFICULTY_OBSERVATIONS, DifficultyCalibrator
+from contacteval.words.bank import Dictionary
+
+WORD_SAMPLERS = ["random", "stratified"]
+
+class WordFeatures(BaseModel):
+    word: str
+    length: int
+    branching: float     # Geometric mean of the dictionary words matching each revealed prefix
+
+class WordSampler:
+    """
+    Draws secret words for upcoming games.
+
+    "random" samples the dictionary uniformly. "stratified" works on a candidate
+    pool whose features are computed once, and on every draw:
+      1. tops up words that have been played but not yet often enough for the
+         calibrator to report their difficulty (closest to the threshold first);
+      2. fills the rest round-robin from difficulty bands (quantiles), so easy and
+         hard words are played in equal measure.
+
+    A word's difficulty is its calibrated attacker difficulty once available.
+    Before that it is the mean calibrated difficulty of words with the same
+    length and branching tercile, or 0 (the calibrator's own default).
+    """
+
+    def __init__(
+        self,
+        dictionary: Dictionary,
+        calibrator: DifficultyCalibrator,
+        strategy: str = "stratified",
+        bands: int = 4,
+        pool_size: int = 5000,
+        top_up_share: float = 0.5,
+        seed: Optional[int] = None
+    ):
+        if strategy not in WORD_SAMPLERS:
+            raise ValueError(f"Unknown word sampler: {strategy}")
+        self.dictionary = dictionary
+        self.calibrator = calibrator
+        self.strategy = strategy
+        self.bands = max(1, bands)
+        self.top_up_share = top_up_share
+        self.rng = random.Random(seed)
+        self.features: Dict[str, WordFeatures] = {}
+        self._used = set()
+        self._next_band = 0
+        self._bands_key = None       # (calibrator, version) the cached bands were ranked with
+        self._bands: List[List[str]] = []
+        if strategy == "stratified":
+            words = dictionary.words
+            indices = range(len(words)) if len(words) <= pool_size else self.rng.sample(range(len(words)), pool_size)
+            for i in indices:
+                self.features[words[i]] = self._compute_features(words[i])
+            self._branching_cuts = _terciles(sorted(f.branching for f in self.features.values()))
+
+    def _compute_features(self, word: str) -> WordFeatures:
+        counts = [self.dictionary.count_matches(word[:k]) for k in range(1, len(word))] or [1]
+        branching = math.exp(sum(math.log(max(c, 1)) for c in counts) / len(counts))
+        return WordFeatures(word=word, length=len(word), branching=branching)
+
+    def observations(self, word: str) -> int:
+        """
+        Observations of the word in its least-observed role.
+        """
+        return min(self.calibrator.get_count(word, role) for role in ("holder", "attacker"))
+
+    def sample(self, n: int) -> List[str]:
+        if self.strategy == "random":
+            words = self.dictionary.words
+            return self.rng.sample(words, min(len(words), max(n, 0)))
+
+        picked = self._top_up(int(n * self.top_up_share))
+        bands = self.difficulty_bands()
+        while len(picked) < n:
+            band = bands[self._next_band % len(bands)]
+            self._next_band += 1
+            fresh = [w for w in band if w not in self._used]
+            if not fresh:
+                # Every word of the band has been played: start over on it
+                self._used.difference_update(band)
+                fresh = band
+            word = self.rng.choice(fresh)
+            self._used.add(word)
+            picked.append(word)
+        return picked
+
+    def _top_up(self, limit: int) -> List[str]:
+        if limit <= 0:
+            return []
+        pending = []
+        for word in self.calibrator.words:
+            # Persisted calibration can span several dictionaries
+            if not self.dictionary.is_valid(word):
+                continue
+            observed = self.observations(word)
+            if 0 < observed < MIN_DIFFICULTY_OBSERVATIONS:
+                pending.append((-observed, word))
+        pending.sort()
+        return [word for _, word in pending[:limit]]
+
+    def difficulty(self, word: str, strata: Optional[Dict[tuple, float]] = None) -> float:
+        if self.calibrator.get_count(word, "attacker") >= MIN_DIFFICULTY_OBSERVATIONS:
+            return self.calibrator.get_difficulty(word, "attacker")
+        features = self.features.get(word) or self._compute_features(word)
+        strata = self._strata_means() if strata is None else strata
+        return strata.get(self._stratum(features), 0.0)
+
+    def difficulty_bands(self) -> List[List[str]]:
+        """
+        The candidate pool split into equal-sized bands, easiest (for attackers) last.
+        Cached until the calibrator changes.
+        """
+        key = (id(self.calibrator), self.calibrator.version)
+        if key != self._bands_key:
+            self._bands = self._rank_bands()
+            self._bands_key = key
+        return self._bands
+
+    def _rank_bands(self) -> List[List[str]]:
+        strata = self._strata_means()
+        # Ties (e.g. nothing calibrated yet) fall back to the word features
+        ranked = sorted(
+            self.features,
+            key=lambda w: (self.difficulty(w, strata), self.features[w].length, self.features[w].branching, w)
+        )
+        size = math.ceil(len(ranked) / self.bands)
+        return [ranked[i:i + size] for i in range(0, len(ranked), size)]
+
+    def _stratum(self, features: WordFeatures) -> tuple:
+        tercile = sum(features.branching > cut for cut in self._branching_cuts)
+        return (features.length, tercile)
+
+    def _strata_means(self) -> Dict[tuple, float]:
+        totals: Dict[tuple, List[float]] = {}
+        for word, features in self.features.items():
+            if self.calibrator.get_count(word, "attacker") >= MIN_DIFFICULTY_OBSERVATIONS:
+                totals.setdefault(self._stratum(features), []).append(
+                    self.calibrator.get_difficulty(word, "attacker")
+                )
+        return {stratum: sum(values) / len(values) for stratum, values in totals.items()}
+
+def _terciles(values: List[float]) -> List[float]:
+    if not values:
+        return []
+    return [values[len(values) // 3], values[2 * len(values) // 3]]
@@ -0,0 +1,82 @@
+import asyncio
+from contacteval.game.models import AttackerSubmission, PlayerRating
+from contacteval.players.base import Player
+from contacteval.ranking.leaderboard import LeaderboardManager
+from contacteval.ranking.system import MIN_DIFFICULTY_OBSERVATIONS, DifficultyCalibrator
+from contacteval.storage.json_store import JsonStorage
+from contacteval.tournament.adaptive import AdaptiveScheduler
+from contacteval.tournament.runner import TournamentRunner
+from contacteval.words.bank import Dictionary
+from contacteval.words.sampler import WordSampler
+
+IDS = ["A", "B", "C", "D", "E", "F"]
+WORDS = ["APPLE", "BANANA", "CHERRY", "DATE", "ELDER", "FIG"]
+
+class Solver(Player):
+    """
+    Guesses the only test word that starts with the prefix.
+    """
+    async def submit_attacker_guess(self, prefix, history, error_msg=None) -> AttackerSubmission:
+        word = next(w for w in WORDS if w.startswith(prefix))
+        return AttackerSubmission(player_id=self.name, full_word_guess=word)
+
+    async def submit_holder_guess(self, prefix, history, num_contacts) -> str:
+        return ""
+
+def _ratings(**beliefs):
+    ratings = {}
+    for pid, (mu, sigma) in beliefs.items():
+        ratings[pid] = {
+            role: PlayerRating(player_id=pid, role=role, mu=mu, sigma=sigma) for role in ["holder", "attacker"]
+        }
+    return ratings
+
+def test_uncertain_players_are_picked_first():
+    scheduler = AdaptiveScheduler(IDS, "test", seed=0)
+    ratings = _ratings(A=(0, 1), B=(3, 1), C=(6, 1), D=(9, 1), E=(0, 5), F=(0, 4))
+    game = scheduler.next_batch(ratings, ["WORD"], 1)[0]
+    assert game.holder_id == "E"
+    assert game.attacker_ids[0] == "F"
+
+def test_ambiguous_rankings_beat_settled_ones():
+    scheduler = AdaptiveScheduler(IDS, "test", seed=0)
+    # Same sigma everywhere: C and D are nearly tied, the rest are far apart
+    ratings = _ratings(A=(-20, 1), B=(-10, 1), C=(0, 1), D=(0.1, 1), E=(10, 1), F=(20, 1))
+    game = scheduler.next_batch(ratings, ["WORD"], 1)[0]
+    assert {game.holder_id, *game.attacker_ids} >= {"C", "D"}
+
+def test_batch_spreads_over_players():
+    scheduler = AdaptiveScheduler(IDS, "test", seed=0)
+    batch = scheduler.next_batch({}, ["W1", "W2", "W3"], 3)
+    assert [g.word for g in batch] == ["W1", "W2", "W3"]
+    assert len({g.holder_id for g in batch}) == 3
+
+def test_words_with_unpredictable_outcomes_are_picked_first():
+    scheduler = AdaptiveScheduler(IDS, "test", seed=0)
+    calibrator = DifficultyCalibrator()
+    # With mu 0.2 the holder should block 25% of EASY rounds, 55% of EVEN ones, 95% of HARD ones
+    # and, as far as we know, 20% of NEW ones
+    for word, d in [("EASY", 0.05), ("EVEN", 0.35), ("HARD", 0.75)]:
+        for _ in range(MIN_DIFFICULTY_OBSERVATIONS):
+            calibrator.add_observation(word, "holder", d)
+    ratings = _ratings(**{pid: (0.2, 1) for pid in IDS})
+
+    batch = scheduler.next_batch(ratings, ["EASY", "HARD", "EVEN", "NEW"], 2, calibrator)
+    assert [g.word for g in batch] == ["EVEN", "EASY"]
+    # Without calibration the candidates are used in order
+    assert [g.word for g in scheduler.next_batch(ratings, ["EASY", "HARD", "EVEN"], 2)] == ["EASY", "HARD"]
+
+def test_runner_plays_adaptive_batches(tmp_path):
+    players = {pid: Solver(pid) for pid in IDS}
+    leaderboard = LeaderboardManager()
+    runner = TournamentRunner(players, Dictionary(WORDS), JsonStorage(str(tmp_path)), leaderboard)
+    scheduler = AdaptiveScheduler(IDS, "test", seed=0)
+
+    sampler = WordSampler(Dictionary(WORDS), leaderboard.calibrator, strategy="random", seed=0)
+
+    results = asyncio.run(runner.run_adaptive(scheduler, sampler, total_games=10, batch_size=4))
+    assert len(results) == 10
+    sigmas = [r.sigma for pid in IDS for r in leaderboard.ratings[pid].values()]
+    # Every player and role got observed, none far more than the others
+    assert len(sigmas) == 2 * len(IDS)
+    assert max(sigmas) - min(sigmas) < 1.5
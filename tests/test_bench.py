@@ -0,0 +1,28 @@
+import asyncio
+import random
+from contacteval.bench.suite import BenchScenario, append_results, bench_engine, bench_runner, load_previous
+from contacteval.players.synthetic import LatencyModel
+from contacteval.words.bank import Dictionary
+
+WORDS = ["CAT", "CAR", "CART", "CARTS", "COT", "COG", "DOG", "DOT", "DOVE", "DOVES", "EGG", "EGGS"]
+
+def test_latency_models():
+    rng = random.Random(1)
+    assert LatencyModel(kind="fixed", seconds=0.2).sample(rng) == 0.2
+    samples = [LatencyModel(kind="heavy-tail", seconds=0.01, cap=1.0).sample(rng) for _ in range(500)]
+    assert min(samples) >= 0.01 and max(samples) <= 1.0
+
+def test_bench_targets_and_result_log(tmp_path):
+    dictionary = Dictionary(WORDS)
+    scenario = BenchScenario(name="tiny", games=12, contact_rate=1.0, invalid_rate=0.2, concurrency=4)
+
+    engine = asyncio.run(bench_engine(scenario, dictionary))
+    runner = asyncio.run(bench_runner(scenario, dictionary))
+    assert engine.games == runner.games == 12
+    assert engine.rounds > 0 and engine.p99_game_seconds >= engine.p50_game_seconds
+
+    path = tmp_path / "bench.jsonl"
+    append_results(str(path), [engine, runner])
+    previous = load_previous(str(path))
+    assert previous[("tiny", "engine")] == engine
+    assert previous[("tiny", "runner")] == runner
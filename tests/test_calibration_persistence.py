@@ -0,0 +1,87 @@
+import asyncio
+import pytest
+from contacteval.game.models import AttackerSubmission, GameConfig
+from contacteval.players.base import Player
+from contacteval.ranking.leaderboard import LeaderboardManager
+from contacteval.ranking.system import DifficultyCalibrator
+from contacteval.storage.factory import STORAGE_BACKENDS, open_storage
+from contacteval.storage.json_store import JsonStorage
+from contacteval.tournament.runner import TournamentRunner
+from contacteval.words.bank import Dictionary
+
+WORDS = ["APPLE", "BANANA", "CHERRY"]
+IDS = ["A", "B", "C", "D"]
+
+def _configs(n):
+    return [
+        GameConfig(word=WORDS[i % 3], holder_id=IDS[i % 4],
+                   attacker_ids=[p for p in IDS if p != IDS[i % 4]], dictionary_id="test")
+        for i in range(n)
+    ]
+
+class Solver(Player):
+    """
+    Guesses the only test word that starts with the prefix.
+    """
+    async def submit_attacker_guess(self, prefix, history, error_msg=None) -> AttackerSubmission:
+        word = next(w for w in WORDS if w.startswith(prefix))
+        return AttackerSubmission(player_id=self.name, full_word_guess=word)
+
+    async def submit_holder_guess(self, prefix, history, num_contacts) -> str:
+        return ""
+
+def _play(storage, leaderboard, configs, snapshot_every=100):
+    players = {pid: Solver(pid) for pid in IDS}
+    runner = TournamentRunner(
+        players, Dictionary(WORDS), storage, leaderboard, snapshot_every=snapshot_every
+    )
+    asyncio.run(runner.run_tournament(configs))
+
+def test_array_state_round_trips():
+    calibrator = DifficultyCalibrator()
+    calibrator.add_observation("APPLE", "holder", 1.5)
+    calibrator.add_observation("APPLE", "attacker", -0.5)
+    calibrator.add_observation("FIG", "attacker", 2.0)
+
+    restored = DifficultyCalibrator.from_dict(calibrator.to_dict())
+    assert restored.stats == calibrator.stats == {
+        "APPLE": {"holder": {"total": 1.5, "count": 1}, "attacker": {"total": -0.5, "count": 1}},
+        "FIG": {"attacker": {"total": 2.0, "count": 1}}
+    }
+    restored.add_observation("FIG", "attacker", 1.0)
+    assert restored.get_count("FIG", "attacker") == 2
+    assert calibrator.get_count("FIG", "attacker") == 1
+
+@pytest.mark.parametrize("backend", STORAGE_BACKENDS)
+def test_calibration_survives_restart(tmp_path, backend):
+    # Snapshots every 7 games leave a journal tail (or pending batch) at the end
+    storage = open_storage(backend, str(tmp_path))
+    leaderboard = LeaderboardManager()
+    _play(storage, leaderboard, _configs(24), snapshot_every=7)
+    storage.close()
+
+    storage = open_storage(backend, str(tmp_path))
+    resumed = LeaderboardManager()
+    resumed.ratings = storage.load_ratings()
+    resumed.calibrator = storage.load_calibration()
+    assert resumed.calibrator.stats == leaderboard.calibrator.stats
+    # 24 games over 3 words: difficulty is active, as in the uninterrupted run
+    difficulty = leaderboard.calibrator.get_difficulty("APPLE", "attacker")
+    assert difficulty != 0.0
+    assert resumed.calibrator.get_difficulty("APPLE", "attacker") == difficulty
+
+    _play(storage, resumed, _configs(6))
+    storage.close()
+    straight = LeaderboardManager()
+    _play(JsonStorage(str(tmp_path / "straight")), straight, _configs(24) + _configs(6))
+    assert resumed.calibrator.stats == straight.calibrator.stats
+
+def test_snapshot_without_calibrator_keeps_journaled_state(tmp_path):
+    storage = JsonStorage(str(tmp_path))
+    calibrator = DifficultyCalibrator()
+    calibrator.add_observation("APPLE", "holder", 1.0)
+    storage.record_rating_updates([], calibrator.word_state("APPLE"))
+
+    storage.save_ratings({})
+    assert storage.journal_path.read_text() == ""
+    assert storage.load_calibration().stats == calibrator.stats
@@ -0,0 +1,143 @@
+import asyncio
+import time
+from contacteval.game.models import AttackerSubmission, GameConfig
+from contacteval.players.base import Player
+from contacteval.ranking.leaderboard import LeaderboardManager
+from contacteval.storage.game_log import GameLogStorage
+from contacteval.storage.sqlite_store import SqliteStorage
+from contacteval.tournament.checkpoint import ScheduleCheckpoint
+from contacteval.tournament.runner import TournamentRunner
+from contacteval.words.bank import Dictionary
+
+WORDS = ["APPLE", "BANANA", "CHERRY", "DATE", "ELDER", "FIG"]
+IDS = ["A", "B", "C", "D"]
+
+def _configs():
+    return [
+        GameConfig(
+            word=w, holder_id=IDS[i % 4],
+            attacker_ids=[p for p in IDS if p != IDS[i % 4]], dictionary_id="test"
+        )
+        for i, w in enumerate(WORDS)
+    ]
+
+class Solver(Player):
+    """
+    Guesses the only test word that starts with the prefix.
+    """
+    async def submit_attacker_guess(self, prefix, history, error_msg=None) -> AttackerSubmission:
+        word = next(w for w in WORDS if w.startswith(prefix))
+        return AttackerSubmission(player_id=self.name, full_word_guess=word)
+
+    async def submit_holder_guess(self, prefix, history, num_contacts) -> str:
+        return ""
+
+def _players():
+    return {pid: Solver(pid) for pid in IDS}
+
+def _run(results_dir, configs, checkpoint):
+    storage = GameLogStorage(str(results_dir))
+    leaderboard = LeaderboardManager()
+    leaderboard.ratings = storage.load_ratings()
+    runner = TournamentRunner(_players(), Dictionary(WORDS), storage, leaderboard)
+    try:
+        asyncio.run(runner.run_tournament(configs, on_record=checkpoint.mark_completed))
+    finally:
+        checkpoint.close()
+        storage.close()
+    return leaderboard
+
+def test_schedule_round_trips_with_ids(tmp_path):
+    checkpoint = ScheduleCheckpoint(str(tmp_path))
+    assert not checkpoint.exists()
+    configs = checkpoint.start(_configs())
+    assert [c.game_id for c in configs] == ["0", "1", "2", "3", "4", "5"]
+    assert checkpoint.load() == configs
+    assert checkpoint.remaining() == configs
+
+def test_torn_marker_is_ignored(tmp_path):
+    checkpoint = ScheduleCheckpoint(str(tmp_path))
+    checkpoint.start(_configs())
+    checkpoint.completed_path.write_text("0\n1\n2")  # Crash while writing "2\n"
+    assert checkpoint.completed_ids() == {"0", "1"}
+    assert [c.word for c in checkpoint.remaining()] == WORDS[2:]
+
+def test_resume_plays_remaining_games_only(tmp_path):
+    uninterrupted = ScheduleCheckpoint(str(tmp_path / "full"))
+    full = _run(tmp_path / "full", uninterrupted.start(_configs()), uninterrupted)
+
+    # Interrupted after four games, then resumed from the persisted schedule
+    checkpoint = ScheduleCheckpoint(str(tmp_path / "crash"))
+    configs = checkpoint.start(_configs())
+    _run(tmp_path / "crash", configs[:4], checkpoint)
+
+    resumed = ScheduleCheckpoint(str(tmp_path / "crash"))
+    remaining = resumed.remaining()
+    assert [c.word for c in remaining] == WORDS[4:]
+    board = _run(tmp_path / "crash", remaining, resumed)
+
+    assert resumed.remaining() == []
+    stored = list(GameLogStorage(str(tmp_path / "crash")).iter_games(include_rounds=False))
+    assert [g.config.game_id for g in stored] == [c.game_id for c in configs]
+    for pid in full.ratings:
+        for role, rating in full.ratings[pid].items():
+            assert board.ratings[pid][role] == rating
+
+class Crash(BaseException):
+    pass
+
+def test_sqlite_crash_keeps_markers_behind_stored_games(tmp_path):
+    checkpoint = ScheduleCheckpoint(str(tmp_path))
+    configs = checkpoint.start(_configs())
+    # A batch that would never fill or time out on its own
+    storage = SqliteStorage(str(tmp_path), batch_size=1000, max_delay=3600)
+
+    def mark_then_crash(result):
+        checkpoint.mark_completed(result)
+        if len(checkpoint.completed_ids()) == 4:
+            raise Crash()
+
+    runner = TournamentRunner(_players(), Dictionary(WORDS), storage, LeaderboardManager())
+    try:
+        asyncio.run(runner.run_tournament(configs, on_record=mark_then_crash))
+    except Crash:
+        pass  # Neither the storage nor the checkpoint gets closed
+
+    resumed = ScheduleCheckpoint(str(tmp_path))
+    storage = SqliteStorage(str(tmp_path))
+    stored = {g.config.game_id for g in storage.iter_games(include_rounds=False)}
+    assert stored == resumed.completed_ids() == {"0", "1", "2", "3"}
+
+    runner = TournamentRunner(_players(), Dictionary(WORDS), storage, LeaderboardManager())
+    asyncio.run(runner.run_tournament(resumed.remaining(), on_record=resumed.mark_completed))
+    resumed.close()
+    storage.close()
+    assert resumed.remaining() == []
+    games = SqliteStorage(str(tmp_path)).iter_games(include_rounds=False)
+    assert sorted(g.config.game_id for g in games) == [c.game_id for c in configs]
+
+def test_stored_game_without_marker_is_not_replayed(tmp_path):
+    # An earlier tournament in the same directory reused the same game ids
+    earlier = ScheduleCheckpoint(str(tmp_path))
+    _run(tmp_path, earlier.start(_configs()), earlier)
+    time.sleep(0.05)
+
+    checkpoint = ScheduleCheckpoint(str(tmp_path))
+    configs = checkpoint.start(_configs())
+    storage = GameLogStorage(str(tmp_path))
+
+    def crash_before_third_marker(result):
+        if result.config.game_id == "2":
+            raise Crash()  # Stored and rated, but not marked
+        checkpoint.mark_completed(result)
+
+    runner = TournamentRunner(_players(), Dictionary(WORDS), storage, LeaderboardManager())
+    try:
+        asyncio.run(runner.run_tournament(configs, on_record=crash_before_third_marker))
+    except Crash:
+        pass
+
+    resumed = ScheduleCheckpoint(str(tmp_path))
+    storage = GameLogStorage(str(tmp_path))
+    assert [c.game_id for c in resumed.remaining()] == ["2", "3", "4", "5"]
+    assert [c.game_id for c in resumed.remaining(storage)] == ["3", "4", "5"]
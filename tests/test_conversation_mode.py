@@ -0,0 +1,74 @@
+import asyncio
+import re
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from contacteval.game.engine import GameEngine
+from contacteval.game.models import GameConfig
+from contacteval.players.adapters import AnthropicPlayer, OllamaPlayer
+from contacteval.words.bank import Dictionary
+
+def test_transcript_grows_by_round_deltas():
+    requests = []
+
+    async def handler(request):
+        payload = await request.json()
+        requests.append(payload)
+        system, last = payload["messages"][0]["content"], payload["messages"][-1]["content"]
+        if "as the Holder" in system:
+            content = '{"guess": "DOG"}'
+        else:
+            prefix = re.search(r'Prefix: "(\w+)"', last).group(1)
+            content = '{"prefix_word": "CAT"}' if prefix == "C" else '{"prefix_word": "COW"}'
+        return web.json_response({"message": {"content": content}})
+
+    async def main():
+        app = web.Application()
+        app.router.add_post("/api/chat", handler)
+        server = TestServer(app)
+        await server.start_server()
+        port = server.port
+        try:
+            players = [
+                OllamaPlayer(pid, base_url=f"http://127.0.0.1:{port}", conversation=True)
+                for pid in ["H", "A", "B", "C"]
+            ]
+            config = GameConfig(word="COW", holder_id="H", attacker_ids=["A", "B", "C"], dictionary_id="test")
+            result = await GameEngine(Dictionary(["CAT", "COW", "DOG"])).run_game(config, players[0], players[1:])
+            return result, players
+        finally:
+            await server.close()
+
+    result, players = asyncio.run(main())
+    assert len(result.rounds) == 2 and result.rounds[0].letter_revealed
+    assert players[1].transcript == []  # Each game plays on its own copy
+
+    attacker_calls = [r["messages"] for r in requests if "as an Attacker" in r["messages"][0]["content"]]
+    second_round = [m for m in attacker_calls if len(m) > 2]
+    assert len(second_round) == 3
+    messages = second_round[0]
+    assert [m["role"] for m in messages] == ["system", "user", "assistant", "user"]
+    assert "Round 1 |" in messages[-1]["content"] and "Round: 2" in messages[-1]["content"]
+    assert "No previous rounds." not in messages[-1]["content"]
+
+def test_anthropic_cache_breakpoints():
+    payloads = []
+
+    class CapturingPlayer(AnthropicPlayer):
+        async def _post(self, url, payload, headers=None):
+            payloads.append(payload)
+            return {"content": [{"text": '{"prefix_word": "CAT"}'}]}
+
+    config = GameConfig(word="COW", holder_id="H", attacker_ids=["A", "B", "C"], dictionary_id="test")
+    player = CapturingPlayer("A", api_key="k", conversation=True).for_game(config)
+
+    async def main():
+        await player.submit_attacker_guess("C", [])
+        await player.submit_attacker_guess("C", [], error_msg="Try again.")
+
+    asyncio.run(main())
+    assert payloads[0]["system"][0]["cache_control"] == {"type": "ephemeral"}
+    assert [m["role"] for m in payloads[1]["messages"]] == ["user", "assistant", "user"]
+    assert payloads[1]["messages"][1]["content"][0]["cache_control"] == {"type": "ephemeral"}
+    assert "Try again." in payloads[1]["messages"][2]["content"]
+    # The transcript itself keeps plain text turns
+    assert isinstance(player.transcript[1]["content"], str)
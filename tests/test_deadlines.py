@@ -0,0 +1,124 @@
+import asyncio
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from contacteval.game.engine import GameEngine, GameTimeoutError
+from contacteval.game.models import AttackerSubmission, GameConfig
+from contacteval.players.adapters import OllamaPlayer
+from contacteval.players.base import Player
+from contacteval.players.ratelimit import RetryPolicy
+from contacteval.telemetry.usage import start_round_usage
+from contacteval.words.bank import Dictionary
+
+def _serve(delays: list[float], calls: list):
+    async def handler(request):
+        delay = delays[min(len(calls), len(delays) - 1)]
+        calls.append(delay)
+        await asyncio.sleep(delay)
+        return web.json_response({"message": {"content": '{"prefix_word": "APPLE"}'}, "prompt_eval_count": 50})
+
+    async def start():
+        app = web.Application()
+        app.router.add_post("/api/chat", handler)
+        server = TestServer(app)
+        await server.start_server()
+        return server
+
+    return start
+
+def test_call_timeout_is_retried():
+    calls = []
+    call_timeout = 0.5
+    start_server = _serve([2.0, 0.0], calls)
+
+    async def main():
+        server = await start_server()
+        try:
+            player = OllamaPlayer(
+                "P", base_url=f"http://127.0.0.1:{server.port}",
+                call_timeout=call_timeout,
+                retry_policy=RetryPolicy(max_retries=2, base_delay=0.01)
+            )
+            usage = start_round_usage()
+            submission = await player.submit_attacker_guess("A", [])
+            return submission, usage["P"]
+        finally:
+            await server.close()
+
+    submission, usage = asyncio.run(main())
+    assert submission.prefix_word == "APPLE"
+    # The slow first request was abandoned and retried
+    assert len(calls) == 2
+    # Only the successful attempt is timed: the one that hit call_timeout alone would take call_timeout
+    assert usage.calls == 1 and usage.seconds < call_timeout
+
+def test_slow_request_is_hedged_after_p95():
+    calls = []
+    start_server = _serve([1.0, 0.0], calls)
+
+    async def main():
+        server = await start_server()
+        try:
+            player = OllamaPlayer("P", base_url=f"http://127.0.0.1:{server.port}", hedge=True)
+            for _ in range(player.latency.min_samples):
+                player.latency.record(0.05)
+            usage = start_round_usage()
+            submission = await player.submit_attacker_guess("A", [])
+            return submission, player.latency, usage["P"]
+        finally:
+            await server.close()
+
+    submission, latency, usage = asyncio.run(main())
+    assert submission.prefix_word == "APPLE"
+    # The duplicate answered first, so the caller did not wait for the slow request
+    assert (latency.hedges, latency.hedge_wins) == (1, 1)
+    # Both requests are paid for
+    assert (usage.calls, usage.input_tokens) == (2, 100)
+
+class HangingOllama(OllamaPlayer):
+    """
+    Requests never answer; counts how many were sent and how many got cancelled.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.sent = 0
+        self.cancelled = 0
+
+    async def _send(self, url, payload, headers):
+        self.sent += 1
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+
+@pytest.mark.parametrize("deadline, requests", [(0.02, 1), (0.2, 2)])
+def test_cancelling_the_caller_cancels_hedged_requests(deadline, requests):
+    # Cancelled before and after the duplicate request goes out
+    player = HangingOllama("P", hedge=True)
+    for _ in range(player.latency.min_samples):
+        player.latency.record(0.05)
+
+    async def main():
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(player.submit_attacker_guess("A", []), deadline)
+        await asyncio.sleep(0)
+        # Checked before asyncio.run cancels whatever is left over
+        assert player.sent == player.cancelled == requests
+
+    asyncio.run(main())
+
+class StallingPlayer(Player):
+    async def submit_attacker_guess(self, prefix, history, error_msg=None) -> AttackerSubmission:
+        await asyncio.sleep(10)
+        return AttackerSubmission(player_id=self.name)
+
+    async def submit_holder_guess(self, prefix, history, num_contacts) -> str:
+        return ""
+
+def test_game_budget():
+    engine = GameEngine(Dictionary(["APPLE"]), game_timeout=0.1)
+    config = GameConfig(word="APPLE", holder_id="H", attacker_ids=["A", "B", "C"], dictionary_id="test")
+    players = [StallingPlayer(pid) for pid in ["H", "A", "B", "C"]]
+    with pytest.raises(GameTimeoutError):
+        asyncio.run(engine.run_game(config, players[0], players[1:]))
@@ -0,0 +1,35 @@
+from contacteval.words.bank import Dictionary
+from contacteval.words.compiled import compile_dictionary
+
+WORDS = ["elbow", "ELEPHANT", "elevator", "eagle", "engine", "fig", "el"]
+
+def test_prefix_ranges():
+    dictionary = Dictionary(WORDS)
+    assert dictionary.get_matches("el") == ["EL", "ELBOW", "ELEPHANT", "ELEVATOR"]
+    assert dictionary.get_matches("ELE", exclude={"ELEVATOR"}) == ["ELEPHANT"]
+    assert dictionary.count_matches("E") == 6
+    assert dictionary.count_matches("Z") == 0
+    assert dictionary.is_valid("Engine")
+    assert not dictionary.is_valid("ENG")
+
+def test_random_word_respects_prefix_and_exclusions():
+    dictionary = Dictionary(WORDS)
+    assert dictionary.get_random_word("EL", exclude={"EL", "ELBOW", "ELEPHANT"}) == "ELEVATOR"
+    assert dictionary.get_random_word("EL", exclude={"EL", "ELBOW", "ELEPHANT", "ELEVATOR"}) is None
+    assert dictionary.get_random_word("X") is None
+    assert {dictionary.get_random_word("E") for _ in range(200)} == {
+        "EAGLE", "EL", "ELBOW", "ELEPHANT", "ELEVATOR", "ENGINE"
+    }
+
+def test_compiled_dictionary_matches_in_memory(tmp_path):
+    path = compile_dictionary(WORDS, "test_v1", str(tmp_path / "test_v1.ctdict"))
+    compiled = Dictionary.load(str(path))
+    in_memory = Dictionary(WORDS)
+
+    assert compiled.dictionary_id == "test_v1"
+    assert list(compiled.words) == in_memory.words
+    for prefix in ["E", "EL", "ELE", "F", "Z", "ENGINE"]:
+        assert compiled.get_matches(prefix) == in_memory.get_matches(prefix)
+    assert compiled.is_valid("elbow") and not compiled.is_valid("ELB")
+    assert compiled.get_random_word("ELEV") == "ELEVATOR"
+    compiled.words.close()
@@ -0,0 +1,50 @@
+from datetime import datetime, timedelta
+import pytest
+from contacteval.game.models import GameConfig, GameResult, Round
+from contacteval.storage.factory import STORAGE_BACKENDS, open_storage
+from contacteval.storage.filters import GameFilter
+
+START = datetime(2024, 5, 1, 12, 0, 0)
+
+def _game(word: str, holder: str, minutes: int) -> GameResult:
+    attackers = [p for p in ["A", "B", "C"] if p != holder]
+    return GameResult(
+        config=GameConfig(word=word, holder_id=holder, attacker_ids=attackers, dictionary_id="test"),
+        rounds=[Round(round_number=1, prefix=word[0], submissions=[], contacts=[], letter_revealed=True)],
+        holder_score=1.0,
+        attacker_scores={a: 0.0 for a in attackers},
+        duration_seconds=1.0,
+        timestamp=START + timedelta(minutes=minutes)
+    )
+
+@pytest.mark.parametrize("backend", STORAGE_BACKENDS)
+def test_filters_are_applied_by_every_backend(tmp_path, backend):
+    storage = open_storage(backend, str(tmp_path))
+    games = [_game("ELEPHANT", "A", 0), _game("GIRAFFE", "B", 1), _game("PENGUIN", "A", 2)]
+    for game in games:
+        storage.save_game(game)
+    storage.close()
+
+    storage = open_storage(backend, str(tmp_path))
+
+    def words(game_filter=None, **kwargs):
+        return [g.config.word for g in storage.iter_games(game_filter, **kwargs)]
+
+    assert words() == ["ELEPHANT", "GIRAFFE", "PENGUIN"]
+    assert words(GameFilter(model_id="A", role="holder")) == ["ELEPHANT", "PENGUIN"]
+    assert words(GameFilter(model_id="A", role="attacker")) == ["GIRAFFE"]
+    assert words(GameFilter(word="giraffe")) == ["GIRAFFE"]
+    assert words(GameFilter(word_length=7)) == ["GIRAFFE", "PENGUIN"]
+    assert words(GameFilter(dictionary_id="other")) == []
+    assert words(GameFilter(since=START + timedelta(minutes=1))) == ["GIRAFFE", "PENGUIN"]
+    assert words(GameFilter(until=START + timedelta(minutes=1))) == ["ELEPHANT"]
+
+    summaries = list(storage.iter_games(GameFilter(word="PENGUIN"), include_rounds=False))
+    assert summaries[0].rounds == []
+    assert summaries[0].config == games[2].config
+    assert list(storage.iter_games(GameFilter(word="PENGUIN"))) == [games[2]]
+    storage.close()
+
+def test_role_requires_model():
+    with pytest.raises(ValueError):
+        GameFilter(role="holder")
@@ -0,0 +1,41 @@
+from contacteval.game.models import GameConfig, GameResult, Round
+from contacteval.storage.game_log import GameLogStorage
+
+def _game(word: str) -> GameResult:
+    config = GameConfig(word=word, holder_id="H", attacker_ids=["A", "B", "C"], dictionary_id="test")
+    return GameResult(
+        config=config,
+        rounds=[Round(round_number=1, prefix=word[0], submissions=[], contacts=[], letter_revealed=False)],
+        holder_score=0.0,
+        attacker_scores={"A": 1.0, "B": 0.0, "C": 0.0},
+        duration_seconds=0.1
+    )
+
+def test_segments_rotate_and_stream_in_write_order(tmp_path):
+    storage = GameLogStorage(str(tmp_path), max_segment_bytes=1000)
+    words = [f"WORD{i}" for i in range(20)]
+    for word in words:
+        storage.save_game(_game(word))
+
+    assert len(storage.segment_ids()) > 1
+    assert [g.config.word for g in storage.iter_games()] == words
+
+    seg_id, entry = list(storage.iter_index())[7]
+    assert storage.read_game(seg_id, entry["offset"], entry["length"]).config.word == "WORD7"
+    storage.close()
+
+def test_reopening_repairs_torn_tail_and_appends(tmp_path):
+    storage = GameLogStorage(str(tmp_path))
+    storage.save_game(_game("APPLE"))
+    storage.close()
+
+    # Simulate a crash halfway through a write
+    segment = tmp_path / "game_log" / "segment_000001.jsonl"
+    with open(segment, "ab") as f:
+        f.write(b'{"config": {"word": "BROK')
+
+    storage = GameLogStorage(str(tmp_path))
+    storage.save_game(_game("CHERRY"))
+    storage.close()
+
+    assert [g.config.word for g in GameLogStorage(str(tmp_path)).iter_games()] == ["APPLE", "CHERRY"]
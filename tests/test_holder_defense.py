@@ -0,0 +1,102 @@
+import asyncio
+from contacteval.game.engine import GameEngine
+from contacteval.game.models import AttackerSubmission, GameConfig
+from contacteval.players.adapters import LLMPlayer, parse_guesses
+from contacteval.players.base import Player
+from contacteval.words.bank import Dictionary
+
+class ScriptedPlayer(Player):
+    """
+    Plays fixed prefix words; as holder, records how many guesses were in flight at once.
+    """
+    def __init__(self, name: str, words: list[str]):
+        super().__init__(name)
+        self.words = words
+        self.secret_word = None
+        # Shared with the per-game copies
+        self.holder_calls = {"total": 0, "in_flight": 0, "peak": 0}
+
+    async def submit_attacker_guess(self, prefix, history, error_msg=None) -> AttackerSubmission:
+        return AttackerSubmission(player_id=self.name, prefix_word=self.words[len(history)])
+
+    async def submit_holder_guess(self, prefix, history, num_contacts) -> str:
+        calls = self.holder_calls
+        calls["total"] += 1
+        calls["in_flight"] += 1
+        calls["peak"] = max(calls["peak"], calls["in_flight"])
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            calls["in_flight"] -= 1
+        return "CAT"
+
+def test_holder_guesses_for_all_contacts_are_concurrent():
+    engine = GameEngine(Dictionary(["CAT", "CAR", "COG", "COT", "COW"]))
+    config = GameConfig(word="COW", holder_id="H", attacker_ids=["A", "B", "C", "D"], dictionary_id="test")
+    holder = ScriptedPlayer("H", [])
+    attackers = [
+        ScriptedPlayer("A", ["CAT", "COW"]),
+        ScriptedPlayer("B", ["CAT", "COT"]),
+        ScriptedPlayer("C", ["CAR", "COG"]),
+        ScriptedPlayer("D", ["CAR", "COG"]),
+    ]
+
+    result = asyncio.run(engine.run_game(config, holder, attackers))
+
+    first = result.rounds[0]
+    assert [(c.word, c.holder_guess, c.blocked) for c in first.contacts] == [("CAT", "CAT", True), ("CAR", "CAT", False)]
+    assert first.letter_revealed
+    assert result.winner == "A"
+    # Both first-round contacts are guessed at once, not one after the other
+    assert holder.holder_calls == {"total": 3, "in_flight": 0, "peak": 2}
+
+class BatchHolder(LLMPlayer):
+    """
+    Answers every holder call with the same list of guesses and keeps the messages.
+    """
+
+    def __init__(self, name: str, reply: str, conversation: bool = False):
+        super().__init__(name, conversation=conversation)
+        self.reply = reply
+        self.calls = []
+
+    async def _call_chat(self, system_prompt: str, messages: list[dict]) -> str:
+        self.calls.append(messages)
+        return self.reply
+
+def test_llm_holder_answers_all_contacts_in_one_call():
+    engine = GameEngine(Dictionary(["CAT", "CAR", "COG", "COT", "COW"]))
+    config = GameConfig(word="COW", holder_id="H", attacker_ids=["A", "B", "C", "D"], dictionary_id="test")
+    holder = BatchHolder("H", '{"guesses": ["CAR", "car", "CAT"]}')
+    attackers = [
+        ScriptedPlayer("A", ["CAT", "COW"]),
+        ScriptedPlayer("B", ["CAT", "COT"]),
+        ScriptedPlayer("C", ["CAR", "COG"]),
+        ScriptedPlayer("D", ["CAR", "COG"]),
+    ]
+
+    result = asyncio.run(engine.run_game(config, holder, attackers))
+
+    # One call per round with contacts, asking for as many different guesses as contacts
+    assert len(holder.calls) == 2
+    assert "Give 2 different guesses" in holder.calls[0][-1]["content"]
+    # Duplicates are dropped; a guess blocks whichever contact it names
+    first = result.rounds[0]
+    assert [(c.word, c.holder_guess, c.blocked) for c in first.contacts] == [("CAT", "CAT", True), ("CAR", "CAR", True)]
+    assert not first.letter_revealed
+
+def test_conversation_holder_keeps_the_whole_reply():
+    holder = BatchHolder("H", '{"guesses": ["CAT", "CAR"]}', conversation=True)
+    holder.secret_word = "COW"
+
+    guesses = asyncio.run(holder.submit_holder_guesses("C", [], 2))
+
+    assert guesses == ["CAT", "CAR"]
+    assert len(holder.calls) == 1
+    assert [m["role"] for m in holder.transcript] == ["user", "assistant"]
+    assert holder.transcript[1]["content"] == holder.reply
+
+def test_parse_guesses():
+    assert parse_guesses({"guesses": ["cat", "CAT", "", 3, "car", "cot"]}, 2) == ["cat", "car"]
+    assert parse_guesses({"guess": "cat"}, 2) == ["cat", ""]
+    assert parse_guesses({}, 1) == [""]
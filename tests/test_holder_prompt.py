@@ -0,0 +1,28 @@
+import asyncio
+from contacteval.players.adapters import LLMPlayer
+
+class RecordingPlayer(LLMPlayer):
+    """
+    Answers every call with a fixed reply and keeps the prompts it was sent.
+    """
+
+    def __init__(self, name: str, reply: str):
+        super().__init__(name)
+        self.reply = reply
+        self.prompts = []
+
+    async def _call_api(self, system_prompt: str, user_prompt: str) -> str:
+        self.prompts.append((system_prompt, user_prompt))
+        return self.reply
+
+def test_holder_guess_reaches_the_api():
+    player = RecordingPlayer("holder", '{"guess": "apple"}')
+    player.secret_word = "APRICOT"
+
+    guess = asyncio.run(player.submit_holder_guess("AP", [], 1))
+
+    assert guess == "apple"
+    system_prompt, user_prompt = player.prompts[0]
+    assert "APRICOT" in system_prompt
+    assert '"guess": "your single word guess to block the contact"' in system_prompt
+    assert 'Prefix: "AP"' in user_prompt
@@ -0,0 +1,57 @@
+import asyncio
+import time
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from contacteval.players.adapters import OllamaPlayer
+from contacteval.players.ratelimit import RetryPolicy, TokenBucket, parse_retry_after
+from contacteval.players.transport import SessionPool
+
+def test_parse_retry_after():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0  # In the past
+    assert parse_retry_after("soon") is None
+
+def test_token_bucket_waits_for_refill():
+    async def main():
+        bucket = TokenBucket(rate_per_minute=600, capacity=2)  # 10 tokens/s
+        start = time.monotonic()
+        for _ in range(4):
+            await bucket.acquire()
+        return time.monotonic() - start
+
+    elapsed = asyncio.run(main())
+    assert 0.15 <= elapsed < 1.0
+
+def test_throttled_calls_are_retried_at_transport_layer():
+    statuses = [429, 503, 200]
+    calls = []
+
+    async def handler(request):
+        status = statuses[len(calls)]
+        calls.append(status)
+        if status != 200:
+            return web.Response(status=status, text="slow down", headers={"Retry-After": "0"})
+        return web.json_response({"message": {"content": '{"prefix_word": "APPLE"}'}})
+
+    async def main():
+        app = web.Application()
+        app.router.add_post("/api/chat", handler)
+        server = TestServer(app)
+        await server.start_server()
+        port = server.port
+        try:
+            async with SessionPool() as pool:
+                player = OllamaPlayer(
+                    "P", base_url=f"http://127.0.0.1:{port}",
+                    session_pool=pool,
+                    requests_per_minute=6000,
+                    retry_policy=RetryPolicy(max_retries=3, base_delay=0.01)
+                )
+                return await player.submit_attacker_guess("A", [])
+        finally:
+            await server.close()
+
+    submission = asyncio.run(main())
+    assert calls == [429, 503, 200]
+    assert submission.prefix_word == "APPLE"
@@ -0,0 +1,30 @@
+from contacteval.game.models import PlayerRating
+from contacteval.storage.json_store import JsonStorage
+
+def _rating(pid: str, mu: float, games: int) -> PlayerRating:
+    return PlayerRating(player_id=pid, role="attacker", mu=mu, games_played=games)
+
+def test_recovery_is_snapshot_plus_journal_tail(tmp_path):
+    storage = JsonStorage(str(tmp_path))
+    storage.save_ratings({"A": {"attacker": _rating("A", 1.0, 1)}})
+    storage.record_rating_updates([_rating("A", 2.0, 2), _rating("B", 0.5, 1)])
+
+    # Crash in the middle of the next journal append
+    with open(storage.journal_path, "a") as f:
+        f.write('{"ratings": [{"player_id": "A"')
+
+    storage = JsonStorage(str(tmp_path))
+    storage.record_rating_updates([_rating("B", 0.7, 2)])
+
+    ratings = JsonStorage(str(tmp_path)).load_ratings()
+    assert ratings["A"]["attacker"].mu == 2.0
+    assert ratings["B"]["attacker"].games_played == 2
+
+def test_snapshot_clears_journal(tmp_path):
+    storage = JsonStorage(str(tmp_path))
+    storage.record_rating_updates([_rating("A", 2.0, 2)])
+    storage.save_ratings({"A": {"attacker": _rating("A", 2.0, 2)}})
+
+    assert storage.journal_path.read_text() == ""
+    assert not list(tmp_path.glob("*.tmp"))
+    assert storage.load_ratings()["A"]["attacker"].mu == 2.0
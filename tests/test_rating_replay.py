@@ -0,0 +1,32 @@
+import random
+from contacteval.game.models import GameConfig, GameResult
+from contacteval.ranking.leaderboard import LeaderboardManager
+from contacteval.ranking.replay import encode_games, replay_history
+
+def _random_games(n: int, seed: int = 7) -> list:
+    rng = random.Random(seed)
+    models = [f"M{i}" for i in range(6)]
+    words = ["APPLE", "BANANA", "CHERRY", "DATE", "ELDERBERRY"]
+    games = []
+    for _ in range(n):
+        holder, *attackers = rng.sample(models, 4)
+        word = rng.choice(words)
+        games.append(GameResult(
+            config=GameConfig(word=word, holder_id=holder, attacker_ids=attackers, dictionary_id="test"),
+            rounds=[],
+            holder_score=rng.uniform(0, 3),
+            attacker_scores={a: float(rng.randint(0, len(word))) for a in attackers},
+            duration_seconds=0.0
+        ))
+    return games
+
+def test_replay_matches_incremental_processing_exactly():
+    games = _random_games(400)
+    incremental = LeaderboardManager()
+    for game in games:
+        incremental.process_game(game)
+
+    ratings, calibrator = replay_history(encode_games(games))
+
+    assert ratings == incremental.ratings
+    assert calibrator.stats == incremental.calibrator.stats
@@ -0,0 +1,66 @@
+import asyncio
+import random
+from contacteval.game.engine import GameEngine
+from contacteval.game.models import GameConfig, TokenUsage
+from contacteval.players.adapters import MockPlayer
+from contacteval.tournament.replay import replay_games
+from contacteval.words.bank import Dictionary
+
+WORDS = ["CAT", "CAR", "CART", "CARTS", "COT", "COG", "DOG", "DOT", "DOVE", "DOVES"]
+
+def _play_games(engine):
+    # MockPlayer words are invalid, so every submission is auto-assigned at random
+    random.seed(7)
+    players = {pid: MockPlayer(pid) for pid in ["A", "B", "C", "D"]}
+
+    async def main():
+        games = []
+        for word, holder in [("CARTS", "A"), ("DOVES", "B"), ("COG", "C")]:
+            config = GameConfig(
+                word=word, holder_id=holder,
+                attacker_ids=[p for p in players if p != holder], dictionary_id="test"
+            )
+            games.append(await engine.run_game(config, players[holder], [players[p] for p in config.attacker_ids]))
+        return games
+
+    return asyncio.run(main())
+
+def test_replay_reproduces_stored_games():
+    engine = GameEngine(Dictionary(WORDS))
+    games = _play_games(engine)
+    assert any(s.auto_assigned for g in games for r in g.rounds for s in r.submissions)
+
+    replayed = []
+    report = asyncio.run(replay_games(engine, games, on_result=replayed.append))
+    assert report.games == 3 and not report.diverged and not report.failed
+    assert report.rounds == sum(len(g.rounds) for g in games)
+    assert [g.rounds for g in replayed] == [g.rounds for g in games]
+
+def test_replay_reports_divergence_and_exhaustion():
+    engine = GameEngine(Dictionary(WORDS))
+    games = _play_games(engine)
+
+    # Drop the winning round: the replay runs out of stored moves
+    truncated = games[0].model_copy(update={"rounds": games[0].rounds[:-1]})
+    # A changed stored score counts as a divergence
+    rescored = games[1].model_copy(update={"holder_score": games[1].holder_score + 1})
+
+    report = asyncio.run(replay_games(engine, [truncated, rescored, games[2]]))
+    assert report.failed == [0]
+    assert report.diverged == [1]
+    assert report.games == 2
+
+def test_recorded_usage_is_not_a_divergence():
+    engine = GameEngine(Dictionary(WORDS))
+    games = _play_games(engine)
+    usage = TokenUsage(calls=1, input_tokens=120, output_tokens=8, seconds=0.4)
+    billed = [
+        g.model_copy(update={
+            "rounds": [r.model_copy(update={"usage": {"A": usage}}) for r in g.rounds],
+            "usage": {"A": usage}
+        })
+        for g in games
+    ]
+
+    report = asyncio.run(replay_games(engine, billed))
+    assert report.games == 3 and not report.diverged
@@ -0,0 +1,52 @@
+import asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from contacteval.players.adapters import OllamaPlayer
+from contacteval.players.cache import ResponseCache
+
+def test_lru_eviction_and_counters(tmp_path):
+    cache = ResponseCache(str(tmp_path), mode="read-write", max_bytes=60)
+    keys = [cache.make_key("openai", "gpt-4o", {"prompt": i}) for i in range(3)]
+    cache.put(keys[0], "openai", "gpt-4o", {"text": "a" * 10})
+    cache.put(keys[1], "openai", "gpt-4o", {"text": "b" * 10})
+    assert cache.get(keys[0]) == {"text": "a" * 10}  # keys[1] is now least recently used
+    cache.put(keys[2], "openai", "gpt-4o", {"text": "c" * 10})
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[2]) == {"text": "c" * 10}
+    assert (cache.hits, cache.misses, cache.evictions) == (2, 1, 1)
+    cache.close()
+
+    # Write mode records but never answers
+    cache = ResponseCache(str(tmp_path), mode="write", max_bytes=60)
+    assert cache.get(keys[0]) is None
+    cache.close()
+
+def test_player_reuses_cached_responses(tmp_path):
+    calls = []
+
+    async def handler(request):
+        calls.append(await request.json())
+        return web.json_response({"message": {"content": '{"prefix_word": "APPLE"}'}})
+
+    async def main():
+        app = web.Application()
+        app.router.add_post("/api/chat", handler)
+        server = TestServer(app)
+        await server.start_server()
+        port = server.port
+        cache = ResponseCache(str(tmp_path), mode="read-write")
+        try:
+            player = OllamaPlayer("P", base_url=f"http://127.0.0.1:{port}", response_cache=cache)
+            first = await player.submit_attacker_guess("A", [])
+            second = await player.submit_attacker_guess("A", [])
+            await player.submit_attacker_guess("B", [])
+            return first, second, cache.stats()
+        finally:
+            cache.close()
+            await server.close()
+
+    first, second, stats = asyncio.run(main())
+    assert first == second
+    assert len(calls) == 2
+    assert (stats["hits"], stats["misses"], stats["writes"]) == (1, 2, 2)
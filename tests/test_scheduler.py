@@ -0,0 +1,52 @@
+import itertools
+import random
+from collections import Counter
+from contacteval.tournament.scheduler import TournamentScheduler
+
+def _schedule(n_models, per_model, seed=0):
+    ids = [f"m{i:03d}" for i in range(n_models)]
+    return ids, TournamentScheduler(ids, "test", seed=seed).generate_games(["WORD"], per_model)
+
+def test_roles_are_balanced():
+    ids, configs = _schedule(7, 30)
+    assert len(configs) == 70
+    holders = Counter(c.holder_id for c in configs)
+    attackers = Counter(a for c in configs for a in c.attacker_ids)
+    assert max(holders.values()) - min(holders[m] for m in ids) <= 1
+    assert set(attackers.values()) == {30}
+    for c in configs:
+        assert len({c.holder_id, *c.attacker_ids}) == 4
+
+def test_pairings_are_spread_evenly():
+    ids, configs = _schedule(8, 30)
+    together = Counter()
+    for c in configs:
+        for a, b in itertools.combinations(sorted([c.holder_id, *c.attacker_ids]), 2):
+            together[(a, b)] += 1
+    counts = [together[p] for p in itertools.combinations(ids, 2)]
+    # 80 games x 6 pairs over 28 pairs: about 17 each
+    assert min(counts) > 0
+    assert max(counts) - min(counts) <= 3
+
+class CountingRandom(random.Random):
+    def __init__(self, seed):
+        super().__init__(seed)
+        self.samples = 0
+
+    def sample(self, population, k, **kwargs):
+        self.samples += 1
+        return super().sample(population, k, **kwargs)
+
+def test_many_models_are_scheduled_lazily():
+    ids = [f"m{i:03d}" for i in range(100)]
+    scheduler = TournamentScheduler(ids, "test", seed=1)
+    scheduler.rng = CountingRandom(1)
+    games = scheduler.iter_games(["WORD"], 30)
+    first = [next(games) for _ in range(200)]
+    # One shuffle per game taken, not the whole 1000-game schedule up front
+    assert scheduler.total_games(30) == 1000
+    assert scheduler.rng.samples == 200
+    assert len({c.holder_id for c in first}) == 100
+
+def test_seed_makes_schedule_reproducible():
+    assert _schedule(6, 6, seed=3)[1] == _schedule(6, 6, seed=3)[1]
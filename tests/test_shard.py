@@ -0,0 +1,147 @@
+import asyncio
+import json
+import os
+import time
+import pytest
+from contacteval.game.models import AttackerSubmission, GameConfig
+from contacteval.players.base import Player
+from contacteval.ranking.leaderboard import LeaderboardManager
+from contacteval.storage.json_store import JsonStorage
+from contacteval.tournament.runner import TournamentRunner
+from contacteval.tournament.shard import ShardPlan, ShardQueue, merge_results, run_worker
+from contacteval.words.bank import Dictionary
+
+WORDS = ["APPLE", "BANANA", "CHERRY", "DATE", "ELDER", "FIG"]
+IDS = ["A", "B", "C", "D"]
+
+def _configs():
+    # Rotate the holder so the merge order matters for the ratings
+    return [
+        GameConfig(
+            word=w, holder_id=IDS[i % 4],
+            attacker_ids=[p for p in IDS if p != IDS[i % 4]], dictionary_id="test"
+        )
+        for i, w in enumerate(WORDS)
+    ]
+
+class Solver(Player):
+    """
+    Guesses the only test word that starts with the prefix, earlier words more slowly.
+    """
+    async def submit_attacker_guess(self, prefix, history, error_msg=None) -> AttackerSubmission:
+        word = next(w for w in WORDS if w.startswith(prefix))
+        await asyncio.sleep(0.001 * (len(WORDS) - WORDS.index(word)))
+        return AttackerSubmission(player_id=self.name, full_word_guess=word)
+
+    async def submit_holder_guess(self, prefix, history, num_contacts) -> str:
+        return ""
+
+def _players():
+    return {pid: Solver(pid) for pid in IDS}
+
+def _plan(queue: ShardQueue, unit_size=2):
+    plan = ShardPlan(
+        dictionary_file="words.json", dictionary_id="test", models_file="models.json",
+        total_games=len(WORDS), unit_size=unit_size
+    )
+    queue.create(_configs(), plan)
+
+def test_plan_splits_schedule_into_units(tmp_path):
+    queue = ShardQueue(str(tmp_path / "q"))
+    _plan(queue)
+    assert queue.status() == {"pending": 3, "claimed": 0, "done": 0, "failed": 0}
+    assert queue.load_plan().total_games == len(WORDS)
+
+    unit, configs = queue.claim("w1")
+    assert [c.word for c in configs] == WORDS[:2]
+    assert [c.game_id for c in configs] == ["0", "1"]
+
+def test_each_unit_is_claimed_once(tmp_path):
+    queue = ShardQueue(str(tmp_path / "q"))
+    _plan(queue, unit_size=1)
+    claims = [queue.claim(f"w{i}") for i in range(8)]
+    units = [c[0] for c in claims if c is not None]
+    assert len(units) == len(WORDS) == len(set(units))
+    assert queue.status()["claimed"] == len(WORDS)
+
+def test_stale_claims_are_requeued(tmp_path):
+    queue = ShardQueue(str(tmp_path / "q"))
+    _plan(queue)
+    unit, _ = queue.claim("crashed")
+    assert queue.requeue_stale(max_age=60) == 0  # Fresh claim
+
+    old = time.time() - 120
+    os.utime(queue.claimed / f"{unit}.crashed", (old, old))
+    assert queue.requeue_stale(max_age=60) == 1
+    assert queue.claim("w2")[0] == unit
+    assert not queue.complete(unit, "crashed")
+
+def test_sharded_merge_matches_sequential_run(tmp_path):
+    queue = ShardQueue(str(tmp_path / "q"))
+    _plan(queue)
+    dictionary = Dictionary(WORDS)
+
+    async def workers():
+        # Two workers drain the queue concurrently, each with its own players
+        return await asyncio.gather(
+            run_worker(queue, "w1", _players(), dictionary, concurrency=2),
+            run_worker(queue, "w2", _players(), dictionary)
+        )
+    played = asyncio.run(workers())
+    assert sum(played) == len(WORDS)
+    assert queue.status() == {"pending": 0, "claimed": 0, "done": 3, "failed": 0}
+
+    # A unit played twice (requeued from a slow worker) counts once
+    extra = queue.worker_storage("w3")
+    for result in list(queue.worker_storage("w1").iter_games()):
+        extra.save_game(result)
+    extra.close()
+
+    merged_board = LeaderboardManager()
+    merged = merge_results(queue, JsonStorage(str(tmp_path / "merged")), merged_board)
+    assert [r.config.word for r in merged] == WORDS
+
+    seq_board = LeaderboardManager()
+    runner = TournamentRunner(_players(), dictionary, JsonStorage(str(tmp_path / "seq")), seq_board)
+    asyncio.run(runner.run_tournament(_configs()))
+    for pid in seq_board.ratings:
+        for role, rating in seq_board.ratings[pid].items():
+            assert merged_board.ratings[pid][role] == rating
+
+def test_merge_runs_once(tmp_path):
+    queue = ShardQueue(str(tmp_path / "q"))
+    _plan(queue)
+    merge_results(queue, JsonStorage(str(tmp_path / "merged")), LeaderboardManager())
+    with pytest.raises(FileExistsError):
+        merge_results(queue, JsonStorage(str(tmp_path / "merged")), LeaderboardManager())
+
+class BrokenOnCherry(Solver):
+    async def submit_attacker_guess(self, prefix, history, error_msg=None) -> AttackerSubmission:
+        if "CHERRY".startswith(prefix):
+            raise RuntimeError("provider down")
+        return await super().submit_attacker_guess(prefix, history, error_msg)
+
+def test_unplayed_games_fail_their_unit(tmp_path):
+    queue = ShardQueue(str(tmp_path / "q"))
+    _plan(queue)
+    dictionary = Dictionary(WORDS)
+    broken = {pid: BrokenOnCherry(pid) for pid in IDS}
+    assert asyncio.run(run_worker(queue, "w1", broken, dictionary)) == len(WORDS) - 1
+    # CHERRY shares unit 1 with DATE; only the unplayed game is kept
+    assert queue.status() == {"pending": 0, "claimed": 0, "done": 2, "failed": 1}
+    assert queue.unfinished_game_ids() == ["2"]
+
+    assert queue.retry_failed() == 1
+    assert asyncio.run(run_worker(queue, "w2", _players(), dictionary)) == 1
+    assert queue.status() == {"pending": 0, "claimed": 0, "done": 3, "failed": 0}
+    merged = merge_results(queue, JsonStorage(str(tmp_path / "merged")), LeaderboardManager())
+    assert [r.config.word for r in merged] == WORDS
+
+def test_merge_records_missing_games(tmp_path):
+    queue = ShardQueue(str(tmp_path / "q"))
+    _plan(queue)
+    broken = {pid: BrokenOnCherry(pid) for pid in IDS}
+    asyncio.run(run_worker(queue, "w1", broken, Dictionary(WORDS)))
+    merged = merge_results(queue, JsonStorage(str(tmp_path / "merged")), LeaderboardManager())
+    assert len(merged) == len(WORDS) - 1
+    assert json.loads((queue.root / "merged").read_text()) == {"games": 5, "missing": ["2"]}
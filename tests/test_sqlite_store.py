@@ -0,0 +1,53 @@
+from contacteval.game.models import AttackerSubmission, Contact, GameConfig, GameResult, PlayerRating, Round
+from contacteval.storage.sqlite_store import SqliteStorage
+
+def _game(word: str, holder: str) -> GameResult:
+    attackers = [p for p in ["A", "B", "C", "D"] if p != holder]
+    config = GameConfig(word=word, holder_id=holder, attacker_ids=attackers, dictionary_id="test")
+    rounds = [
+        Round(
+            round_number=1,
+            prefix=word[0],
+            submissions=[
+                AttackerSubmission(player_id=attackers[0], prefix_word=word[0] + "X"),
+                AttackerSubmission(player_id=attackers[1], prefix_word=word[0] + "X", auto_assigned=True),
+                AttackerSubmission(player_id=attackers[2], full_word_guess="NOPE"),
+            ],
+            contacts=[Contact(word=word[0] + "X", attacker_ids=attackers[:2], holder_guess="Q", blocked=False)],
+            letter_revealed=True
+        ),
+        Round(
+            round_number=2,
+            prefix=word[:2],
+            submissions=[AttackerSubmission(player_id=attackers[0], full_word_guess=word)],
+            contacts=[],
+            letter_revealed=False,
+            full_word_guessed_by=attackers[0]
+        ),
+    ]
+    return GameResult(
+        config=config,
+        rounds=rounds,
+        winner=attackers[0],
+        holder_score=0.0,
+        attacker_scores={attackers[0]: float(len(word) - 1), attackers[1]: 0.0, attackers[2]: 0.0},
+        duration_seconds=1.5
+    )
+
+def test_round_trip_and_indexed_queries(tmp_path):
+    storage = SqliteStorage(str(tmp_path), batch_size=2)
+    games = [_game("ELEPHANT", "A"), _game("GIRAFFE", "B"), _game("PENGUIN", "A")]
+    for game in games:
+        storage.save_game(game)
+
+    assert storage.load_all_games() == games
+
+    rows = storage.find_games(model_id="A", role="holder", word_length=7)
+    assert [r["word"] for r in rows] == ["PENGUIN"]
+    assert [r["word"] for r in storage.find_games(model_id="A", role="attacker")] == ["GIRAFFE"]
+    assert storage.load_game(rows[0]["id"]) == games[2]
+
+    ratings = {"A": {"holder": PlayerRating(player_id="A", role="holder", mu=1.5, games_played=3)}}
+    storage.save_ratings(ratings)
+    storage.close()
+    assert SqliteStorage(str(tmp_path)).load_ratings() == ratings
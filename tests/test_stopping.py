@@ -0,0 +1,68 @@
+import asyncio
+from contacteval.game.models import AttackerSubmission, GameConfig, PlayerRating
+from contacteval.players.base import Player
+from contacteval.ranking.leaderboard import LeaderboardManager
+from contacteval.storage.json_store import JsonStorage
+from contacteval.tournament.runner import TournamentRunner
+from contacteval.tournament.stopping import ConvergenceMonitor, StoppingRule
+from contacteval.words.bank import Dictionary
+
+IDS = ["A", "B", "C", "D"]
+WORDS = ["APPLE", "BANANA", "CHERRY", "DATE", "ELDER", "FIG"]
+
+class Solver(Player):
+    """
+    Guesses the only test word that starts with the prefix.
+    """
+    async def submit_attacker_guess(self, prefix, history, error_msg=None) -> AttackerSubmission:
+        word = next(w for w in WORDS if w.startswith(prefix))
+        return AttackerSubmission(player_id=self.name, full_word_guess=word)
+
+    async def submit_holder_guess(self, prefix, history, num_contacts) -> str:
+        return ""
+
+def _ratings(**beliefs):
+    return {
+        pid: {role: PlayerRating(player_id=pid, role=role, mu=mu, sigma=sigma) for role in ["holder", "attacker"]}
+        for pid, (mu, sigma) in beliefs.items()
+    }
+
+def test_sigma_threshold():
+    monitor = ConvergenceMonitor(StoppingRule(max_sigma=1.0), IDS)
+    assert monitor.check(_ratings(A=(0, 0.5), B=(1, 0.5), C=(2, 0.5))) is None  # D unrated
+    assert monitor.check(_ratings(A=(0, 0.5), B=(1, 0.5), C=(2, 0.5), D=(3, 1.2))) is None
+    assert "sigma" in monitor.check(_ratings(A=(0, 0.5), B=(1, 0.5), C=(2, 0.5), D=(3, 0.9)))
+
+def test_top_k_must_hold_for_several_batches():
+    monitor = ConvergenceMonitor(StoppingRule(top_k=2, stable_batches=2), IDS)
+    settled = _ratings(A=(9, 1), B=(6, 1), C=(3, 1), D=(0, 1))
+    swapped = _ratings(A=(6, 1), B=(9, 1), C=(3, 1), D=(0, 1))
+    assert monitor.check(settled) is None
+    assert monitor.check(swapped) is None
+    assert monitor.check(swapped) is None
+    # C and D may move below the top 2
+    assert "top 2" in monitor.check(_ratings(A=(6, 1), B=(9, 1), C=(0, 1), D=(3, 1)))
+
+def test_pairwise_rank_confidence():
+    monitor = ConvergenceMonitor(StoppingRule(rank_confidence=0.95), IDS)
+    assert monitor.check(_ratings(A=(0, 1), B=(1, 1), C=(10, 1), D=(20, 1))) is None  # A/B too close
+    assert "confidence" in monitor.check(_ratings(A=(0, 1), B=(10, 1), C=(20, 1), D=(30, 1)))
+
+def test_runner_reports_why_it_stopped(tmp_path):
+    players = {pid: Solver(pid) for pid in IDS}
+    configs = [
+        GameConfig(word=WORDS[i % len(WORDS)], holder_id=IDS[i % 4],
+                   attacker_ids=[p for p in IDS if p != IDS[i % 4]], dictionary_id="test")
+        for i in range(40)
+    ]
+    runner = TournamentRunner(players, Dictionary(WORDS), JsonStorage(str(tmp_path)), LeaderboardManager())
+    monitor = ConvergenceMonitor(StoppingRule(max_sigma=2.5), IDS)
+
+    results = asyncio.run(runner.run_batched(configs, batch_size=4, monitor=monitor))
+    # The first batch gives every model a game in both roles: sigma 5 -> at most 1.86
+    assert len(results) == 4
+    assert "sigma" in runner.stop_reason
+
+    runner = TournamentRunner(players, Dictionary(WORDS), JsonStorage(str(tmp_path / "full")), LeaderboardManager())
+    assert len(asyncio.run(runner.run_batched(configs, batch_size=4))) == len(configs)
+    assert runner.stop_reason is None
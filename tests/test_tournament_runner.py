@@ -0,0 +1,62 @@
+import asyncio
+from contacteval.game.models import AttackerSubmission, GameConfig
+from contacteval.players.base import Player
+from contacteval.ranking.leaderboard import LeaderboardManager
+from contacteval.storage.json_store import JsonStorage
+from contacteval.tournament.runner import TournamentRunner
+from contacteval.words.bank import Dictionary
+
+WORDS = ["APPLE", "BANANA", "CHERRY", "DATE", "ELDER", "FIG"]
+
+class SolvingPlayer(Player):
+    """
+    Guesses the secret word straight away after a per-word delay.
+    """
+    active = 0
+    peak = 0
+
+    def __init__(self, name: str, delays: dict):
+        super().__init__(name)
+        self.delays = delays
+        self.secret_word = None
+
+    async def submit_attacker_guess(self, prefix, history, error_msg=None) -> AttackerSubmission:
+        word = next(w for w in WORDS if w.startswith(prefix))
+        SolvingPlayer.active += 1
+        SolvingPlayer.peak = max(SolvingPlayer.peak, SolvingPlayer.active)
+        await asyncio.sleep(self.delays[word])
+        SolvingPlayer.active -= 1
+        return AttackerSubmission(player_id=self.name, full_word_guess=word)
+
+    async def submit_holder_guess(self, prefix, history, num_contacts) -> str:
+        return ""
+
+def _run(tmp_path, concurrency):
+    # Earlier games are slower, so they finish last
+    delays = {w: 0.01 * (len(WORDS) - i) for i, w in enumerate(WORDS)}
+    ids = ["A", "B", "C", "D"]
+    players = {pid: SolvingPlayer(pid, delays) for pid in ids}
+    configs = [
+        GameConfig(word=w, holder_id="A", attacker_ids=["B", "C", "D"], dictionary_id="test")
+        for w in WORDS
+    ]
+    leaderboard = LeaderboardManager()
+    runner = TournamentRunner(
+        players, Dictionary(WORDS), JsonStorage(str(tmp_path)), leaderboard,
+        concurrency=concurrency
+    )
+    SolvingPlayer.active = SolvingPlayer.peak = 0
+    results = asyncio.run(runner.run_tournament(configs))
+    return results, leaderboard, SolvingPlayer.peak
+
+def test_concurrent_results_are_applied_in_schedule_order(tmp_path):
+    seq_results, seq_board, seq_peak = _run(tmp_path / "seq", concurrency=1)
+    par_results, par_board, par_peak = _run(tmp_path / "par", concurrency=4)
+
+    assert seq_peak == 3  # three attackers of one game
+    assert par_peak == 12  # four games at a time
+    assert [r.config.word for r in par_results] == WORDS
+    assert len(list((tmp_path / "par" / "games").glob("*.json"))) == len(WORDS)
+    for pid in seq_board.ratings:
+        for role, rating in seq_board.ratings[pid].items():
+            assert par_board.ratings[pid][role] == rating
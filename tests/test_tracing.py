@@ -0,0 +1,56 @@
+import asyncio
+import json
+from contacteval.game.models import GameConfig
+from contacteval.players.synthetic import SyntheticPlayer
+from contacteval.ranking.leaderboard import LeaderboardManager
+from contacteval.storage.json_store import JsonStorage
+from contacteval.telemetry.tracing import disable_tracing, enable_tracing, span
+from contacteval.tournament.runner import TournamentRunner
+from contacteval.words.bank import Dictionary
+
+WORDS = ["CAT", "CAR", "CART", "COT", "COG", "DOG", "DOT", "DOVE"]
+
+def _run_tournament(tmp_path):
+    dictionary = Dictionary(WORDS)
+    players = {pid: SyntheticPlayer(pid, dictionary, contact_rate=0.5, seed=i) for i, pid in enumerate("ABCD")}
+    configs = [
+        GameConfig(word=w, holder_id="A", attacker_ids=["B", "C", "D"], dictionary_id="test")
+        for w in ["CART", "DOVE"]
+    ]
+    runner = TournamentRunner(players, dictionary, JsonStorage(str(tmp_path / "results")), LeaderboardManager(), concurrency=2)
+    asyncio.run(runner.run_tournament(configs))
+
+def test_spans_nest_from_tournament_to_player_calls(tmp_path):
+    enable_tracing(str(tmp_path / "trace.jsonl"))
+    try:
+        _run_tournament(tmp_path)
+    finally:
+        disable_tracing()
+
+    spans = [json.loads(line) for line in open(tmp_path / "trace.jsonl")]
+    by_id = {s["span_id"]: s for s in spans}
+    names = {s["name"] for s in spans}
+    assert {"tournament", "game", "round", "attacker_call", "record"} <= names
+
+    def parent_name(s):
+        return by_id[s["parent_id"]]["name"] if s["parent_id"] else None
+
+    assert all(parent_name(s) == "tournament" for s in spans if s["name"] == "game")
+    assert all(parent_name(s) == "game" for s in spans if s["name"] == "round")
+    assert all(parent_name(s) == "round" for s in spans if s["name"] in ("attacker_call", "holder_call"))
+    assert {s["attributes"]["word"] for s in spans if s["name"] == "game"} == {"CART", "DOVE"}
+
+def test_chrome_trace_and_disabled_spans(tmp_path):
+    assert span("idle").__enter__() is span("other")  # Shared no-op while disabled
+
+    enable_tracing(str(tmp_path / "trace.json"))
+    try:
+        _run_tournament(tmp_path)
+    finally:
+        disable_tracing()
+
+    events = json.load(open(tmp_path / "trace.json"))
+    games = [e for e in events if e["name"] == "game"]
+    assert len(games) == 2
+    assert games[0]["tid"] != games[1]["tid"]  # One row per game
+    assert all(e["ph"] == "X" and e["dur"] >= 0 for e in events)
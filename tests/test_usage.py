@@ -0,0 +1,62 @@
+import asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from contacteval.game.engine import GameEngine
+from contacteval.game.models import GameConfig, TokenUsage
+from contacteval.players.adapters import AnthropicPlayer, GeminiPlayer, OllamaPlayer, OpenAIPlayer
+from contacteval.storage.sqlite_store import SqliteStorage
+from contacteval.telemetry.usage import ModelPrice, PriceTable, usage_by_model, usage_by_round_number
+from contacteval.words.bank import Dictionary
+
+def test_provider_usage_blocks():
+    openai = OpenAIPlayer("o", api_key="k")._parse_usage(
+        {"usage": {"prompt_tokens": 100, "completion_tokens": 20, "prompt_tokens_details": {"cached_tokens": 64}}}
+    )
+    assert (openai.input_tokens, openai.output_tokens, openai.cached_input_tokens) == (100, 20, 64)
+    anthropic = AnthropicPlayer("a", api_key="k")._parse_usage(
+        {"usage": {"input_tokens": 10, "output_tokens": 5, "cache_read_input_tokens": 90}}
+    )
+    assert (anthropic.input_tokens, anthropic.cached_input_tokens) == (100, 90)
+    gemini = GeminiPlayer("g", api_key="k")._parse_usage({"usageMetadata": {"promptTokenCount": 7, "candidatesTokenCount": 3}})
+    assert (gemini.input_tokens, gemini.output_tokens) == (7, 3)
+    assert OpenAIPlayer("o", api_key="k")._parse_usage({}) == TokenUsage()
+
+def test_price_table_cost():
+    price = ModelPrice(input=2.0, output=10.0, cached_input=0.5)
+    usage = TokenUsage(input_tokens=1_000_000, cached_input_tokens=500_000, output_tokens=100_000)
+    assert PriceTable.cost(price, usage) == 1.0 + 0.25 + 1.0
+    assert PriceTable({"gpt-4o": price}).lookup("My GPT", "gpt-4o") is price
+
+def test_usage_is_attached_to_rounds_and_games(tmp_path):
+    async def handler(request):
+        return web.json_response({
+            "message": {"content": '{"prefix_word": "APPLE"}'},
+            "prompt_eval_count": 120,
+            "eval_count": 8
+        })
+
+    async def main():
+        app = web.Application()
+        app.router.add_post("/api/chat", handler)
+        server = TestServer(app)
+        await server.start_server()
+        port = server.port
+        try:
+            players = [OllamaPlayer(pid, base_url=f"http://127.0.0.1:{port}") for pid in ["H", "A", "B", "C"]]
+            config = GameConfig(word="APPLE", holder_id="H", attacker_ids=["A", "B", "C"], dictionary_id="test")
+            return await GameEngine(Dictionary(["APPLE"])).run_game(config, players[0], players[1:])
+        finally:
+            await server.close()
+
+    result = asyncio.run(main())
+    assert set(result.rounds[0].usage) == {"A", "B", "C"}
+    assert result.usage["A"].calls == 1 and result.usage["A"].input_tokens == 120
+    assert usage_by_model([result])["B"].output_tokens == 8
+    assert usage_by_round_number([result])[1].calls == 3
+
+    storage = SqliteStorage(str(tmp_path))
+    storage.save_game(result)
+    assert storage.load_all_games() == [result]
+    summary = next(storage.iter_games(include_rounds=False))
+    assert summary.usage == result.usage
+    storage.close()
@@ -0,0 +1,80 @@
+from collections import Counter
+from contacteval.ranking.system import MIN_DIFFICULTY_OBSERVATIONS, DifficultyCalibrator
+from contacteval.words.bank import Dictionary
+from contacteval.words.sampler import WordSampler
+
+WORDS = [
+    "CAT", "CAR", "CART", "CARD", "CARE", "CARGO", "DOG", "DOT", "DOVE", "DOZEN",
+    "EMU", "ELK", "EAGLE", "EARTH", "ZEBRA", "ZONE", "ZERO", "ZEST", "QUIZ", "QUILT"
+]
+
+def _calibrate(calibrator, word, games, residual=0.0):
+    for _ in range(games):
+        calibrator.add_observation(word, "holder", -residual)
+        for _ in range(3):
+            calibrator.add_observation(word, "attacker", residual)
+
+def test_features_use_prefix_branching():
+    sampler = WordSampler(Dictionary(WORDS), DifficultyCalibrator(), seed=0)
+    # "C" has 6 words, "CA" 6, "CAR" 5
+    assert sampler.features["CARGO"].length == 5
+    assert round(sampler.features["CARGO"].branching, 3) == round((6 * 6 * 5 * 1) ** 0.25, 3)
+    assert sampler.features["QUIZ"].branching < sampler.features["CARD"].branching
+
+def test_under_observed_words_are_topped_up():
+    calibrator = DifficultyCalibrator()
+    _calibrate(calibrator, "ZEBRA", 7)
+    _calibrate(calibrator, "DOG", 2)
+    _calibrate(calibrator, "EMU", MIN_DIFFICULTY_OBSERVATIONS)  # Already calibrated
+    sampler = WordSampler(Dictionary(WORDS), calibrator, seed=0)
+    assert sampler.observations("ZEBRA") == 7
+
+    picked = sampler.sample(4)
+    assert picked[:2] == ["ZEBRA", "DOG"]  # Closest to calibration first
+    assert len(picked) == 4
+
+def test_draws_cover_difficulty_bands_evenly():
+    calibrator = DifficultyCalibrator()
+    for i, word in enumerate(WORDS):
+        _calibrate(calibrator, word, MIN_DIFFICULTY_OBSERVATIONS, residual=i)
+    sampler = WordSampler(Dictionary(WORDS), calibrator, bands=4, seed=0)
+    bands = sampler.difficulty_bands()
+    assert [len(b) for b in bands] == [5, 5, 5, 5]
+    assert bands[0] == WORDS[:5]  # Lowest attacker difficulty: hardest for attackers
+
+    band_of = {w: i for i, band in enumerate(bands) for w in band}
+    counts = Counter(band_of[w] for w in sampler.sample(20))
+    assert counts == {0: 5, 1: 5, 2: 5, 3: 5}
+
+def test_uncalibrated_words_borrow_their_strata_difficulty():
+    calibrator = DifficultyCalibrator()
+    _calibrate(calibrator, "CART", MIN_DIFFICULTY_OBSERVATIONS, residual=2.0)
+    sampler = WordSampler(Dictionary(WORDS), calibrator, seed=0)
+    # Same length and prefix counts as CART
+    assert sampler.difficulty("CARD") == 2.0
+    assert sampler.difficulty("DOVE") == 0.0  # No calibrated word in its stratum
+
+def test_random_strategy_samples_without_replacement():
+    sampler = WordSampler(Dictionary(WORDS), DifficultyCalibrator(), strategy="random", seed=0)
+    picked = sampler.sample(10)
+    assert len(set(picked)) == 10
+
+def test_top_up_ignores_words_outside_the_dictionary():
+    calibrator = DifficultyCalibrator()
+    _calibrate(calibrator, "MANGO", 7)  # Calibrated on another dictionary
+    _calibrate(calibrator, "DOG", 2)
+    sampler = WordSampler(Dictionary(WORDS), calibrator, seed=0)
+    picked = sampler.sample(4)
+    assert picked[0] == "DOG"
+    assert "MANGO" not in picked
+
+def test_bands_are_recomputed_only_after_calibration_changes():
+    calibrator = DifficultyCalibrator()
+    sampler = WordSampler(Dictionary(WORDS), calibrator, seed=0)
+    bands = sampler.difficulty_bands()
+    assert sampler.difficulty_bands() is bands
+
+    _calibrate(calibrator, "QUIZ", MIN_DIFFICULTY_OBSERVATIONS, residual=-5)
+    reranked = sampler.difficulty_bands()
+    assert reranked is not bands
+    assert "QUIZ" in reranked[0] and "QUIZ" not in bands[0]